@@ -0,0 +1,230 @@
+import numpy as np
+
+def gregorian_new_year(years):
+    """Return the ordinal dates of January 1 for an array of Gregorian years."""
+    y = np.asarray(years, dtype=np.int64) - 1
+    return 365 * y + y // 4 - y // 100 + y // 400 + 1
+
+def gregorian_toordinal(years, months, days):
+    """Return the ordinal dates for arrays of Gregorian years, months and days."""
+    years = np.asarray(years, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+    leap = (years % 4 == 0) & ~np.isin(years % 400, (100, 200, 300))
+    correction = np.where(months <= 2, 0, np.where(leap, -1, -2))
+    return gregorian_new_year(years) - 1 + (367 * months - 362) // 12 + correction + days
+
+def gregorian_year(ordinals):
+    """Return the Gregorian years of an array of ordinal dates."""
+    d0 = np.asarray(ordinals, dtype=np.int64) - 1
+    n400 = d0 // 146097
+    d1 = d0 % 146097
+    n100 = d1 // 36524
+    d2 = d1 % 36524
+    n4 = d2 // 1461
+    d3 = d2 % 1461
+    n1 = d3 // 365
+    year = 400 * n400 + 100 * n100 + 4 * n4 + n1
+    return np.where((n100 == 4) | (n1 == 4), year, year + 1)
+
+# The Old Hindu (Arya Siddhanta) calendars in integer arithmetic.  Each
+# mean period is ARYA_DAYS days divided by its number of revolutions in
+# 4,320,000 years, and moments are counted in quarter days from the epoch,
+# so the results are exact, as those of OldHinduSolarDate and
+# OldHinduLunarDate.
+OLD_HINDU_EPOCH = -1132959
+ARYA_DAYS = 1577917500
+ARYA_SOLAR_MONTHS = 51840000
+ARYA_LUNAR_MONTHS = 53433336
+ARYA_LUNAR_DAYS = 30 * ARYA_LUNAR_MONTHS
+ARYA_JOVIAN_SIGNS = 12 * 364224
+
+def _ceil_divide(x, y):
+    return -(-x // y)
+
+def old_hindu_day_count(ordinals):
+    """Return the elapsed days (Ahargana) since the Hindu epoch (KY) for an
+    array of ordinal dates."""
+    return np.asarray(ordinals, dtype=np.int64) - OLD_HINDU_EPOCH
+
+def old_hindu_jovian_year(ordinals):
+    """Return the years of the Jupiter cycle for an array of ordinal dates."""
+    signs = old_hindu_day_count(ordinals) * ARYA_JOVIAN_SIGNS // ARYA_DAYS
+    return (signs + 26) % 60 + 1
+
+def old_hindu_solar_fromordinal(ordinals):
+    """Return the Old Hindu solar years, months and days for an array of
+    ordinal dates."""
+    sun = 4 * old_hindu_day_count(ordinals) + 1
+    months = sun * ARYA_SOLAR_MONTHS
+    return (sun * (ARYA_SOLAR_MONTHS // 12) // (4 * ARYA_DAYS),
+            months // (4 * ARYA_DAYS) % 12 + 1,
+            months % (4 * ARYA_DAYS) // (4 * ARYA_SOLAR_MONTHS) + 1)
+
+def old_hindu_solar_toordinal(years, months, days):
+    """Return the ordinal dates for arrays of Old Hindu solar years, months
+    and days."""
+    years = np.asarray(years, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+    days = np.asarray(days, dtype=np.int64)
+    sun = 4 * ARYA_DAYS * (12 * years + months - 1) - 5 * ARYA_SOLAR_MONTHS
+    return OLD_HINDU_EPOCH + days + _ceil_divide(sun, 4 * ARYA_SOLAR_MONTHS)
+
+def old_hindu_lunar_fromordinal(ordinals):
+    """Return the Old Hindu lunar years, months, leap months and days for
+    an array of ordinal dates."""
+    sun = 4 * old_hindu_day_count(ordinals) + 1
+    # The lunar months elapsed at the new moon, and the part of a solar
+    # month elapsed then, in units of ARYA_DAYS / (ARYA_SOLAR_MONTHS * ARYA_LUNAR_MONTHS).
+    lunations = sun * ARYA_LUNAR_MONTHS // (4 * ARYA_DAYS)
+    solar_part = lunations * ARYA_SOLAR_MONTHS % ARYA_LUNAR_MONTHS
+    leaps = (solar_part > 0) & (solar_part <= ARYA_LUNAR_MONTHS - ARYA_SOLAR_MONTHS)
+    months = _ceil_divide(lunations * ARYA_SOLAR_MONTHS, ARYA_LUNAR_MONTHS) % 12 + 1
+    days = sun * ARYA_LUNAR_DAYS // (4 * ARYA_DAYS) % 30 + 1
+    years = _ceil_divide(lunations * ARYA_SOLAR_MONTHS + ARYA_LUNAR_MONTHS, 12 * ARYA_LUNAR_MONTHS) - 1
+    return years, months, leaps, days
+
+def old_hindu_lunar_toordinal(years, months, leaps, days):
+    """Return the ordinal dates for arrays of Old Hindu lunar years, months,
+    leap months and days."""
+    years = np.asarray(years, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+    days = np.asarray(days, dtype=np.int64)
+    mina = 12 * years - 1
+    new_year = mina * ARYA_LUNAR_MONTHS // ARYA_SOLAR_MONTHS + 1
+    first = _ceil_divide(new_year * ARYA_SOLAR_MONTHS - mina * ARYA_LUNAR_MONTHS, ARYA_LUNAR_MONTHS - ARYA_SOLAR_MONTHS)
+    elapsed = np.where(~np.asarray(leaps, dtype=bool) & (first <= months), months, months - 1)
+    lunar_days = 30 * (new_year + elapsed) + days - 1
+    return OLD_HINDU_EPOCH + _ceil_divide(4 * ARYA_DAYS * lunar_days - ARYA_LUNAR_DAYS, 4 * ARYA_LUNAR_DAYS)
+
+HEBREW_EPOCH = -1373427
+
+def _hebrew_elapsed_days(years):
+    months = (235 * years - 234) // 19
+    days = 29 * months + (12084 + 13753 * months) // 25920
+    return np.where((3 * (days + 1)) % 7 < 3, days + 1, days)
+
+def _hebrew_new_year(ny0, ny1, ny2):
+    return HEBREW_EPOCH + ny1 + np.where(ny2 - ny1 == 356, 2, np.where(ny1 - ny0 == 382, 1, 0))
+
+def hebrew_new_year(years):
+    """Return the ordinal dates of Tishri 1 for an array of Hebrew years."""
+    years = np.asarray(years, dtype=np.int64)
+    return _hebrew_new_year(*(_hebrew_elapsed_days(years + i) for i in (-1, 0, 1)))
+
+def hebrew_year_length(years):
+    """Return the number of days in each of an array of Hebrew years."""
+    years = np.asarray(years, dtype=np.int64)
+    ny0, ny1, ny2, ny3 = (_hebrew_elapsed_days(years + i) for i in (-1, 0, 1, 2))
+    return _hebrew_new_year(ny1, ny2, ny3) - _hebrew_new_year(ny0, ny1, ny2)
+
+def hebrew_is_leap_year(years):
+    """Return whether each of an array of Hebrew years is a leap year."""
+    return (7 * np.asarray(years, dtype=np.int64) + 1) % 19 < 7
+
+def hebrew_month_offsets(years):
+    """Return the days from the new year to the first of each month, by
+    month number, for an array of Hebrew years, as an array with a row
+    for each year."""
+    years = np.asarray(years, dtype=np.int64)
+    length = hebrew_year_length(years)
+    leap = hebrew_is_leap_year(years)
+    # The lengths of Tishri to Adar II, then of Nisan to Elul.
+    lengths = np.empty(years.shape + (13,), dtype=np.int64)
+    lengths[...] = [30, 29, 30, 29, 30, 29, 29, 30, 29, 30, 29, 30, 29]
+    lengths[..., 1] = np.where(np.isin(length, (355, 385)), 30, 29)
+    lengths[..., 2] = np.where(np.isin(length, (353, 383)), 29, 30)
+    lengths[..., 5] = np.where(leap, 30, 29)
+    lengths[..., 6] = np.where(leap, 29, 0)
+    starts = np.cumsum(lengths, axis=-1) - lengths
+    return np.concatenate([starts[..., 7:], starts[..., :7]], axis=-1)
+
+def hebrew_toordinal(years, months, days):
+    """Return the ordinal dates for arrays of Hebrew years, months and days."""
+    years, months, days = np.broadcast_arrays(*(np.asarray(a, dtype=np.int64) for a in (years, months, days)))
+    offsets = hebrew_month_offsets(years)
+    return hebrew_new_year(years) + np.take_along_axis(offsets, (months - 1)[..., np.newaxis], axis=-1)[..., 0] + days - 1
+
+def hebrew_fromordinal(ordinals):
+    """Return the Hebrew years, months and days for an array of ordinal
+    dates.  The new years of the years spanned are tabulated once and
+    bisected, then the months of each year."""
+    ordinals = np.asarray(ordinals, dtype=np.int64)
+    approx = (ordinals - HEBREW_EPOCH) * 98496 // 35975351 + 1
+    years = np.arange(approx.min() - 1, approx.max() + 2) if approx.size else np.arange(0)
+    new_years = hebrew_new_year(years)
+    index = np.searchsorted(new_years, ordinals, side='right') - 1
+    offsets = hebrew_month_offsets(years)
+    # The offsets of the months in the order of the year, from Tishri; in
+    # a common year Adar II starts with Nisan, so is never chosen.
+    ordered = np.concatenate([offsets[:, 6:], offsets[:, :6]], axis=1)[index]
+    day_of_year = ordinals - new_years[index]
+    i = (ordered <= day_of_year[..., np.newaxis]).sum(axis=-1) - 1
+    months = (i + 6) % 13 + 1
+    return years[index], months, day_of_year - np.take_along_axis(ordered, i[..., np.newaxis], axis=-1)[..., 0] + 1
+
+def _hebrew_years(years):
+    # The new years, lengths, leap flags and month offsets of an array of
+    # Hebrew years, computed once for each distinct year.
+    unique, inverse = np.unique(np.asarray(years, dtype=np.int64), return_inverse=True)
+    inverse = inverse.reshape(np.shape(years))
+    return (hebrew_new_year(unique)[inverse], hebrew_year_length(unique)[inverse],
+            hebrew_is_leap_year(unique)[inverse], hebrew_month_offsets(unique)[inverse])
+
+def _hebrew_date(table, months, days):
+    new_year, _, _, offsets = table
+    return new_year + np.take_along_axis(offsets, (months - 1)[..., np.newaxis], axis=-1)[..., 0] + days - 1
+
+def hebrew_birthday(years, months, days, target_years):
+    """Return the ordinal dates of the anniversaries in Hebrew years,
+    target_years, of arrays of Hebrew birth dates, as HebrewDate.birthday."""
+    years, months, days, target_years = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.int64) for a in (years, months, days, target_years)))
+    # A birthday in the last month of the year is kept in the last month.
+    last = np.where(hebrew_is_leap_year(years), 13, 12) == months
+    target = _hebrew_years(target_years)
+    return _hebrew_date(target, np.where(last, np.where(target[2], 13, 12), months), days)
+
+def hebrew_yahrzeit(years, months, days, target_years):
+    """Return the ordinal dates of the anniversaries in Hebrew years,
+    target_years, of arrays of Hebrew death dates, as HebrewDate.yahrzeit."""
+    years, months, days, target_years = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.int64) for a in (years, months, days, target_years)))
+    following_length = _hebrew_years(years + 1)[1]
+    target = _hebrew_years(target_years)
+    leap = target[2]
+    # Marheshvan 30 without a long Marheshvan the year after, and Kislev 30
+    # with a short Kislev then, fall on the day before the next month.
+    short_marheshvan = (months == 8) & (days == 30) & ~np.isin(following_length, (355, 385))
+    short_kislev = (months == 9) & (days == 30) & np.isin(following_length, (353, 383))
+    month = np.where(short_marheshvan, 9, np.where(short_kislev, 10, months))
+    day = np.where(short_marheshvan | short_kislev, 0, days)
+    # Adar II is kept in the last month, and Adar 30 in a common year
+    # becomes Shevat 30.
+    month = np.where(months == 13, np.where(leap, 13, 12), month)
+    adar30 = ~short_marheshvan & ~short_kislev & (months == 12) & (days == 30) & ~leap
+    month = np.where(adar30, 11, month)
+    return _hebrew_date(target, month, day)
+
+def _in_gregorian(anniversary, years, months, days, gregorian_years):
+    gregorian_years = np.asarray(gregorian_years, dtype=np.int64)
+    jan1 = gregorian_new_year(gregorian_years)
+    first = hebrew_fromordinal(jan1)[0]
+    dates = np.stack([anniversary(years, months, days, first), anniversary(years, months, days, first + 1)], axis=-1)
+    inside = (dates >= jan1[..., np.newaxis]) & (dates < gregorian_new_year(gregorian_years + 1)[..., np.newaxis])
+    return dates, inside
+
+def hebrew_birthday_in_gregorian(years, months, days, gregorian_years):
+    """Return the ordinal dates of the anniversaries of arrays of Hebrew
+    birth dates in the Hebrew year current on January 1 of each Gregorian
+    year, gregorian_years, and the one after, with a final axis of two,
+    and whether each falls within its Gregorian year, as
+    HebrewDate.birthday_in_gregorian."""
+    return _in_gregorian(hebrew_birthday, years, months, days, gregorian_years)
+
+def hebrew_yahrzeit_in_gregorian(years, months, days, gregorian_years):
+    """Return the ordinal dates of the anniversaries of arrays of Hebrew
+    death dates in the Hebrew year current on January 1 of each Gregorian
+    year, gregorian_years, and the one after, with a final axis of two,
+    and whether each falls within its Gregorian year, as
+    HebrewDate.yahrzeit_in_gregorian."""
+    return _in_gregorian(hebrew_yahrzeit, years, months, days, gregorian_years)
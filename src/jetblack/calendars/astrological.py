@@ -5,6 +5,8 @@ from jetblack.calendars.timemath import Clock
 from jetblack.calendars.systems.gregorian import GregorianDate
 from jetblack.calendars.utils import poly, signum
 from jetblack.calendars.trigonometry import angle, sin_degrees, cos_degrees, tan_degrees, arcsin_degrees, arctan_degrees, secs
+from jetblack.calendars.trigonometry import trig_backend, FLOAT_BACKEND
+from jetblack.calendars.jit import jit
 
 J2000 = Clock.days_from_hours(mpf(12)) + GregorianDate.new_year(2000)
 
@@ -111,9 +113,18 @@ def sidereal_from_moment(tee):
     c = (tee - J2000) / mpf(36525)
     return poly(c, [mpf(280.46061837), mpf(36525) * mpf(360.98564736629), mpf(0.000387933), mpf(-1)/mpf(38710000)]) % 360
 
+@jit
+def nutation_kernel(c):
+    """Return the longitudinal nutation at Julian centuries c (float)."""
+    cap_A = 124.90 + c * (-1934.134 + c * 0.002063)
+    cap_B = 201.11 + c * (72001.5377 + c * 0.00057)
+    return -0.004778 * math.sin(math.radians(cap_A)) - 0.0003667 * math.sin(math.radians(cap_B))
+
 def nutation(tee):
     """Return the longitudinal nutation at moment, tee."""
     c = julian_centuries(tee)
+    if trig_backend() is FLOAT_BACKEND:
+        return nutation_kernel(float(c))
     cap_A = poly(c, [mpf(124.90), mpf(-1934.134), mpf(0.002063)])
     cap_B = poly(c, [mpf(201.11), mpf(72001.5377), mpf(0.00057)])
     return (mpf(-0.004778)  * sin_degrees(cap_A) + 
@@ -0,0 +1,219 @@
+import numpy as np
+from jetblack.calendars.utils import invert_angular
+
+# Finding the moments at which a function of time crosses a value.
+
+def illinois(g, lo, hi, g_lo, g_hi, prec=10 ** -5, max_iterations=100):
+    """Return the root of g within [lo, hi], where g_lo = g(lo) and
+    g_hi = g(hi) have opposite signs, by the Illinois variant of regula
+    falsi.  Stops when the bracket is narrower than prec."""
+    x, side = lo, 0
+    for _ in range(max_iterations):
+        x = (lo * g_hi - hi * g_lo) / (g_hi - g_lo)
+        g_x = g(x)
+        if g_x == 0:
+            return x
+        if (g_x < 0) == (g_lo < 0):
+            lo, g_lo = x, g_x
+            if side == -1:
+                g_hi /= 2
+            side = -1
+        else:
+            hi, g_hi = x, g_x
+            if side == 1:
+                g_lo /= 2
+            side = 1
+        if hi - lo <= prec:
+            break
+    return x
+
+def illinois_array(g, lo, hi, g_lo, g_hi, prec=10 ** -5, max_iterations=100):
+    """Return the roots of the vectorized function g within the arrays of
+    brackets [lo, hi], as illinois, or NaN where g(lo) and g(hi) have the
+    same sign."""
+    lo, hi = np.array(lo, dtype=float), np.array(hi, dtype=float)
+    g_lo, g_hi = np.array(g_lo, dtype=float), np.array(g_hi, dtype=float)
+    x, side = np.where(g_hi == 0, hi, lo), np.zeros(lo.shape, dtype=int)
+    x[((g_lo < 0) == (g_hi < 0)) & (g_lo != 0) & (g_hi != 0)] = np.nan
+    active = (g_lo != 0) & (g_hi != 0) & ~np.isnan(x) & (hi - lo > prec)
+    for _ in range(max_iterations):
+        if not active.any():
+            break
+        x = np.where(active, (lo * g_hi - hi * g_lo) / np.where(active, g_hi - g_lo, 1), x)
+        g_x = np.where(active, g(x), 0)
+        left = active & ((g_x < 0) == (g_lo < 0)) & (g_x != 0)
+        right = active & ~left & (g_x != 0)
+        g_hi = np.where(left & (side == -1), g_hi / 2, g_hi)
+        g_lo = np.where(right & (side == 1), g_lo / 2, g_lo)
+        lo, g_lo = np.where(left, x, lo), np.where(left, g_x, g_lo)
+        hi, g_hi = np.where(right, x, hi), np.where(right, g_x, g_hi)
+        side = np.where(left, -1, np.where(right, 1, side))
+        active = left | right
+        active &= hi - lo > prec
+    return x
+
+class CrossingFinder(object):
+    """Find the moments at which a function of time, f, crosses a value.
+
+    An angular function (in degrees) is taken to increase at about rate
+    degrees a day, with each crossing within window days of the moment
+    predicted from that rate.  Any other function is scanned in steps of
+    |f - y| / rate + step days, so rate should bound the magnitude of its
+    derivative; only crossings in the given direction (1 rising, -1
+    falling, 0 either) are found.  Angular crossings are solved by the
+    secant method from the mean rate, falling back to the Illinois method
+    on the bracket, as are the brackets found by scanning, to within prec
+    days.  If vectorized, f takes and returns numpy
+    arrays and crossings samples the whole interval at once.  The number
+    of values of f computed is counted in evaluations."""
+
+    def __init__(self, f, rate, angular=False, window=None, step=None, direction=1,
+                 prec=10 ** -5, vectorized=False):
+        self.f = f
+        self.rate = rate
+        self.angular = angular
+        self.window = window
+        self.step = step
+        self.direction = direction
+        self.prec = prec
+        self.vectorized = vectorized
+        self.evaluations = 0
+
+    def _value(self, x):
+        if self.vectorized:
+            value = self.f(np.asarray(x, dtype=float))
+        else:
+            value = self.f(x)
+        self.evaluations += np.size(x)
+        return value
+
+    def residual(self, x, y):
+        """Return f(x) - y, reduced to [-180, 180) for an angular function."""
+        value = self._value(x) - y
+        return (value + 180) % 360 - 180 if self.angular else value
+
+    def _refine(self, y, lo, hi, g_lo, g_hi):
+        g = lambda x: self.residual(x, y)
+        if self.vectorized:
+            return float(illinois_array(g, [lo], [hi], [g_lo], [g_hi], self.prec)[0])
+        return illinois(g, lo, hi, g_lo, g_hi, self.prec)
+
+    def _secant(self, y, x0, g0, lo, hi, max_iterations=10):
+        # Secant steps from x0, where the residual is g0, starting at the
+        # mean rate; None if they leave [lo, hi] or fail to converge.
+        x1 = x0 - g0 / self.rate
+        for _ in range(max_iterations):
+            if not lo <= x1 <= hi:
+                return None
+            g1 = self.residual(x1, y)
+            if g1 == 0 or g1 == g0:
+                return x1
+            x0, x1, g0 = x1, x1 - g1 * (x1 - x0) / (g1 - g0), g1
+            if abs(x1 - x0) <= self.prec:
+                return x1 if lo <= x1 <= hi else None
+        return None
+
+    def _bracket(self, y, lo, hi, x0, g0):
+        x = self._secant(y, x0, g0, lo, hi)
+        if x is not None:
+            return x
+        g_lo, g_hi = self.residual(lo, y), self.residual(hi, y)
+        if g_lo == 0:
+            return lo
+        if g_lo < 0 <= g_hi < g_lo + 180:
+            return self._refine(y, lo, hi, g_lo, g_hi)
+        return invert_angular(lambda x: self._value(x), y, lo, hi, self.prec)
+
+    def _is_crossing(self, g0, g1):
+        return ((self.direction >= 0 and g0 < 0 <= g1) or
+                (self.direction <= 0 and g0 > 0 >= g1))
+
+    def _scan(self, y, a, b, sign):
+        x, g = a, self.residual(a, y)
+        if g == 0:
+            return x
+        while sign * (b - x) > 0:
+            x1 = x + sign * (abs(g) / self.rate + self.step)
+            x1 = b if sign * (x1 - b) > 0 else x1
+            g1 = self.residual(x1, y)
+            if self._is_crossing(g, g1) if sign > 0 else self._is_crossing(g1, g):
+                return self._refine(y, x, x1, g, g1) if sign > 0 else self._refine(y, x1, x, g1, g)
+            x, g = x1, g1
+        return None
+
+    def first(self, y, a, b=None):
+        """Return the first moment at or after a (and at or before b) when
+        f crosses y, or None if there is none.  An angular function needs
+        no b."""
+        if not self.angular:
+            return self._scan(y, a, b, 1)
+        distance = (y - self._value(a)) % 360
+        tau = a + distance / self.rate
+        if b is not None and b < tau - self.window:
+            return None
+        x = self._bracket(y, max(a, tau - self.window), tau + self.window, a, -distance)
+        return x if b is None or x <= b else None
+
+    def last(self, y, b, a=None):
+        """Return the last moment at or before b (and at or after a) when
+        f crosses y, or None if there is none.  An angular function needs
+        no a."""
+        if not self.angular:
+            return self._scan(y, b, a, -1)
+        distance = (self._value(b) - y) % 360
+        tau = b - distance / self.rate
+        if a is not None and tau + self.window < a:
+            return None
+        x = self._bracket(y, tau - self.window, min(b, tau + self.window), b, distance)
+        return x if a is None or a <= x else None
+
+    def first_array(self, y, a):
+        """Return the first moments at or after each of an array of moments,
+        a, when a vectorized angular f crosses each of an array of values,
+        y, solved together.  A bracket which does not hold the crossing is
+        widened, up to a quarter of a revolution either side of the
+        predicted moment, and its moment is NaN if it still does not."""
+        a, y = (np.array(v, dtype=float) for v in np.broadcast_arrays(a, y))
+        tau = a + ((y - self._value(a)) % 360) / self.rate
+        window, limit = np.full(a.shape, float(self.window)), 90 / self.rate
+        lo, hi = np.maximum(a, tau - window), tau + window
+        g_lo, g_hi = self.residual(lo, y), self.residual(hi, y)
+        held = (g_lo == 0) | ((g_lo < 0) & (0 <= g_hi) & (g_hi < g_lo + 180))
+        widen = ~held & (window < limit)
+        while widen.any():
+            window[widen] = np.minimum(2 * window[widen], limit)
+            lo[widen], hi[widen] = np.maximum(a[widen], tau[widen] - window[widen]), tau[widen] + window[widen]
+            g_lo[widen], g_hi[widen] = self.residual(lo[widen], y[widen]), self.residual(hi[widen], y[widen])
+            held = (g_lo == 0) | ((g_lo < 0) & (0 <= g_hi) & (g_hi < g_lo + 180))
+            widen = ~held & (window < limit)
+        g = lambda x: self.residual(x, y)
+        x = illinois_array(g, lo, hi, g_lo, g_hi, self.prec)
+        x[~held] = np.nan
+        return x
+
+    def crossings(self, y, a, b):
+        """Return every moment in [a, b] when f crosses y, in order."""
+        if self.vectorized:
+            return self._crossings_array(y, a, b)
+        found = []
+        x = self.first(y, a, b)
+        while x is not None:
+            found.append(x)
+            x = self.first(y, x + self.prec, b)
+        return found
+
+    def _crossings_array(self, y, a, b):
+        step = self.window if self.angular else self.step
+        grid = np.linspace(a, b, max(2, int(np.ceil((b - a) / step)) + 1))
+        g = self.residual(grid, y)
+        g0, g1 = g[:-1], g[1:]
+        rising = (g0 < 0) & (0 <= g1)
+        if self.angular:
+            rising &= g1 < g0 + 180
+            falling = np.zeros_like(rising)
+        else:
+            falling = (g0 > 0) & (0 >= g1)
+            rising &= self.direction >= 0
+            falling &= self.direction <= 0
+        i = np.flatnonzero(rising | falling)
+        return illinois_array(lambda x: self.residual(x, y), grid[i], grid[i + 1], g0[i], g1[i], self.prec)
@@ -0,0 +1,130 @@
+from collections import namedtuple
+from jetblack.calendars.weekdays import DayOfWeek, weekday_fromordinal, before_weekday
+from jetblack.calendars.systems.gregorian import GregorianDate
+from jetblack.calendars.systems.coptic import CopticDate
+from jetblack.calendars.systems.hebrew import HebrewDate, HebrewMonth
+
+# Jewish holidays resolved against the record of each Hebrew year, which is
+# built once, with the second festival days kept outside Israel (the
+# diaspora) and the fasts postponed from the Sabbath.
+
+Holiday = namedtuple('Holiday', ['date', 'name'])
+
+# The festivals on a fixed day of a month, as (name, month, day), and those
+# kept only in the diaspora.
+FIXED = (
+    ('rosh_hashanah', HebrewMonth.TISHRI, 1),
+    ('rosh_hashanah_ii', HebrewMonth.TISHRI, 2),
+    ('yom_kippur', HebrewMonth.TISHRI, 10),
+    ('sukkot', HebrewMonth.TISHRI, 15),
+    ('hoshana_rabbah', HebrewMonth.TISHRI, 21),
+    ('shemini_atzeret', HebrewMonth.TISHRI, 22),
+    ('hanukkah', HebrewMonth.KISLEV, 25),
+    ('tu_bishvat', HebrewMonth.SHEVAT, 15),
+    ('passover', HebrewMonth.NISAN, 15),
+    ('passover_vii', HebrewMonth.NISAN, 21),
+    ('lag_ba_omer', HebrewMonth.IYYAR, 18),
+    ('shavuot', HebrewMonth.SIVAN, 6))
+DIASPORA = (
+    ('sukkot_ii', HebrewMonth.TISHRI, 16),
+    ('passover_ii', HebrewMonth.NISAN, 16),
+    ('passover_viii', HebrewMonth.NISAN, 22),
+    ('shavuot_ii', HebrewMonth.SIVAN, 7))
+# The fasts which are postponed to Sunday when they fall on the Sabbath.
+FASTS = (
+    ('tzom_gedaliah', HebrewMonth.TISHRI, 3),
+    ('tzom_tevet', HebrewMonth.TEVET, 10),
+    ('tzom_tammuz', HebrewMonth.TAMMUZ, 17),
+    ('tishah_be_av', HebrewMonth.AV, 9))
+
+class HebrewHolidayYear(object):
+    """The holidays of the Hebrew year, year, in Israel or, if diaspora
+    is True, outside it."""
+
+    def __init__(self, year, diaspora=False):
+        self.year = year
+        self.diaspora = diaspora
+        self.record = HebrewDate.year_record(year)
+        self.last_month = HebrewMonth.ADARII if self.record.leap else HebrewMonth.ADAR
+
+    def date(self, month, day):
+        """Return the ordinal date of day, day, of month, month, in this year."""
+        return self.record.new_year + self.record.month_offsets[month - 1] + day - 1
+
+    def purim(self):
+        """Return the ordinal date of Purim, in the last month of the year."""
+        return self.date(self.last_month, 14)
+
+    def ta_anit_esther(self):
+        """Return the ordinal date of Ta'anit Esther, brought forward to the
+        Thursday when Purim is on Sunday."""
+        purim = self.purim()
+        return purim - (3 if weekday_fromordinal(purim) == DayOfWeek.SUNDAY else 1)
+
+    def yom_ha_zikkaron(self):
+        """Return the ordinal date of Yom ha-Zikkaron, moved from Iyyar 4 to
+        keep it and Yom ha-Atzmaut from the Sabbath."""
+        iyyar4 = self.date(HebrewMonth.IYYAR, 4)
+        if weekday_fromordinal(iyyar4) in (DayOfWeek.THURSDAY, DayOfWeek.FRIDAY):
+            return before_weekday(iyyar4, DayOfWeek.WEDNESDAY)
+        elif weekday_fromordinal(iyyar4) == DayOfWeek.SUNDAY:
+            return iyyar4 + 1
+        else:
+            return iyyar4
+
+    def omer(self, ordinal):
+        """Return the number of elapsed weeks and days in the omer at
+        ordinal date, ordinal, or None outside it."""
+        c = ordinal - self.date(HebrewMonth.NISAN, 15)
+        return (c // 7, c % 7) if 1 <= c <= 49 else None
+
+    def holidays(self):
+        """Return the Holidays of the year in order of date."""
+        rules = FIXED + DIASPORA if self.diaspora else FIXED
+        found = [Holiday(self.date(month, day), name) for name, month, day in rules]
+        for name, month, day in FASTS:
+            date = self.date(month, day)
+            found.append(Holiday(date + 1 if weekday_fromordinal(date) == DayOfWeek.SATURDAY else date, name))
+        simchat_torah = self.date(HebrewMonth.TISHRI, 23 if self.diaspora else 22)
+        purim = self.purim()
+        yom_ha_zikkaron = self.yom_ha_zikkaron()
+        found.extend([
+            Holiday(simchat_torah, 'simchat_torah'),
+            Holiday(self.ta_anit_esther(), 'ta_anit_esther'),
+            Holiday(purim, 'purim'),
+            Holiday(purim + 1, 'shushan_purim'),
+            Holiday(yom_ha_zikkaron, 'yom_ha_zikkaron'),
+            Holiday(yom_ha_zikkaron + 1, 'yom_ha_atzmaut')])
+        return sorted(found)
+
+def _gregorian_holidays(g_year):
+    # The holidays reckoned from the Coptic (Julian) solar year.
+    found = [Holiday(date, 'sh_ela') for date in CopticDate.in_gregorian(3, 26, g_year)]
+    found.extend(Holiday(date, 'birkath_ha_hama') for date in CopticDate.in_gregorian(7, 30, g_year)
+                 if CopticDate.fromordinal(date).year % 28 == 17)
+    return found
+
+def holidays(start_year, end_year, diaspora=False):
+    """Yield the Holidays, in order of date, of the Gregorian years
+    start_year to end_year inclusive, in Israel or, if diaspora is True,
+    outside it.  Each Hebrew year is resolved once."""
+    offset = GregorianDate.to_year(HebrewDate.EPOCH)
+    for g_year in range(start_year, end_year + 1):
+        start, end = GregorianDate.year_range(g_year)
+        # The Gregorian year spans the end of one Hebrew year and the start
+        # of the next.
+        found = [holiday for year in (g_year - offset, g_year - offset + 1)
+                 for holiday in HebrewHolidayYear(year, diaspora).holidays()
+                 if start <= holiday.date <= end]
+        found.extend(_gregorian_holidays(g_year))
+        for holiday in sorted(found):
+            yield holiday
+
+def holiday_table(start_year, end_year, diaspora=False):
+    """Return the ordinal dates of the holidays of the Gregorian years
+    start_year to end_year inclusive as a dictionary of holiday names to
+    lists of dates."""
+    table = {}
+    for holiday in holidays(start_year, end_year, diaspora):
+        table.setdefault(holiday.name, []).append(holiday.date)
+    return table
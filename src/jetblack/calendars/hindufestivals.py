@@ -0,0 +1,188 @@
+from bisect import bisect_left
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import math
+import numpy as np
+from jetblack.calendars.timemath import Clock
+from jetblack.calendars.events import illinois_array
+from jetblack.calendars.systems.gregorian import GregorianDate
+from jetblack.calendars.systems.hindu import (
+    OldHindu, HinduLunarDate, hindu_date_occur, hindu_tithi_occur, is_hindu_lunar_on_or_before)
+
+# Hindu lunar festivals resolved against the structure of each lunar year,
+# which is built once: the date of every day, the months (with the leap and
+# expunged months) and the moments at which each tithi and half tithi begins.
+
+# A festival on day, day, of lunar month, month, as hindu_date_occur.
+LunarDateRule = namedtuple('LunarDateRule', ['name', 'month', 'day'])
+# A festival on the tithi, tithi, of lunar month, month, before sundial
+# time, tee, as hindu_tithi_occur.
+TithiRule = namedtuple('TithiRule', ['name', 'month', 'tithi', 'tee'])
+
+DIWALI = LunarDateRule('diwali', 8, 1)
+SHIVA = TithiRule('shiva', 11, 29, Clock.days_from_hours(24))
+RAMA = TithiRule('rama', 1, 9, Clock.days_from_hours(12))
+
+class HinduLunarYear(object):
+    """The days, months and tithi boundaries of the Hindu lunar year, year."""
+
+    def __init__(self, year):
+        self.year = year
+        approx = int(math.floor(OldHindu.EPOCH + HinduLunarDate.SIDEREAL_YEAR * (year + HinduLunarDate.LUNAR_ERA)))
+        # The year begins within about a month before approx, and ends
+        # within a year after it.
+        dates = HinduLunarDate.date_range(approx - 45, approx + 380)
+        first = next(i for i, date in enumerate(dates) if date.year == year)
+        last = max(i for i, date in enumerate(dates) if date.year == year)
+        if first == 0 or last == len(dates) - 1:
+            raise ValueError("Lunar year outside the days searched")
+        self.start = approx - 45 + first
+        self.end = approx - 45 + last
+        self.dates = dates[first:last + 1]
+        self.months = []
+        for i, date in enumerate(self.dates):
+            if not self.months or self.months[-1][:2] != (date.month, date.leap_month):
+                self.months.append((date.month, date.leap_month, self.start + i))
+        self.leap_months = [month for month, leap, _ in self.months if leap]
+        self.expunged_months = [month for month in range(1, 13)
+                                if not any(m == month and not leap for m, leap, _ in self.months)]
+        self._boundaries()
+
+    def _boundaries(self):
+        # The moments at which the lunar phase is a multiple of 6 degrees,
+        # from two days before the year to two days after it, found for all
+        # together from a grid of a quarter of a day.
+        phase = HinduLunarDate.lunar_phase
+        grid = np.arange(self.start - 2, self.end + 3, 0.25)
+        index = np.floor(phase(grid) / 6).astype(int)
+        i = np.flatnonzero(np.diff(index) % 60 != 0)
+        targets = 6.0 * index[i + 1]
+        g = lambda x: (phase(x) - targets + 180) % 360 - 180
+        lo, hi = grid[i], grid[i + 1]
+        self.boundaries = illinois_array(g, lo, hi, g(lo), g(hi))
+        self.half_tithis = (index[i + 1] % 60).tolist()
+        self._moments = self.boundaries.tolist()
+
+    def fromordinal(self, ordinal):
+        """Return the Hindu lunar date of ordinal date, ordinal, in this year."""
+        if not self.start <= ordinal <= self.end:
+            raise ValueError("Date outside the lunar year")
+        return self.dates[ordinal - self.start]
+
+    def _date_occur(self, month, day):
+        # The ordinal date of day, day, of lunar month, month, or None if it
+        # falls before the year or the month is expunged with no later month.
+        if month in self.expunged_months:
+            later = [m for m in self.months if m[0] > month]
+            if not later:
+                return None
+            month, leap, _ = later[0]
+        else:
+            leap = False
+        target = HinduLunarDate(self.year, month, leap, day, False)
+        last = None
+        for i, date in enumerate(self.dates):
+            if not is_hindu_lunar_on_or_before(date, target):
+                break
+            last = self.start + i
+        return last
+
+    def date_occur(self, month, day):
+        """Return the ordinal date of day, day, of lunar month, month, as
+        hindu_date_occur.  When the month is expunged the following month
+        is used."""
+        date = self._date_occur(month, day)
+        if date is None:
+            raise ValueError("Date outside the lunar year")
+        return date
+
+    def _tithi_at_or_after(self, tithi, tee):
+        # The moment at or after moment, tee, when tithi, tithi, begins, or
+        # None if it does not within the boundaries found for the year.
+        half_tithi = int(2 * (tithi - 1)) % 60
+        for i in range(bisect_left(self._moments, tee), len(self._moments)):
+            if self.half_tithis[i] == half_tithi:
+                return self._moments[i]
+        return None
+
+    def tithi_at_or_after(self, tithi, tee):
+        """Return the moment at or after moment, tee, when tithi, tithi
+        (a multiple of 1/2), begins."""
+        lunar = self._tithi_at_or_after(tithi, tee)
+        if lunar is None:
+            raise ValueError("Tithi outside the lunar year")
+        return lunar
+
+    def _tithi_occur(self, month, tithi, tee):
+        # The ordinal date of tithi, tithi, of lunar month, month, or None if
+        # the month or the tithi falls outside the year.
+        approx = self._date_occur(month, int(math.floor(tithi)))
+        if approx is None:
+            return None
+        lunar = self._tithi_at_or_after(tithi, approx - 2)
+        if lunar is None:
+            return None
+        ttry = Clock.ordinal_from_moment(lunar)
+        tee_h = HinduLunarDate.UJJAIN.standard_from_sundial(ttry + tee)
+        if lunar <= tee_h or HinduLunarDate.lunar_phase(HinduLunarDate.UJJAIN.standard_from_sundial(ttry + 1 + tee)) > 12 * tithi:
+            return ttry
+        else:
+            return ttry + 1
+
+    def tithi_occur(self, month, tithi, tee):
+        """Return the ordinal date of tithi, tithi, of lunar month, month,
+        prior to sundial time, tee, as hindu_tithi_occur."""
+        date = self._tithi_occur(month, tithi, tee)
+        if date is None:
+            raise ValueError("Tithi outside the lunar year")
+        return date
+
+    def resolve(self, rule):
+        """Return the ordinal date of festival rule, rule, in this year.
+        Rules falling at the edge of the year, outside the months or tithi
+        boundaries found for it, are resolved directly."""
+        if isinstance(rule, TithiRule):
+            date = None
+            if 2 * rule.tithi == int(2 * rule.tithi):
+                date = self._tithi_occur(rule.month, rule.tithi, rule.tee)
+            return hindu_tithi_occur(rule.month, rule.tithi, rule.tee, self.year) if date is None else date
+        date = self._date_occur(rule.month, rule.day)
+        return hindu_date_occur(rule.month, rule.day, self.year) if date is None else date
+
+def _festivals(rules, start_year, end_year):
+    # The festivals of the Gregorian years start_year to end_year inclusive,
+    # building each lunar year once.
+    years = {}
+    result = {}
+    for g_year in range(start_year, end_year + 1):
+        start, end = GregorianDate.year_range(g_year)
+        l_year = HinduLunarDate.fromordinal(start).year
+        for year in (l_year, l_year + 1):
+            if year not in years:
+                years[year] = HinduLunarYear(year)
+        result[g_year] = {rule.name: [date for date in (years[l_year].resolve(rule), years[l_year + 1].resolve(rule))
+                                      if start <= date <= end]
+                          for rule in rules}
+        for year in [year for year in years if year < l_year]:
+            del years[year]
+    return result
+
+def festivals(rules, start_year, end_year, processes=1, chunk_years=10):
+    """Return the ordinal dates of each of the festival rules, rules, in
+    each Gregorian year from start_year to end_year inclusive, as a
+    dictionary of years to dictionaries of rule names to lists of dates.
+
+    With more than one process (or None, for one for each processor) the
+    years are resolved in chunks of chunk_years in a process pool."""
+    rules = tuple(rules)
+    chunks = [(rules, year, min(year + chunk_years - 1, end_year))
+              for year in range(start_year, end_year + 1, chunk_years)]
+    result = {}
+    if processes == 1:
+        for chunk in chunks:
+            result.update(_festivals(*chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            for part in executor.map(_festivals, *zip(*chunks)):
+                result.update(part)
+    return result
@@ -0,0 +1,17 @@
+# Optional compilation of the numeric kernels with numba.  The kernels are
+# written as plain Python over floats and sequences, so they run unchanged
+# when numba is not installed.
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+HAS_NUMBA = numba is not None
+
+def jit(f):
+    """Return f compiled by numba in nopython mode, with the compiled code
+    cached to disk, or f itself if numba is not available."""
+    if numba is None:
+        return f
+    return numba.njit(cache=True)(f)
@@ -6,26 +6,107 @@ from jetblack.calendars.trigonometry import sin_degrees, cos_degrees, tan_degree
 from jetblack.calendars.astrological import zone_from_longitude, equation_of_time, declination, right_ascension, sidereal_from_moment
 from jetblack.calendars.solar import solar_longitude
 from jetblack.calendars.lunar import lunar_phase, lunar_distance, MEAN_SYNODIC_MONTH, lunar_longitude, lunar_latitude, MoonPhase
-from jetblack.calendars.utils import binary_search, next_int
+from jetblack.calendars.utils import next_int
+from jetblack.calendars.events import CrossingFinder
 
 class Location(object):
-    
+    """An immutable, hashable place on the earth.
+
+    Constants derived from the latitude and elevation are computed once
+    at construction. A location may carry a cache (any mutable mapping)
+    of per-day results, which is not part of its identity."""
+
+    __slots__ = ('_latitude', '_longitude', '_elevation', '_zone',
+                 '_sin_latitude', '_cos_latitude', '_tan_latitude',
+                 '_refraction', '_cache')
+
     MORNING = True
     EVENING = False
+    DEPRESSION_TOLERANCE = Clock.days_from_seconds(30)
+    DEPRESSION_MAX_ITERATIONS = 50
+
+    def __init__(self, latitude, longitude, elevation, zone, cache=None):
+        set_slot = super().__setattr__
+        set_slot('_latitude', latitude)
+        set_slot('_longitude', longitude)
+        set_slot('_elevation', elevation)
+        set_slot('_zone', zone)
+        set_slot('_sin_latitude', sin_degrees(latitude))
+        set_slot('_cos_latitude', cos_degrees(latitude))
+        set_slot('_tan_latitude', tan_degrees(latitude))
+        h     = max(0, elevation)
+        cap_R = 6.372E6
+        dip   = arccos_degrees(cap_R / (cap_R + h))
+        set_slot('_refraction', angle(0, 50, 0) + dip + secs(19) * math.sqrt(h))
+        set_slot('_cache', cache)
+
+    @property
+    def latitude(self):
+        return self._latitude
+
+    @property
+    def longitude(self):
+        return self._longitude
+
+    @property
+    def elevation(self):
+        return self._elevation
+
+    @property
+    def zone(self):
+        return self._zone
+
+    @property
+    def cache(self):
+        return self._cache
 
-    def __init__(self, latitude, longitude, elevation, zone):
-        self.latitude = latitude
-        self.longitude = longitude
-        self.elevation = elevation
-        self.zone = zone
+    def __setattr__(self, name, value):
+        raise AttributeError("Location is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Location is immutable")
+
+    def to_tuple(self):
+        return (self.latitude, self.longitude, self.elevation, self.zone)
+
+    def __eq__(self, other):
+        return isinstance(other, Location) and self.to_tuple() == other.to_tuple()
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.to_tuple())
+
+    def __repr__(self):
+        return "Location({0}, {1}, {2}, {3})".format(*self.to_tuple())
+
+    def __reduce__(self):
+        return (Location, self.to_tuple())
+
+    def with_cache(self, cache=None):
+        """Return this location with a cache attached for per-day results
+        (a new dict if no mapping is given)."""
+        return Location(self.latitude, self.longitude, self.elevation, self.zone, {} if cache is None else cache)
+
+    def _cached(self, key, compute):
+        """Return the result for key from the attached cache, computing
+        and storing it if absent."""
+        if self._cache is None:
+            return compute()
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = compute()
+            return value
 
     def direction(self, focus):
         """Return the angle (clockwise from North) to face focus when
         standing in location, location.  Subject to errors near focus and
         its antipode."""
         y = sin_degrees(focus.longitude - self.longitude)
-        x = ((cos_degrees(self.latitude) * tan_degrees(focus.latitude)) -
-             (sin_degrees(self.latitude) * cos_degrees(self.longitude - focus.longitude)))
+        x = ((self._cos_latitude * focus._tan_latitude) -
+             (self._sin_latitude * cos_degrees(self.longitude - focus.longitude)))
         if x == y == 0 or focus.latitude == 90:
             return 0
         elif focus.latitude == -90:
@@ -79,12 +160,11 @@ class Location(object):
         """Return sine of angle between position of sun at 
         local time tee and when its depression is alpha at location, location.
         Out of range when it does not occur."""
-        phi = self.latitude
         tee_prime = self.universal_from_local(local_time)
         delta = declination(tee_prime, mpf(0), solar_longitude(tee_prime))
-        return ((tan_degrees(phi) * tan_degrees(delta)) +
+        return ((self._tan_latitude * tan_degrees(delta)) +
                 (sin_degrees(alpha) / (cos_degrees(delta) *
-                                       cos_degrees(phi))))
+                                       self._cos_latitude)))
 
     def approx_moment_of_depression(self, tee, alpha, early):
         """Return the moment in local time near tee when depression angle
@@ -115,46 +195,67 @@ class Location(object):
         else:
             raise ValueError("Depression angle not reached")
 
-    def moment_of_depression(self, approx, alpha, early):
+    def moment_of_depression(self, approx, alpha, early, tolerance=DEPRESSION_TOLERANCE,
+                             max_iterations=DEPRESSION_MAX_ITERATIONS, hook=None):
         """Return the moment in local time near approx when depression
         angle of sun is alpha (negative if above horizon) at location;
-        early is true when MORNING event is sought, and false for EVENING."""
-        tee = self.approx_moment_of_depression(approx, alpha, early)
-        if abs(approx - tee) < Clock.days_from_seconds(30):
-            return tee
-        else:
-            return self.moment_of_depression(tee, alpha, early)
+        early is true when MORNING event is sought, and false for EVENING.
+        Iterates until successive estimates agree within tolerance, raising
+        ValueError after max_iterations.  If given, hook is called with
+        the number of iterations taken."""
+        for iteration in range(1, max_iterations + 1):
+            tee = self.approx_moment_of_depression(approx, alpha, early)
+            if abs(approx - tee) < tolerance:
+                if hook is not None:
+                    hook(iteration)
+                return tee
+            approx = tee
+        if hook is not None:
+            hook(max_iterations)
+        raise ValueError("Depression angle did not converge")
 
-    def dawn(self, date, alpha):
+    def dawn(self, date, alpha, tolerance=DEPRESSION_TOLERANCE, guess=None,
+             max_iterations=DEPRESSION_MAX_ITERATIONS, hook=None):
         """Return standard time in morning on fixed date date at
-        location location when depression angle of sun is alpha."""
-        result = self.moment_of_depression(date + Clock.days_from_hours(6), alpha, self.MORNING)
-        return self.standard_from_local(result)
+        location location when depression angle of sun is alpha.
+        The search starts from standard time guess, if given, else 6am,
+        and is bounded by max_iterations and reported to hook as
+        moment_of_depression.  With an attached cache the result is kept
+        by date, alpha and tolerance alone, so the first caller's guess
+        wins and a cached result is returned without calling hook."""
+        approx = date + Clock.days_from_hours(6) if guess is None else self.local_from_standard(guess)
+        return self._cached(('dawn', date, alpha, tolerance), lambda: self.standard_from_local(
+            self.moment_of_depression(approx, alpha, self.MORNING, tolerance, max_iterations, hook)))
     
-    def dusk(self, date, alpha):
+    def dusk(self, date, alpha, tolerance=DEPRESSION_TOLERANCE, guess=None,
+             max_iterations=DEPRESSION_MAX_ITERATIONS, hook=None):
         """Return standard time in evening on fixed date 'date' at
-        location 'location' when depression angle of sun is alpha."""
-        result = self.moment_of_depression(date + Clock.days_from_hours(18), alpha, self.EVENING)
-        return self.standard_from_local(result)
+        location 'location' when depression angle of sun is alpha.
+        The search starts from standard time guess, if given, else 6pm,
+        and is bounded by max_iterations and reported to hook as
+        moment_of_depression.  With an attached cache the result is kept
+        by date, alpha and tolerance alone, so the first caller's guess
+        wins and a cached result is returned without calling hook."""
+        approx = date + Clock.days_from_hours(18) if guess is None else self.local_from_standard(guess)
+        return self._cached(('dusk', date, alpha, tolerance), lambda: self.standard_from_local(
+            self.moment_of_depression(approx, alpha, self.EVENING, tolerance, max_iterations, hook)))
 
     def refraction(self, tee):
-        """Return refraction angle at location 'location' and time 'tee'."""
-        h     = max(0, self.elevation)
-        cap_R = 6.372E6
-        dip   = arccos_degrees(cap_R / (cap_R + h))
-        return angle(0, 50, 0) + dip + secs(19) * math.sqrt(h)
+        """Return refraction angle at location 'location' and time 'tee'.
+        This depends only on the elevation, so is computed once."""
+        return self._refraction
 
-    def sunrise(self, date):
+    def sunrise(self, date, tolerance=DEPRESSION_TOLERANCE, max_iterations=DEPRESSION_MAX_ITERATIONS, hook=None):
         """Return Standard time of sunrise on fixed date 'date' at
-        location 'location'."""
+        location 'location', as dawn."""
         alpha = self.refraction(date)
-        return self.dawn(date, alpha)
+        return self.dawn(date, alpha, tolerance, max_iterations=max_iterations, hook=hook)
     
-    def sunset(self, date):
+    def sunset(self, date, tolerance=DEPRESSION_TOLERANCE, max_iterations=DEPRESSION_MAX_ITERATIONS, hook=None):
         """Return standard time of sunset on fixed date 'date' at
-        location 'location'."""
+        location 'location', as dusk."""
         alpha = self.refraction(date)
-        return self.dusk(date, alpha)
+        return self.dusk(date, alpha, tolerance, max_iterations=max_iterations, hook=hook)
     
     def observed_lunar_altitude(self, tee):
         """Return the observed altitude of moon at moment, tee, and
@@ -174,14 +275,14 @@ class Location(object):
             approx = t - offset
         else:
             approx = t + (1 / 2) + offset
-        rise = binary_search(approx - Clock.days_from_hours(3),
-                             approx + Clock.days_from_hours(3),
-                             lambda u, l: ((u - l) < Clock.days_from_hours(1/60)),
-                             lambda x: self.observed_lunar_altitude(x) > 0)
-        if rise < (t + 1):
+        # The moon's altitude changes by less than 360 degrees a day.
+        finder = CrossingFinder(self.observed_lunar_altitude, 360, step=Clock.days_from_hours(1/6),
+                                prec=Clock.days_from_hours(1/60))
+        rise = finder.first(0, approx - Clock.days_from_hours(3), approx + Clock.days_from_hours(3))
+        if rise is not None and rise < (t + 1):
             return self.standard_from_universal(rise)
         
-        raise ValueError()
+        raise ValueError("No moonrise on date")
 
     def daytime_temporal_hour(self, date):
         """Return the length of daytime temporal hour on fixed date, date
@@ -249,8 +350,8 @@ class Location(object):
         theta0 = sidereal_from_moment(tee)
         cap_H = mod(theta0 + self.longitude - alpha, 360)
         altitude = arcsin_degrees(
-            (sin_degrees(self.latitude) * sin_degrees(delta)) +
-            (cos_degrees(self.latitude) * cos_degrees(delta) * cos_degrees(cap_H)))
+            (self._sin_latitude * sin_degrees(delta)) +
+            (self._cos_latitude * cos_degrees(delta) * cos_degrees(cap_H)))
         return mod(altitude + 180, 360) - 180
 
     def visible_crescent(self, date):
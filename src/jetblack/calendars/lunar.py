@@ -1,13 +1,30 @@
 from enum import IntEnum
 from mpmath import mpf
 from jetblack.calendars.trigonometry import sin_degrees, cos_degrees, normalized_degrees 
-from jetblack.calendars.utils import iround, poly, sigma, invert_angular
+from jetblack.calendars.utils import iround, poly, invert_angular, secant_angular
 from jetblack.calendars.utils import next_int, final_int
 from jetblack.calendars.astrological import julian_centuries, nutation, J2000, universal_from_dynamical
 from jetblack.calendars.solar import solar_anomaly, solar_longitude
+from jetblack.calendars.events import CrossingFinder
+from jetblack.calendars.series import ArgumentSeries, PhaseSeries
 
 MEAN_SYNODIC_MONTH = mpf(29.530588861)
 
+MEAN_LUNAR_LONGITUDE_COEFFICIENTS = \
+    (mpf(218.3164477), mpf(481267.88123421), mpf(-0.0015786), mpf(1 / 538841.0), mpf(-1.0 / 65194000.0))
+
+LUNAR_ELONGATION_COEFFICIENTS = \
+    (mpf(297.8501921), mpf(445267.1114034), mpf(-0.0018819), mpf(1/545868), mpf(-1/113065000))
+
+LUNAR_ANOMALY_COEFFICIENTS = \
+    (mpf(134.9633964), mpf(477198.8675055), mpf(0.0087414), mpf(1.0/69699.0), mpf(-1.0/14712000.0))
+
+MOON_NODE_COEFFICIENTS = \
+    (mpf(93.2720950), mpf(483202.0175233), mpf(-0.0036539), mpf(-1.0/3526000.0), mpf(1.0/863310000.0))
+
+# The eccentricity of the earth's orbit, eq. 47.6 in Meeus.
+ECCENTRICITY_COEFFICIENTS = (1, mpf(-0.002516), mpf(-0.0000074))
+
 class MoonPhase(IntEnum):
     NEW = 0
     FIRST_QUARTER = 90
@@ -20,32 +37,65 @@ def mean_lunar_longitude(c):
     effect of the light-time (-0".70).
     Adapted from eq. 47.1 in "Astronomical Algorithms" by Jean Meeus,
     Willmann_Bell, Inc., 2nd ed. with corrections, 2005."""
-    return normalized_degrees(poly(c, [mpf(218.3164477), mpf(481267.88123421),
-                               mpf(-0.0015786), mpf(1 / 538841.0),
-                               mpf(-1.0 / 65194000.0)]))
+    return normalized_degrees(poly(c, MEAN_LUNAR_LONGITUDE_COEFFICIENTS))
 
 def lunar_elongation(c):
     """Return elongation of moon (in degrees) at moment
     given in Julian centuries c.
     Adapted from eq. 47.2 in "Astronomical Algorithms" by Jean Meeus,
     Willmann_Bell, Inc., 2nd ed. with corrections, 2005."""
-    return normalized_degrees(poly(c, [mpf(297.8501921), mpf(445267.1114034),
-                                mpf(-0.0018819), mpf(1/545868),
-                                mpf(-1/113065000)]))
+    return normalized_degrees(poly(c, LUNAR_ELONGATION_COEFFICIENTS))
 
 def lunar_anomaly(c):
     """Return mean anomaly of moon (in degrees) at moment
     given in Julian centuries c.
     Adapted from eq. 47.4 in "Astronomical Algorithms" by Jean Meeus,
     Willmann_Bell, Inc., 2nd ed. with corrections, 2005."""
-    return normalized_degrees(poly(c, [mpf(134.9633964), mpf(477198.8675055), mpf(0.0087414), mpf(1.0/69699.0), mpf(-1.0/14712000.0)]))
+    return normalized_degrees(poly(c, LUNAR_ANOMALY_COEFFICIENTS))
 
 def moon_node(c):
     """Return Moon's argument of latitude (in degrees) at moment
     given in Julian centuries 'c'.
     Adapted from eq. 47.5 in "Astronomical Algorithms" by Jean Meeus,
     Willmann_Bell, Inc., 2nd ed. with corrections, 2005."""
-    return normalized_degrees(poly(c, [mpf(93.2720950), mpf(483202.0175233), mpf(-0.0036539), mpf(-1.0/3526000.0), mpf(1.0/863310000.0)]))
+    return normalized_degrees(poly(c, MOON_NODE_COEFFICIENTS))
+
+LUNAR_LONGITUDE_ARGS_LUNAR_ELONGATION = \
+    (0, 2, 2, 0, 0, 0, 2, 2, 2, 2, 0, 1, 0, 2, 0, 0, 4, 0, 4, 2, 2, 1,
+     1, 2, 2, 4, 2, 0, 2, 2, 1, 2, 0, 0, 2, 2, 2, 4, 0, 3, 2, 4, 0, 2,
+     2, 2, 4, 0, 4, 1, 2, 0, 1, 3, 4, 2, 0, 1, 2)
+
+LUNAR_LONGITUDE_ARGS_SOLAR_ANOMALY = \
+    (0, 0, 0, 0, 1, 0, 0, -1, 0, -1, 1, 0, 1, 0, 0, 0, 0, 0, 0, 1, 1,
+     0, 1, -1, 0, 0, 0, 1, 0, -1, 0, -2, 1, 2, -2, 0, 0, -1, 0, 0, 1,
+     -1, 2, 2, 1, -1, 0, 0, -1, 0, 1, 0, 1, 0, 0, -1, 2, 1, 0)
+
+LUNAR_LONGITUDE_ARGS_LUNAR_ANOMALY = \
+    (1, -1, 0, 2, 0, 0, -2, -1, 1, 0, -1, 0, 1, 0, 1, 1, -1, 3, -2,
+     -1, 0, -1, 0, 1, 2, 0, -3, -2, -1, -2, 1, 0, 2, 0, -1, 1, 0,
+     -1, 2, -1, 1, -2, -1, -1, -2, 0, 1, 4, 0, -2, 0, 2, 1, -2, -3,
+     2, 1, -1, 3)
+
+LUNAR_LONGITUDE_ARGS_MOON_NODE = \
+    (0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, -2, 2, -2, 0, 0, 0, 0, 0,
+     0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, -2, 2, 0, 2, 0, 0, 0, 0,
+     0, 0, -2, 0, 0, 0, 0, -2, -2, 0, 0, 0, 0, 0, 0, 0)
+
+LUNAR_LONGITUDE_SINE_COEFFICIENTS = \
+    (6288774,1274027,658314,213618,-185116,-114332,
+     58793,57066,53322,45758,-40923,-34720,-30383,
+     15327,-12528,10980,10675,10034,8548,-7888,
+     -6766,-5163,4987,4036,3994,3861,3665,-2689,
+     -2602, 2390,-2348,2236,-2120,-2069,2048,-1773,
+     -1595,1215,-1110,-892,-810,759,-713,-700,691,
+     596,549,537,520,-487,-399,-381,351,-340,330,
+     327,-323,299,294)
+
+LUNAR_LONGITUDE_SERIES = ArgumentSeries(
+    LUNAR_LONGITUDE_SINE_COEFFICIENTS,
+    (LUNAR_LONGITUDE_ARGS_LUNAR_ELONGATION, LUNAR_LONGITUDE_ARGS_SOLAR_ANOMALY,
+     LUNAR_LONGITUDE_ARGS_LUNAR_ANOMALY, LUNAR_LONGITUDE_ARGS_MOON_NODE),
+    map(abs, LUNAR_LONGITUDE_ARGS_SOLAR_ANOMALY))
 
 def lunar_longitude(tee):
     """Return longitude of moon (in degrees) at moment tee.
@@ -58,43 +108,9 @@ def lunar_longitude(tee):
     cap_M_prime = lunar_anomaly(c)
     cap_F = moon_node(c)
     # see eq. 47.6 in Meeus
-    cap_E = poly(c, [1, mpf(-0.002516), mpf(-0.0000074)])
-    args_lunar_elongation = \
-            [0, 2, 2, 0, 0, 0, 2, 2, 2, 2, 0, 1, 0, 2, 0, 0, 4, 0, 4, 2, 2, 1,
-             1, 2, 2, 4, 2, 0, 2, 2, 1, 2, 0, 0, 2, 2, 2, 4, 0, 3, 2, 4, 0, 2,
-             2, 2, 4, 0, 4, 1, 2, 0, 1, 3, 4, 2, 0, 1, 2]
-    args_solar_anomaly = \
-            [0, 0, 0, 0, 1, 0, 0, -1, 0, -1, 1, 0, 1, 0, 0, 0, 0, 0, 0, 1, 1,
-             0, 1, -1, 0, 0, 0, 1, 0, -1, 0, -2, 1, 2, -2, 0, 0, -1, 0, 0, 1,
-             -1, 2, 2, 1, -1, 0, 0, -1, 0, 1, 0, 1, 0, 0, -1, 2, 1, 0]
-    args_lunar_anomaly = \
-            [1, -1, 0, 2, 0, 0, -2, -1, 1, 0, -1, 0, 1, 0, 1, 1, -1, 3, -2,
-             -1, 0, -1, 0, 1, 2, 0, -3, -2, -1, -2, 1, 0, 2, 0, -1, 1, 0,
-             -1, 2, -1, 1, -2, -1, -1, -2, 0, 1, 4, 0, -2, 0, 2, 1, -2, -3,
-             2, 1, -1, 3]
-    args_moon_node = \
-            [0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, -2, 2, -2, 0, 0, 0, 0, 0,
-             0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, -2, 2, 0, 2, 0, 0, 0, 0,
-             0, 0, -2, 0, 0, 0, 0, -2, -2, 0, 0, 0, 0, 0, 0, 0]
-    sine_coefficients = \
-            [6288774,1274027,658314,213618,-185116,-114332,
-             58793,57066,53322,45758,-40923,-34720,-30383,
-             15327,-12528,10980,10675,10034,8548,-7888,
-             -6766,-5163,4987,4036,3994,3861,3665,-2689,
-             -2602, 2390,-2348,2236,-2120,-2069,2048,-1773,
-             -1595,1215,-1110,-892,-810,759,-713,-700,691,
-             596,549,537,520,-487,-399,-381,351,-340,330,
-             327,-323,299,294]
+    cap_E = poly(c, ECCENTRICITY_COEFFICIENTS)
     correction = ((1.0/1000000.0) *
-                  sigma([sine_coefficients, args_lunar_elongation,
-                         args_solar_anomaly, args_lunar_anomaly,
-                         args_moon_node],
-                        lambda v, w, x, y, z:
-                        v * pow(cap_E, abs(x)) *
-                        sin_degrees((w * cap_D) +
-                                    (x * cap_M) +
-                                    (y * cap_M_prime) +
-                                    (z * cap_F))))
+                  LUNAR_LONGITUDE_SERIES((cap_D, cap_M, cap_M_prime, cap_F), cap_E))
     A1 = mpf(119.75) + (c * mpf(131.849))
     venus = ((3958/1000000) * sin_degrees(A1))
     A2 = mpf(53.09) + c * mpf(479264.29)
@@ -103,6 +119,43 @@ def lunar_longitude(tee):
 
     return (cap_L_prime + correction + venus + jupiter + flat_earth + nutation(tee)) % 360
 
+LUNAR_LATITUDE_ARGS_LUNAR_ELONGATION = \
+    (0, 0, 0, 2, 2, 2, 2, 0, 2, 0, 2, 2, 2, 2, 2, 2, 2, 0, 4, 0, 0, 0,
+     1, 0, 0, 0, 1, 0, 4, 4, 0, 4, 2, 2, 2, 2, 0, 2, 2, 2, 2, 4, 2, 2,
+     0, 2, 1, 1, 0, 2, 1, 2, 0, 4, 4, 1, 4, 1, 4, 2)
+
+LUNAR_LATITUDE_ARGS_SOLAR_ANOMALY = \
+    (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, 0, 1, -1, -1, -1, 1, 0, 1,
+     0, 1, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, 0, 0, 0, 1, 1,
+     0, -1, -2, 0, 1, 1, 1, 1, 1, 0, -1, 1, 0, -1, 0, 0, 0, -1, -2)
+
+LUNAR_LATITUDE_ARGS_LUNAR_ANOMALY = \
+    (0, 1, 1, 0, -1, -1, 0, 2, 1, 2, 0, -2, 1, 0, -1, 0, -1, -1, -1,
+     0, 0, -1, 0, 1, 1, 0, 0, 3, 0, -1, 1, -2, 0, 2, 1, -2, 3, 2, -3,
+     -1, 0, 0, 1, 0, 1, 1, 0, 0, -2, -1, 1, -2, 2, -2, -1, 1, 1, -2,
+     0, 0)
+
+LUNAR_LATITUDE_ARGS_MOON_NODE = \
+    (1, 1, -1, -1, 1, -1, 1, 1, -1, -1, -1, -1, 1, -1, 1, 1, -1, -1,
+     -1, 1, 3, 1, 1, 1, -1, -1, -1, 1, -1, 1, -3, 1, -3, -1, -1, 1,
+     -1, 1, -1, 1, 1, 1, 1, -1, 3, -1, -1, 1, -1, -1, 1, -1, 1, -1,
+     -1, -1, -1, -1, -1, 1)
+
+LUNAR_LATITUDE_SINE_COEFFICIENTS = \
+    (5128122, 280602, 277693, 173237, 55413, 46271, 32573,
+     17198, 9266, 8822, 8216, 4324, 4200, -3359, 2463, 2211,
+     2065, -1870, 1828, -1794, -1749, -1565, -1491, -1475,
+     -1410, -1344, -1335, 1107, 1021, 833, 777, 671, 607,
+     596, 491, -451, 439, 422, 421, -366, -351, 331, 315,
+     302, -283, -229, 223, 223, -220, -220, -185, 181,
+     -177, 176, 166, -164, 132, -119, 115, 107)
+
+LUNAR_LATITUDE_SERIES = ArgumentSeries(
+    LUNAR_LATITUDE_SINE_COEFFICIENTS,
+    (LUNAR_LATITUDE_ARGS_LUNAR_ELONGATION, LUNAR_LATITUDE_ARGS_SOLAR_ANOMALY,
+     LUNAR_LATITUDE_ARGS_LUNAR_ANOMALY, LUNAR_LATITUDE_ARGS_MOON_NODE),
+    map(abs, LUNAR_LATITUDE_ARGS_SOLAR_ANOMALY))
+
 def lunar_latitude(tee):
     """Return the latitude of moon (in degrees) at moment, tee.
     Adapted from "Astronomical Algorithms" by Jean Meeus,
@@ -113,45 +166,9 @@ def lunar_latitude(tee):
     cap_M = solar_anomaly(c)
     cap_M_prime = lunar_anomaly(c)
     cap_F = moon_node(c)
-    cap_E = poly(c, [1, mpf(-0.002516), mpf(-0.0000074)])
-    args_lunar_elongation = \
-            [0, 0, 0, 2, 2, 2, 2, 0, 2, 0, 2, 2, 2, 2, 2, 2, 2, 0, 4, 0, 0, 0,
-             1, 0, 0, 0, 1, 0, 4, 4, 0, 4, 2, 2, 2, 2, 0, 2, 2, 2, 2, 4, 2, 2,
-             0, 2, 1, 1, 0, 2, 1, 2, 0, 4, 4, 1, 4, 1, 4, 2]
-    args_solar_anomaly = \
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, 0, 1, -1, -1, -1, 1, 0, 1,
-             0, 1, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, 0, 0, 0, 1, 1,
-             0, -1, -2, 0, 1, 1, 1, 1, 1, 0, -1, 1, 0, -1, 0, 0, 0, -1, -2]
-    args_lunar_anomaly = \
-            [0, 1, 1, 0, -1, -1, 0, 2, 1, 2, 0, -2, 1, 0, -1, 0, -1, -1, -1,
-             0, 0, -1, 0, 1, 1, 0, 0, 3, 0, -1, 1, -2, 0, 2, 1, -2, 3, 2, -3,
-             -1, 0, 0, 1, 0, 1, 1, 0, 0, -2, -1, 1, -2, 2, -2, -1, 1, 1, -2,
-             0, 0]
-    args_moon_node = \
-            [1, 1, -1, -1, 1, -1, 1, 1, -1, -1, -1, -1, 1, -1, 1, 1, -1, -1,
-             -1, 1, 3, 1, 1, 1, -1, -1, -1, 1, -1, 1, -3, 1, -3, -1, -1, 1,
-             -1, 1, -1, 1, 1, 1, 1, -1, 3, -1, -1, 1, -1, -1, 1, -1, 1, -1,
-             -1, -1, -1, -1, -1, 1]
-    sine_coefficients = \
-            [5128122, 280602, 277693, 173237, 55413, 46271, 32573,
-             17198, 9266, 8822, 8216, 4324, 4200, -3359, 2463, 2211,
-             2065, -1870, 1828, -1794, -1749, -1565, -1491, -1475,
-             -1410, -1344, -1335, 1107, 1021, 833, 777, 671, 607,
-             596, 491, -451, 439, 422, 421, -366, -351, 331, 315,
-             302, -283, -229, 223, 223, -220, -220, -185, 181,
-             -177, 176, 166, -164, 132, -119, 115, 107]
+    cap_E = poly(c, ECCENTRICITY_COEFFICIENTS)
     beta = ((1.0/1000000.0) *
-            sigma([sine_coefficients, 
-                   args_lunar_elongation,
-                   args_solar_anomaly,
-                   args_lunar_anomaly,
-                   args_moon_node],
-                  lambda v, w, x, y, z: (v *
-                                         pow(cap_E, abs(x)) *
-                                         sin_degrees((w * cap_D) +
-                                                     (x * cap_M) +
-                                                     (y * cap_M_prime) +
-                                                     (z * cap_F)))))
+            LUNAR_LATITUDE_SERIES((cap_D, cap_M, cap_M_prime, cap_F), cap_E))
     venus = ((175/1000000) *
              (sin_degrees(mpf(119.75) + c * mpf(131.849) + cap_F) +
               sin_degrees(mpf(119.75) + c * mpf(131.849) - cap_F)))
@@ -204,6 +221,77 @@ def lunar_perigee(tee):
     with corrections June 2005."""
     return normalized_degrees(poly(julian_centuries(tee), [mpf(83.3532465), mpf(4069.0137287), mpf(-0.0103200), mpf(-1.0/80053.0), mpf(1.0/18999000.0)]))
 
+NEW_MOON_E_FACTOR = \
+    (0, 1, 0, 0, 1, 1, 2, 0, 0, 1, 0, 1, 1, 1, 0, 0, 0, 0,
+     0, 0, 0, 0, 0, 0)
+
+NEW_MOON_SOLAR_COEFFICIENTS = \
+    (0, 1, 0, 0, -1, 1, 2, 0, 0, 1, 0, 1, 1, -1, 2,
+     0, 3, 1, 0, 1, -1, -1, 1, 0)
+
+NEW_MOON_LUNAR_COEFFICIENTS = \
+    (1, 0, 2, 0, 1, 1, 0, 1, 1, 2, 3, 0, 0, 2, 1, 2,
+     0, 1, 2, 1, 1, 1, 3, 4)
+
+NEW_MOON_MOON_COEFFICIENTS = \
+    (0, 0, 0, 2, 0, 0, 0, -2, 2, 0, 0, 2, -2, 0, 0,
+     -2, 0, -2, 2, 2, 2, -2, 0, 0)
+
+NEW_MOON_SINE_COEFFICIENTS = \
+    (mpf(-0.40720), mpf(0.17241), mpf(0.01608),
+     mpf(0.01039),  mpf(0.00739), mpf(-0.00514),
+     mpf(0.00208), mpf(-0.00111), mpf(-0.00057),
+     mpf(0.00056), mpf(-0.00042), mpf(0.00042),
+     mpf(0.00038), mpf(-0.00024), mpf(-0.00007),
+     mpf(0.00004), mpf(0.00004), mpf(0.00003),
+     mpf(0.00003), mpf(-0.00003), mpf(0.00003),
+     mpf(-0.00002), mpf(-0.00002), mpf(0.00002))
+
+NEW_MOON_ADDITIONAL_ADDENDS = \
+    (mpf(251.88), mpf(251.83), mpf(349.42), mpf(84.66),
+     mpf(141.74), mpf(207.14), mpf(154.84), mpf(34.52),
+     mpf(207.19), mpf(291.34), mpf(161.72), mpf(239.56),
+     mpf(331.55))
+
+NEW_MOON_ADDITIONAL_MULTIPLIERS = \
+    (mpf(0.016321), mpf(26.651886), mpf(36.412478),
+     mpf(18.206239), mpf(53.303771), mpf(2.453732),
+     mpf(7.306860), mpf(27.261239), mpf(0.121824),
+     mpf(1.844379), mpf(24.198154), mpf(25.513099),
+     mpf(3.592518))
+
+NEW_MOON_ADDITIONAL_COEFFICIENTS = \
+    (mpf(0.000165), mpf(0.000164), mpf(0.000126),
+     mpf(0.000110), mpf(0.000062), mpf(0.000060),
+     mpf(0.000056), mpf(0.000047), mpf(0.000042),
+     mpf(0.000040), mpf(0.000037), mpf(0.000035),
+     mpf(0.000023))
+
+NEW_MOON_SERIES = ArgumentSeries(
+    NEW_MOON_SINE_COEFFICIENTS,
+    (NEW_MOON_SOLAR_COEFFICIENTS, NEW_MOON_LUNAR_COEFFICIENTS, NEW_MOON_MOON_COEFFICIENTS),
+    NEW_MOON_E_FACTOR)
+
+NEW_MOON_ADDITIONAL_SERIES = PhaseSeries(
+    NEW_MOON_ADDITIONAL_COEFFICIENTS, NEW_MOON_ADDITIONAL_ADDENDS, NEW_MOON_ADDITIONAL_MULTIPLIERS)
+
+NEW_MOON_APPROX_COEFFICIENTS = \
+    (mpf(5.09766), MEAN_SYNODIC_MONTH * mpf(1236.85), mpf(0.0001437), mpf(-0.000000150), mpf(0.00000000073))
+
+NEW_MOON_SOLAR_ANOMALY_COEFFICIENTS = \
+    (mpf(2.5534), (mpf(1236.85) * mpf(29.10535669)), mpf(-0.0000014), mpf(-0.00000011))
+
+NEW_MOON_LUNAR_ANOMALY_COEFFICIENTS = \
+    (mpf(201.5643), (mpf(385.81693528) * mpf(1236.85)), mpf(0.0107582), mpf(0.00001238), mpf(-0.000000058))
+
+NEW_MOON_MOON_ARGUMENT_COEFFICIENTS = \
+    (mpf(160.7108), (mpf(390.67050284) * mpf(1236.85)), mpf(-0.0016118), mpf(-0.00000227), mpf(0.000000011))
+
+NEW_MOON_CAP_OMEGA_COEFFICIENTS = \
+    (mpf(124.7746), (mpf(-1.56375588) * mpf(1236.85)), mpf(0.0020672), mpf(0.00000215))
+
+NEW_MOON_EXTRA_COEFFICIENTS = (mpf(299.77), mpf(132.8475848), mpf(-0.009173))
+
 def nth_new_moon(n):
     """Return the moment of n-th new moon after (or before) the new moon
     of January 11, 1.  Adapted from "Astronomical Algorithms"
@@ -211,58 +299,16 @@ def nth_new_moon(n):
     n0 = 24724
     k = n - n0
     c = k / mpf(1236.85)
-    approx = (J2000 +
-              poly(c, [mpf(5.09766),
-                       MEAN_SYNODIC_MONTH * mpf(1236.85),
-                       mpf(0.0001437),
-                       mpf(-0.000000150),
-                       mpf(0.00000000073)]))
-    cap_E = poly(c, [1, mpf(-0.002516), mpf(-0.0000074)])
-    solar_anomaly = poly(c, [mpf(2.5534), (mpf(1236.85) * mpf(29.10535669)), mpf(-0.0000014), mpf(-0.00000011)])
-    lunar_anomaly = poly(c, [mpf(201.5643), (mpf(385.81693528) * mpf(1236.85)), mpf(0.0107582), mpf(0.00001238), mpf(-0.000000058)])
-    moon_argument = poly(c, [mpf(160.7108), (mpf(390.67050284) * mpf(1236.85)), mpf(-0.0016118), mpf(-0.00000227), mpf(0.000000011)])
-    cap_omega = poly(c, [mpf(124.7746), (mpf(-1.56375588) * mpf(1236.85)), mpf(0.0020672), mpf(0.00000215)])
-    E_factor = [0, 1, 0, 0, 1, 1, 2, 0, 0, 1, 0, 1, 1, 1, 0, 0, 0, 0,
-                0, 0, 0, 0, 0, 0]
-    solar_coeff = [0, 1, 0, 0, -1, 1, 2, 0, 0, 1, 0, 1, 1, -1, 2,
-                   0, 3, 1, 0, 1, -1, -1, 1, 0]
-    lunar_coeff = [1, 0, 2, 0, 1, 1, 0, 1, 1, 2, 3, 0, 0, 2, 1, 2,
-                   0, 1, 2, 1, 1, 1, 3, 4]
-    moon_coeff = [0, 0, 0, 2, 0, 0, 0, -2, 2, 0, 0, 2, -2, 0, 0,
-                  -2, 0, -2, 2, 2, 2, -2, 0, 0]
-    sine_coeff = [mpf(-0.40720), mpf(0.17241), mpf(0.01608),
-                  mpf(0.01039),  mpf(0.00739), mpf(-0.00514),
-                  mpf(0.00208), mpf(-0.00111), mpf(-0.00057),
-                  mpf(0.00056), mpf(-0.00042), mpf(0.00042),
-                  mpf(0.00038), mpf(-0.00024), mpf(-0.00007),
-                  mpf(0.00004), mpf(0.00004), mpf(0.00003),
-                  mpf(0.00003), mpf(-0.00003), mpf(0.00003),
-                  mpf(-0.00002), mpf(-0.00002), mpf(0.00002)]
+    approx = J2000 + poly(c, NEW_MOON_APPROX_COEFFICIENTS)
+    cap_E = poly(c, ECCENTRICITY_COEFFICIENTS)
+    solar_anomaly = poly(c, NEW_MOON_SOLAR_ANOMALY_COEFFICIENTS)
+    lunar_anomaly = poly(c, NEW_MOON_LUNAR_ANOMALY_COEFFICIENTS)
+    moon_argument = poly(c, NEW_MOON_MOON_ARGUMENT_COEFFICIENTS)
+    cap_omega = poly(c, NEW_MOON_CAP_OMEGA_COEFFICIENTS)
     correction = ((mpf(-0.00017) * sin_degrees(cap_omega)) +
-                  sigma([sine_coeff, E_factor, solar_coeff,
-                         lunar_coeff, moon_coeff],
-                        lambda v, w, x, y, z: (v *
-                                    pow(cap_E, w) *
-                                    sin_degrees((x * solar_anomaly) + 
-                                                (y * lunar_anomaly) +
-                                                (z * moon_argument)))))
-    add_const = [mpf(251.88), mpf(251.83), mpf(349.42), mpf(84.66),
-                 mpf(141.74), mpf(207.14), mpf(154.84), mpf(34.52),
-                 mpf(207.19), mpf(291.34), mpf(161.72), mpf(239.56),
-                 mpf(331.55)]
-    add_coeff = [mpf(0.016321), mpf(26.651886), mpf(36.412478),
-                 mpf(18.206239), mpf(53.303771), mpf(2.453732),
-                 mpf(7.306860), mpf(27.261239), mpf(0.121824),
-                 mpf(1.844379), mpf(24.198154), mpf(25.513099),
-                 mpf(3.592518)]
-    add_factor = [mpf(0.000165), mpf(0.000164), mpf(0.000126),
-                  mpf(0.000110), mpf(0.000062), mpf(0.000060),
-                  mpf(0.000056), mpf(0.000047), mpf(0.000042),
-                  mpf(0.000040), mpf(0.000037), mpf(0.000035),
-                  mpf(0.000023)]
-    extra = (mpf(0.000325) * sin_degrees(poly(c, [mpf(299.77), mpf(132.8475848), mpf(-0.009173)])))
-    additional = sigma([add_const, add_coeff, add_factor],
-                       lambda i, j, l: l * sin_degrees(i + j * k))
+                  NEW_MOON_SERIES((solar_anomaly, lunar_anomaly, moon_argument), cap_E))
+    extra = (mpf(0.000325) * sin_degrees(poly(c, NEW_MOON_EXTRA_COEFFICIENTS)))
+    additional = NEW_MOON_ADDITIONAL_SERIES(k)
 
     return universal_from_dynamical(approx + correction + extra + additional)
 
@@ -294,22 +340,84 @@ def lunar_phase(tee):
     else:
         return phi
 
+# The lunar phase advances 360 degrees a synodic month, and is never more
+# than 2 days from where the mean motion would put it.
+LUNAR_PHASE_CROSSINGS = CrossingFinder(lunar_phase, 360 / MEAN_SYNODIC_MONTH, angular=True, window=2)
+
 def lunar_phase_at_or_before(phi, tee):
     """Return the moment UT of the last time at or before moment, tee,
     when the lunar_phase was phi degrees."""
-    tau = tee - (MEAN_SYNODIC_MONTH * (1/360) * ((lunar_phase(tee) - phi) % 360))
-    a = tau - 2
-    b = min(tee, tau +2)
-    return invert_angular(lunar_phase, phi, a, b)
+    return LUNAR_PHASE_CROSSINGS.last(phi, tee)
 
 def lunar_phase_at_or_after(phi, tee):
     """Return the moment UT of the next time at or after moment, tee,
     when the lunar_phase is phi degrees."""
-    tau = tee + (MEAN_SYNODIC_MONTH * (1/360) * ((phi - lunar_phase(tee)) % 360))
-    a = max(tee, tau - 2)
-    b = tau + 2
-    return invert_angular(lunar_phase, phi, a, b)
+    return LUNAR_PHASE_CROSSINGS.first(phi, tee)
  
+def lunar_phases_between(start, end):
+    """Generate (moment UT, MoonPhase) for each new moon, first quarter,
+    full moon and last quarter from moment, start, to moment, end, in order.
+    New moons come from nth_new_moon; each quarter is interpolated between
+    the previous event and the next new moon and refined by the secant method."""
+    elongation = lambda tee: lunar_longitude(tee) - solar_longitude(tee)
+    rate = 360 / MEAN_SYNODIC_MONTH
+    n = iround((start - nth_new_moon(0)) / MEAN_SYNODIC_MONTH) - 1
+    new_moon = nth_new_moon(n)
+    while new_moon <= end:
+        next_new_moon = nth_new_moon(n + 1)
+        if start <= new_moon:
+            yield (new_moon, MoonPhase.NEW)
+        tee, phi = new_moon, MoonPhase.NEW
+        for phase in (MoonPhase.FIRST_QUARTER, MoonPhase.FULL, MoonPhase.LAST_QUARTER):
+            approx = tee + (next_new_moon - tee) * (phase - phi) / (360 - phi)
+            tee = secant_angular(elongation, phase, approx, rate)
+            if tee is None:
+                tee = invert_angular(lunar_phase, phase, approx - 2, approx + 2)
+            phi = phase
+            if tee > end:
+                return
+            if start <= tee:
+                yield (tee, phase)
+        n, new_moon = n + 1, next_new_moon
+
+LUNAR_DISTANCE_ARGS_LUNAR_ELONGATION = \
+    (0, 2, 2, 0, 0, 0, 2, 2, 2, 2, 0, 1, 0, 2, 0, 0, 4, 0, 4, 2, 2, 1,
+     1, 2, 2, 4, 2, 0, 2, 2, 1, 2, 0, 0, 2, 2, 2, 4, 0, 3, 2, 4, 0, 2,
+     2, 2, 4, 0, 4, 1, 2, 0, 1, 3, 4, 2, 0, 1, 2, 2)
+
+LUNAR_DISTANCE_ARGS_SOLAR_ANOMALY = \
+    (0, 0, 0, 0, 1, 0, 0, -1, 0, -1, 1, 0, 1, 0, 0, 0, 0, 0, 0, 1, 1,
+     0, 1, -1, 0, 0, 0, 1, 0, -1, 0, -2, 1, 2, -2, 0, 0, -1, 0, 0, 1,
+     -1, 2, 2, 1, -1, 0, 0, -1, 0, 1, 0, 1, 0, 0, -1, 2, 1, 0, 0)
+
+LUNAR_DISTANCE_ARGS_LUNAR_ANOMALY = \
+    (1, -1, 0, 2, 0, 0, -2, -1, 1, 0, -1, 0, 1, 0, 1, 1, -1, 3, -2,
+     -1, 0, -1, 0, 1, 2, 0, -3, -2, -1, -2, 1, 0, 2, 0, -1, 1, 0,
+     -1, 2, -1, 1, -2, -1, -1, -2, 0, 1, 4, 0, -2, 0, 2, 1, -2, -3,
+     2, 1, -1, 3, -1)
+
+LUNAR_DISTANCE_ARGS_MOON_NODE = \
+    (0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, -2, 2, -2, 0, 0, 0, 0, 0,
+     0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, -2, 2, 0, 2, 0, 0, 0, 0,
+     0, 0, -2, 0, 0, 0, 0, -2, -2, 0, 0, 0, 0, 0, 0, 0, -2)
+
+LUNAR_DISTANCE_COSINE_COEFFICIENTS = \
+    (-20905355, -3699111, -2955968, -569925, 48888, -3149,
+     246158, -152138, -170733, -204586, -129620, 108743,
+     104755, 10321, 0, 79661, -34782, -23210, -21636, 24208,
+     30824, -8379, -16675, -12831, -10445, -11650, 14403,
+     -7003, 0, 10056, 6322, -9884, 5751, 0, -4950, 4130, 0,
+     -3958, 0, 3258, 2616, -1897, -2117, 2354, 0, 0, -1423,
+     -1117, -1571, -1739, 0, -4421, 0, 0, 0, 0, 1165, 0, 0,
+     8752)
+
+LUNAR_DISTANCE_SERIES = ArgumentSeries(
+    LUNAR_DISTANCE_COSINE_COEFFICIENTS,
+    (LUNAR_DISTANCE_ARGS_LUNAR_ELONGATION, LUNAR_DISTANCE_ARGS_SOLAR_ANOMALY,
+     LUNAR_DISTANCE_ARGS_LUNAR_ANOMALY, LUNAR_DISTANCE_ARGS_MOON_NODE),
+    map(abs, LUNAR_DISTANCE_ARGS_SOLAR_ANOMALY),
+    cosine=True)
+
 def lunar_distance(tee):
     """Return the distance to moon (in meters) at moment, tee.
     Adapted from "Astronomical Algorithms" by Jean Meeus,
@@ -319,44 +427,8 @@ def lunar_distance(tee):
     cap_M = solar_anomaly(c)
     cap_M_prime = lunar_anomaly(c)
     cap_F = moon_node(c)
-    cap_E = poly(c, [1, mpf(-0.002516), mpf(-0.0000074)])
-    args_lunar_elongation = \
-        [0, 2, 2, 0, 0, 0, 2, 2, 2, 2, 0, 1, 0, 2, 0, 0, 4, 0, 4, 2, 2, 1,
-         1, 2, 2, 4, 2, 0, 2, 2, 1, 2, 0, 0, 2, 2, 2, 4, 0, 3, 2, 4, 0, 2,
-         2, 2, 4, 0, 4, 1, 2, 0, 1, 3, 4, 2, 0, 1, 2, 2,]
-    args_solar_anomaly = \
-        [0, 0, 0, 0, 1, 0, 0, -1, 0, -1, 1, 0, 1, 0, 0, 0, 0, 0, 0, 1, 1,
-         0, 1, -1, 0, 0, 0, 1, 0, -1, 0, -2, 1, 2, -2, 0, 0, -1, 0, 0, 1,
-         -1, 2, 2, 1, -1, 0, 0, -1, 0, 1, 0, 1, 0, 0, -1, 2, 1, 0, 0]
-    args_lunar_anomaly = \
-        [1, -1, 0, 2, 0, 0, -2, -1, 1, 0, -1, 0, 1, 0, 1, 1, -1, 3, -2,
-         -1, 0, -1, 0, 1, 2, 0, -3, -2, -1, -2, 1, 0, 2, 0, -1, 1, 0,
-         -1, 2, -1, 1, -2, -1, -1, -2, 0, 1, 4, 0, -2, 0, 2, 1, -2, -3,
-         2, 1, -1, 3, -1]
-    args_moon_node = \
-        [0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, -2, 2, -2, 0, 0, 0, 0, 0,
-         0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, -2, 2, 0, 2, 0, 0, 0, 0,
-         0, 0, -2, 0, 0, 0, 0, -2, -2, 0, 0, 0, 0, 0, 0, 0, -2]
-    cosine_coefficients = \
-        [-20905355, -3699111, -2955968, -569925, 48888, -3149,
-         246158, -152138, -170733, -204586, -129620, 108743,
-         104755, 10321, 0, 79661, -34782, -23210, -21636, 24208,
-         30824, -8379, -16675, -12831, -10445, -11650, 14403,
-         -7003, 0, 10056, 6322, -9884, 5751, 0, -4950, 4130, 0,
-         -3958, 0, 3258, 2616, -1897, -2117, 2354, 0, 0, -1423,
-         -1117, -1571, -1739, 0, -4421, 0, 0, 0, 0, 1165, 0, 0,
-         8752]
-    correction = sigma ([cosine_coefficients,
-                         args_lunar_elongation,
-                         args_solar_anomaly,
-                         args_lunar_anomaly,
-                         args_moon_node],
-                        lambda v, w, x, y, z: (v *
-                                    pow(cap_E, abs(x)) * 
-                                    cos_degrees((w * cap_D) +
-                                                   (x * cap_M) +
-                                                   (y * cap_M_prime) +
-                                                   (z * cap_F))))
+    cap_E = poly(c, ECCENTRICITY_COEFFICIENTS)
+    correction = LUNAR_DISTANCE_SERIES((cap_D, cap_M, cap_M_prime, cap_F), cap_E)
     return 385000560 + correction
 
 def lunar_position(tee):
@@ -0,0 +1,81 @@
+from collections import namedtuple
+import numpy as np
+from jetblack.calendars.weekdays import DayOfWeek
+from jetblack.calendars.arrays import hebrew_toordinal, hebrew_is_leap_year
+from jetblack.calendars.systems.hebrew import HebrewDate, HebrewMonth
+
+# Molad (mean conjunction) tables in integer parts (halakim): a day has
+# 25920 parts, an hour 1080 and a minute 18.  Everything is computed for
+# arrays of months together, and exact.
+
+PARTS_PER_HOUR = 1080
+PARTS_PER_MINUTE = 18
+# The blessing of the new moon (birkath ha-levana) may be said from three
+# days after the molad until half a mean month after it.
+BLESSING_START_PARTS = 3 * HebrewDate.PARTS_PER_DAY
+BLESSING_END_PARTS = HebrewDate.MONTH_PARTS // 2
+
+# A moment as the ordinal date, the hour after midnight and the parts of
+# the hour.
+Molad = namedtuple('Molad', ['day', 'hour', 'parts'])
+# A molad as announced: the day of the week (as DayOfWeek), the hour and
+# minute after midnight and the remaining parts (chalakim) of the minute.
+MoladAnnouncement = namedtuple('MoladAnnouncement', ['weekday', 'hour', 'minute', 'chalakim'])
+# The new month, month, of Hebrew year, year: its molad, the Sabbath on
+# which it is announced, its days of Rosh Chodesh, and the first and last
+# moments for the blessing of the new moon.
+RoshChodesh = namedtuple('RoshChodesh', ['year', 'month', 'molad', 'sabbath', 'days', 'blessing_start', 'blessing_end'])
+
+def molad_from_parts(parts):
+    """Return the Molad of the moment, or moments, parts after the epoch."""
+    days, remainder = np.divmod(parts, HebrewDate.PARTS_PER_DAY)
+    hours, parts = np.divmod(remainder, PARTS_PER_HOUR)
+    return Molad(HebrewDate.EPOCH + days, hours, parts)
+
+def molad(month, year):
+    """Return the Molad of month in Hebrew year, year, which may be arrays."""
+    return molad_from_parts(HebrewDate.molad_parts(np.asarray(month, dtype=np.int64), np.asarray(year, dtype=np.int64)))
+
+def announcement(m):
+    """Return the MoladAnnouncement of Molad, m."""
+    minutes, chalakim = np.divmod(m.parts, PARTS_PER_MINUTE)
+    return MoladAnnouncement((m.day - 1) % 7, m.hour, minutes, chalakim)
+
+def months_of_years(start_year, end_year):
+    """Return the years and months of the Hebrew years start_year to
+    end_year inclusive, as arrays in the order of the months."""
+    years = np.arange(start_year, end_year + 1)
+    leap = hebrew_is_leap_year(years)
+    months = np.tile(np.arange(13), (len(years), 1))
+    months = (months + HebrewMonth.TISHRI - 1) % 13 + 1
+    # In a common year Nisan follows Adar, and the thirteenth month is dropped.
+    months = np.where(leap[:, np.newaxis], months, np.where(months == HebrewMonth.ADARII, 0, months))
+    keep = months > 0
+    return np.broadcast_to(years[:, np.newaxis], months.shape)[keep], months[keep]
+
+def molads(start_year, end_year):
+    """Return the years, months and Molads of the Hebrew years start_year to
+    end_year inclusive, as arrays in the order of the months."""
+    years, months = months_of_years(start_year, end_year)
+    return years, months, molad(months, years)
+
+def rosh_chodesh_table(start_year, end_year):
+    """Return the RoshChodesh of each month of the Hebrew years start_year
+    to end_year inclusive, but Tishri, which is not announced."""
+    years, months = months_of_years(start_year, end_year)
+    keep = months != HebrewMonth.TISHRI
+    years, months = years[keep], months[keep]
+    parts = HebrewDate.molad_parts(months, years)
+    first = hebrew_toordinal(years, months, 1)
+    # Rosh Chodesh is also the thirtieth of the month before, if it has one.
+    previous = np.where(months == HebrewMonth.NISAN,
+                        np.where(hebrew_is_leap_year(years), HebrewMonth.ADARII, HebrewMonth.ADAR), months - 1)
+    start = np.where(first - hebrew_toordinal(years, previous, 1) == 30, first - 1, first)
+    # The Sabbath before Rosh Chodesh.
+    sabbath = start - 1 - (start - 1 - DayOfWeek.SATURDAY - 1) % 7
+    rows = zip(years.tolist(), months.tolist(), zip(*molad_from_parts(parts)), sabbath.tolist(),
+               start.tolist(), first.tolist(), zip(*molad_from_parts(parts + BLESSING_START_PARTS)),
+               zip(*molad_from_parts(parts + BLESSING_END_PARTS)))
+    return [RoshChodesh(year, month, Molad(*map(int, m)), sabbath, tuple(range(start_day, first_day + 1)),
+                        Molad(*map(int, begin)), Molad(*map(int, end)))
+            for year, month, m, sabbath, start_day, first_day, begin, end in rows]
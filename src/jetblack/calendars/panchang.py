@@ -0,0 +1,110 @@
+import numpy as np
+from jetblack.calendars.utils import amod
+from jetblack.calendars.trigonometry import angle
+from jetblack.calendars.events import CrossingFinder
+from jetblack.calendars.systems.hindu import HinduDate, HinduLunarDate
+
+# The five limbs of the Hindu almanac: the lunar day (tithi), the lunar
+# station (nakshatra), yoga, half lunar day (karana) and weekday (vara).
+
+NAKSHATRA = angle(0, 800, 0)
+
+def _lunar_longitude(tee):
+    return HinduLunarDate.lunar_longitude(tee)
+
+def _lunar_phase(tee):
+    return HinduLunarDate.lunar_phase(tee)
+
+def _yoga_longitude(tee):
+    return (HinduDate.solar_longitude(tee) + HinduLunarDate.lunar_longitude(tee)) % 360
+
+LUNAR_LONGITUDE_CROSSINGS = CrossingFinder(_lunar_longitude, 360 / HinduLunarDate.SIDEREAL_MONTH,
+                                           angular=True, window=0.5, vectorized=True)
+LUNAR_PHASE_CROSSINGS = CrossingFinder(_lunar_phase, 360 / HinduLunarDate.SYNODIC_MONTH,
+                                       angular=True, window=0.5, vectorized=True)
+YOGA_CROSSINGS = CrossingFinder(_yoga_longitude, 360 / HinduLunarDate.SIDEREAL_MONTH + 360 / HinduDate.SIDEREAL_YEAR,
+                                angular=True, window=0.5, vectorized=True)
+
+def karana(n):
+    """Return the number (0-10) of the name of each of an array of Hindu
+    karanas, n (1-60), as the function of that name in hindu.py."""
+    return np.where(n == 1, 0, np.where(n > 57, n - 50, amod(n - 1, 7)))
+
+class Panchang(object):
+    """The panchang on the ordinal dates start to end inclusive, at sunrise
+    at location (by default the Hindu sunrise at Ujjain).
+
+    Sunrise is found once for each day, and the solar and lunar longitudes
+    evaluated once for all the sunrises together; each limb is derived from
+    them.  The moments at which each limb ends are found, for all the days
+    together, when first asked for.  Moments are Ujjain times."""
+
+    def __init__(self, start, end, location=None):
+        self.location = location
+        self.dates = np.arange(start, end + 1)
+        if location is None:
+            sunrise = [HinduDate.sunrise(int(date)) for date in self.dates]
+        else:
+            sunrise = [HinduDate.UJJAIN.standard_from_universal(location.universal_from_standard(location.sunrise(int(date))))
+                       for date in self.dates]
+        self.sunrise = np.array(sunrise, dtype=float)
+        self.solar_longitude = HinduDate.solar_longitude(self.sunrise)
+        self.lunar_longitude = HinduLunarDate.lunar_longitude(self.sunrise)
+        self.lunar_phase = (self.lunar_longitude - self.solar_longitude) % 360
+        self._ends = {}
+
+    @property
+    def tithi(self):
+        """Return the lunar day (1-30) at sunrise on each date."""
+        return np.floor(self.lunar_phase / 12).astype(int) + 1
+
+    @property
+    def nakshatra(self):
+        """Return the lunar station (1-27) at sunrise on each date."""
+        return np.floor(self.lunar_longitude / NAKSHATRA).astype(int) + 1
+
+    @property
+    def yoga(self):
+        """Return the yoga (1-27) at sunrise on each date."""
+        return np.floor(((self.solar_longitude + self.lunar_longitude) / NAKSHATRA) % 27).astype(int) + 1
+
+    @property
+    def karana_number(self):
+        """Return the number (1-60) of the karana at sunrise on each date."""
+        return np.floor(self.lunar_phase / 6).astype(int) + 1
+
+    @property
+    def karana(self):
+        """Return the number (0-10) of the name of the karana at sunrise on
+        each date."""
+        return karana(self.karana_number)
+
+    @property
+    def vara(self):
+        """Return the DayOfWeek of each date, as integers."""
+        return (self.dates - 1) % 7
+
+    def _end(self, name, finder, y):
+        if name not in self._ends:
+            self._ends[name] = finder.first_array(y % 360, self.sunrise)
+        return self._ends[name]
+
+    @property
+    def tithi_end(self):
+        """Return the moment the tithi at sunrise ends on each date."""
+        return self._end('tithi', LUNAR_PHASE_CROSSINGS, 12 * self.tithi)
+
+    @property
+    def nakshatra_end(self):
+        """Return the moment the nakshatra at sunrise ends on each date."""
+        return self._end('nakshatra', LUNAR_LONGITUDE_CROSSINGS, NAKSHATRA * self.nakshatra)
+
+    @property
+    def yoga_end(self):
+        """Return the moment the yoga at sunrise ends on each date."""
+        return self._end('yoga', YOGA_CROSSINGS, NAKSHATRA * self.yoga)
+
+    @property
+    def karana_end(self):
+        """Return the moment the karana at sunrise ends on each date."""
+        return self._end('karana', LUNAR_PHASE_CROSSINGS, 6 * self.karana_number)
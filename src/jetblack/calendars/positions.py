@@ -0,0 +1,197 @@
+from collections import namedtuple
+import numpy as np
+from jetblack.calendars.utils import poly
+from jetblack.calendars.arrays import gregorian_year, gregorian_new_year, gregorian_toordinal
+from jetblack.calendars.astrological import J2000
+from jetblack.calendars.solar import SOLAR_LONGITUDE_SERIES
+from jetblack.calendars.lunar import LUNAR_LONGITUDE_SERIES, LUNAR_LATITUDE_SERIES
+
+# Float counterparts of the series in astrological.py, solar.py and lunar.py,
+# evaluated over arrays of moments.
+
+Coordinates = namedtuple('Coordinates', ['longitude', 'latitude', 'right_ascension', 'declination', 'altitude', 'azimuth'])
+
+_J2000 = float(J2000)
+
+def _sin(theta):
+    return np.sin(np.radians(theta))
+
+def _cos(theta):
+    return np.cos(np.radians(theta))
+
+def ephemeris_correction(tee):
+    """Return Dynamical Time minus Universal Time (in days) for an array
+    of moments, tee."""
+    year = gregorian_year(np.floor(tee))
+    c = (gregorian_toordinal(year, 7, 1) - gregorian_toordinal(1900, 1, 1)) / 36525.0
+    x = 0.5 + (gregorian_new_year(year) - gregorian_new_year(1810))
+    return np.select(
+        [(1988 <= year) & (year <= 2019),
+         (1900 <= year) & (year <= 1987),
+         (1800 <= year) & (year <= 1899),
+         (1700 <= year) & (year <= 1799),
+         (1620 <= year) & (year <= 1699)],
+        [(year - 1933) / 86400,
+         poly(c, [-0.00002, 0.000297, 0.025184, -0.181133, 0.553040, -0.861938, 0.677066, -0.212591]),
+         poly(c, [-0.000009, 0.003844, 0.083563, 0.865736, 4.867575, 15.845535, 31.332267, 38.291999,
+                  28.316289, 11.636204, 2.043794]),
+         poly(year - 1700, [8.118780842, -0.005092142, 0.003336121, -0.0000266484]) / 86400,
+         poly(year - 1600, [196.58333, -4.0675, 0.0219167]) / 86400],
+        (((x * x) / 41048480) - 15) / 86400)
+
+def julian_centuries(tee):
+    """Return Julian centuries since 2000 for an array of moments, tee."""
+    return (tee + ephemeris_correction(tee) - _J2000) / 36525
+
+def obliquity(c):
+    """Return (mean) obliquity of ecliptic at Julian centuries c."""
+    return 23 + (26 + 21.448 / 60) / 60 + poly(c, [0, -46.8150, -0.00059, 0.001813]) / 3600
+
+def nutation(c):
+    """Return the longitudinal nutation at Julian centuries c."""
+    cap_A = poly(c, [124.90, -1934.134, 0.002063])
+    cap_B = poly(c, [201.11, 72001.5377, 0.00057])
+    return -0.004778 * _sin(cap_A) - 0.0003667 * _sin(cap_B)
+
+def aberration(c):
+    """Return the aberration at Julian centuries c."""
+    return 0.0000974 * _cos(177.63 + 35999.01848 * c) - 0.005575
+
+def equation_of_time(c):
+    """Return the equation of time (as fraction of day) at Julian
+    centuries c."""
+    lamb = poly(c, [280.46645, 36000.76983, 0.0003032])
+    anomaly = poly(c, [357.52910, 35999.05030, -0.0001559, -0.00000048])
+    eccentricity = poly(c, [0.016708617, -0.000042037, -0.0000001236])
+    y = np.tan(np.radians(obliquity(c) / 2)) ** 2
+    equation = ((0.5 / np.pi) *
+                (y * _sin(2 * lamb) +
+                 -2 * eccentricity * _sin(anomaly) +
+                 4 * eccentricity * y * _sin(anomaly) * _cos(2 * lamb) +
+                 -0.5 * y * y * _sin(4 * lamb) +
+                 -1.25 * eccentricity * eccentricity * _sin(2 * anomaly)))
+    return np.clip(equation, -0.5, 0.5)
+
+def precession(c):
+    """Return the precession at Julian centuries c using 0,0 as J2000
+    coordinates."""
+    eta = poly(c, [0, 47.0029 / 3600, -0.03302 / 3600, 0.000060 / 3600]) % 360
+    cap_P = poly(c, [174.876384, -869.8089 / 3600, 0.03536 / 3600]) % 360
+    p = poly(c, [0, 5029.0966 / 3600, 1.11113 / 3600, 0.000006 / 3600]) % 360
+    arg = np.degrees(np.arctan2(_cos(eta) * _sin(cap_P), _cos(cap_P))) % 360
+    return (p + cap_P - arg) % 360
+
+def sidereal_from_moment(tee):
+    """Return the mean sidereal time of day for an array of moments, tee,
+    expressed as hour angle."""
+    c = (tee - _J2000) / 36525
+    return poly(c, [280.46061837, 36525 * 360.98564736629, 0.000387933, -1 / 38710000]) % 360
+
+def solar_longitude(c, nut):
+    """Return the longitude of the sun at Julian centuries c given the
+    nutation, nut."""
+    lam = 282.7771834 + 36000.76953744 * c + 0.000005729577951308232 * SOLAR_LONGITUDE_SERIES.evaluate(c)
+    return (lam + aberration(c) + nut) % 360
+
+def solar_declination(c):
+    """Return the declination of the sun at Julian centuries c."""
+    lam = solar_longitude(c, nutation(c))
+    return np.degrees(np.arcsin(_sin(obliquity(c)) * _sin(lam)))
+
+def _lunar_arguments(c):
+    """Return the mean elements (L', D, M, M', F, E) of the lunar theory."""
+    return (poly(c, [218.3164477, 481267.88123421, -0.0015786, 1 / 538841.0, -1 / 65194000.0]) % 360,
+            poly(c, [297.8501921, 445267.1114034, -0.0018819, 1 / 545868.0, -1 / 113065000.0]) % 360,
+            poly(c, [357.5291092, 35999.0502909, -0.0001536, 1 / 24490000.0]) % 360,
+            poly(c, [134.9633964, 477198.8675055, 0.0087414, 1 / 69699.0, -1 / 14712000.0]) % 360,
+            poly(c, [93.2720950, 483202.0175233, -0.0036539, -1 / 3526000.0, 1 / 863310000.0]) % 360,
+            poly(c, [1, -0.002516, -0.0000074]))
+
+def _lunar_series(series, arguments):
+    _, cap_D, cap_M, cap_M_prime, cap_F, cap_E = arguments
+    return series.evaluate((cap_D, cap_M, cap_M_prime, cap_F), cap_E) / 1000000
+
+def lunar_longitude(c, nut, arguments=None):
+    """Return the longitude of the moon at Julian centuries c given the
+    nutation, nut."""
+    arguments = _lunar_arguments(c) if arguments is None else arguments
+    cap_L_prime, _, _, _, cap_F, _ = arguments
+    correction = _lunar_series(LUNAR_LONGITUDE_SERIES, arguments)
+    venus = (3958 / 1000000) * _sin(119.75 + c * 131.849)
+    jupiter = (318 / 1000000) * _sin(53.09 + c * 479264.29)
+    flat_earth = (1962 / 1000000) * _sin(cap_L_prime - cap_F)
+    return (cap_L_prime + correction + venus + jupiter + flat_earth + nut) % 360
+
+def lunar_latitude(c, arguments=None):
+    """Return the latitude of the moon at Julian centuries c."""
+    arguments = _lunar_arguments(c) if arguments is None else arguments
+    cap_L_prime, _, _, cap_M_prime, cap_F, _ = arguments
+    beta = _lunar_series(LUNAR_LATITUDE_SERIES, arguments)
+    venus = (175 / 1000000) * (_sin(119.75 + c * 131.849 + cap_F) + _sin(119.75 + c * 131.849 - cap_F))
+    flat_earth = ((-2235 / 1000000) * _sin(cap_L_prime) +
+                  (127 / 1000000) * _sin(cap_L_prime - cap_M_prime) +
+                  (-115 / 1000000) * _sin(cap_L_prime + cap_M_prime))
+    extra = (382 / 1000000) * _sin(313.45 + c * 481266.484)
+    return beta + venus + flat_earth + extra
+
+def equatorial_from_ecliptic(lam, beta, varepsilon):
+    """Return the right ascension and declination of an object at
+    ecliptic longitude lam and latitude beta, given the obliquity varepsilon."""
+    right_ascension = np.degrees(np.arctan2(
+        _sin(lam) * _cos(varepsilon) - np.tan(np.radians(beta)) * _sin(varepsilon),
+        _cos(lam))) % 360
+    declination = np.degrees(np.arcsin(
+        _sin(beta) * _cos(varepsilon) + _cos(beta) * _sin(varepsilon) * _sin(lam)))
+    return right_ascension, declination
+
+def horizontal_from_equatorial(right_ascension, declination, sidereal, location):
+    """Return the geocentric altitude and the azimuth (clockwise from
+    North) of an object at location, given the mean sidereal time."""
+    phi = float(location.latitude)
+    cap_H = (sidereal + float(location.longitude) - right_ascension) % 360
+    altitude = np.degrees(np.arcsin(_sin(phi) * _sin(declination) + _cos(phi) * _cos(declination) * _cos(cap_H)))
+    azimuth = (np.degrees(np.arctan2(_sin(cap_H), _cos(cap_H) * _sin(phi) - np.tan(np.radians(declination)) * _cos(phi))) + 180) % 360
+    return altitude, azimuth
+
+class Positions(object):
+    """Ecliptic, equatorial and (given a location) horizontal coordinates
+    of the sun and moon at an array of moments (UT).
+
+    The time scale, obliquity, nutation and sidereal time are computed
+    once and shared by both bodies. Altitudes are geocentric, ignoring
+    parallax and refraction."""
+
+    def __init__(self, tee, location=None):
+        self.tee = np.asarray(tee, dtype=float)
+        self.location = location
+        self.c = julian_centuries(self.tee)
+        self.obliquity = obliquity(self.c)
+        self.nutation = nutation(self.c)
+        self.sidereal = sidereal_from_moment(self.tee)
+        self._sun = None
+        self._moon = None
+
+    def _coordinates(self, lam, beta):
+        right_ascension, declination = equatorial_from_ecliptic(lam, beta, self.obliquity)
+        if self.location is None:
+            altitude, azimuth = None, None
+        else:
+            altitude, azimuth = horizontal_from_equatorial(right_ascension, declination, self.sidereal, self.location)
+        return Coordinates(lam, beta, right_ascension, declination, altitude, azimuth)
+
+    @property
+    def sun(self):
+        """Return the coordinates of the sun."""
+        if self._sun is None:
+            lam = solar_longitude(self.c, self.nutation)
+            self._sun = self._coordinates(lam, np.zeros_like(lam))
+        return self._sun
+
+    @property
+    def moon(self):
+        """Return the coordinates of the moon."""
+        if self._moon is None:
+            arguments = _lunar_arguments(self.c)
+            self._moon = self._coordinates(lunar_longitude(self.c, self.nutation, arguments),
+                                           lunar_latitude(self.c, arguments))
+        return self._moon
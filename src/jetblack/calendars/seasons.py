@@ -1,13 +1,65 @@
+from collections import OrderedDict
 from enum import IntEnum
 from datetime import datetime, timedelta
 import math
-    
+import numpy as np
+from jetblack.calendars.utils import poly
+from jetblack.calendars.series import PhaseSeries
+
 class Season(IntEnum):
     SPRING = 0
     SUMMER = 90
     AUTUMN = 180
     WINTER = 270
 
+# The Julian day number of the ordinal date 0.
+JULIAN_DAY_OFFSET = 1721424.5
+
+# Meeus Table 27.C: polynomial coefficients (in y = (year - 2000) / 1000)
+# of the mean equinox or solstice, one row per season.
+EQUINOX_ESTIMATES = (
+    (2451623.80984, 365242.37404, 0.05169, -0.00411, -0.00057),
+    (2451716.56767, 365241.62603, 0.00325, 0.00888, -0.00030),
+    (2451810.21715, 365242.01767, -0.11575, 0.00337, 0.00078),
+    (2451900.05952, 365242.74049, -0.06223, -0.00823, 0.00032))
+
+# Meeus Table 27.C: the 24 periodic terms A cos(B + C T).
+PERIODIC24_A = (485, 203, 199, 182, 156, 136,
+                77, 74, 70, 58, 52, 50,
+                45, 44, 29, 18, 17, 16,
+                14, 12, 12, 12, 9, 8)
+PERIODIC24_B = (324.96, 337.23, 342.08, 27.85, 73.14, 171.52,
+                222.54, 296.72, 243.58, 119.81, 297.17, 21.02,
+                247.54, 325.15, 60.93, 155.12, 288.79, 198.04,
+                199.76, 95.39, 287.11, 320.81, 227.73, 15.45)
+PERIODIC24_C = (1934.136, 32964.467, 20.186, 445267.112, 45036.886, 22518.443,
+                65928.934, 3034.906, 9037.513, 33718.147, 150.678, 2281.226,
+                29929.562, 31555.956, 4443.417, 67555.328, 4562.452, 62894.029,
+                31436.921, 14577.848, 31931.756, 34777.259, 1222.114, 16859.074)
+
+# Delta T (TDT - UTC) in seconds for every even year from 1620 to 2002.
+DELTA_T_FIRST_YEAR = 1620
+DELTA_T_LAST_YEAR = 2002
+DELTA_T_SECONDS = (
+     121, 112, 103, 95, 88, 82, 77, 72, 68, 63, 60, 56, 53, 51, 48, 46, 44, 42, 40, 38, # from 1620
+    35, 33, 31, 29, 26, 24, 22, 20, 18, 16, 14, 12, 11, 10, 9, 8, 7, 7, 7, 7, # from 1660  
+       7, 7, 8, 8, 9, 9, 9, 9, 9, 10, 10, 10, 10, 10, 10, 10, 10, 11, 11, 11, # from 1700
+    11, 11, 12, 12, 12, 12, 13, 13, 13, 14, 14, 14, 14, 15, 15, 15, 15, 15, 16, 16, # from 1740
+    16, 16, 16, 16, 16, 16, 15, 15, 14, 13, # from 1780
+    13.1, 12.5, 12.2, 12.0, 12.0, 12.0, 12.0, 12.0, 12.0, 11.9, 11.6, 11.0, 10.2, 9.2, 8.2, # from 1800
+    7.1, 6.2, 5.6, 5.4, 5.3, 5.4, 5.6, 5.9, 6.2, 6.5, 6.8, 7.1, 7.3, 7.5, 7.6, # from 1830
+    7.7, 7.3, 6.2, 5.2, 2.7, 1.4, -1.2, -2.8, -3.8, -4.8, -5.5, -5.3, -5.6, -5.7, -5.9, # from 1860
+    -6.0, -6.3, -6.5, -6.2, -4.7, -2.8, -0.1, 2.6, 5.3, 7.7, 10.4, 13.3, 16.0, 18.2, 20.2, # from 1890
+    21.1, 22.4, 23.5, 23.8, 24.3, 24.0, 23.9, 23.9, 23.7, 24.0, 24.3, 25.3, 26.2, 27.3, 28.2, # from 1920
+    29.1, 30.0, 30.7, 31.4, 32.2, 33.1, 34.0, 35.0, 36.5, 38.3, 40.2, 42.2, 44.5, 46.5, 48.5, # from 1950
+    50.5, 52.5, 53.8, 54.9, 55.8, 56.9, 58.3, 60.0, 61.6, 63.0, 63.8, 64.3 # from 1980 to 2002
+)
+
+PERIODIC24_SERIES = PhaseSeries(PERIODIC24_A, PERIODIC24_B, PERIODIC24_C, cosine=True)
+_DELTA_T = np.array(DELTA_T_SECONDS, dtype=float)
+EQUINOX_CACHE_SIZE = 256
+_EQUINOX_CACHE = OrderedDict()
+
 def equinox(year, season):
     """
     Calculate and Display a single event for a single year (Either a Equiniox or Solstice).
@@ -30,17 +82,9 @@ def estimateEquinox(year, season):
     Meeus Astronmical Algorithms Chapter 27
     """
     # Valid for years 1000 to 3000
-    y = (year - 2000) / 1000.0;
-    if season == Season.SPRING:
-        return 2451623.80984 + 365242.37404 * y + 0.05169 * (y * y) - 0.00411 * (y * y * y) - 0.00057 * (y * y * y * y)
-    elif season == season.SUMMER:
-        return 2451716.56767 + 365241.62603 * y + 0.00325 * (y * y) + 0.00888 * (y * y * y) - 0.00030 * (y * y * y * y)
-    elif season == Season.AUTUMN:
-        return 2451810.21715 + 365242.01767 * y - 0.11575 * (y * y) + 0.00337 * (y * y * y) + 0.00078 * (y * y * y * y)
-    elif season == Season.WINTER:
-        return 2451900.05952 + 365242.74049 * y - 0.06223 * (y * y) - 0.00823 * (y * y * y) + 0.00032 * (y * y * y * y)
-    else:
+    if season not in (Season.SPRING, Season.SUMMER, Season.AUTUMN, Season.WINTER):
         raise ValueError("Unknown season")
+    return poly((year - 2000) / 1000.0, EQUINOX_ESTIMATES[season // 90])
     
 def periodic24(T):
     """
@@ -48,29 +92,7 @@ def periodic24(T):
     
     Meeus Astronmical Algorithms Chapter 27
     """
-    a = [
-        485, 203, 199, 182, 156, 136,
-        77, 74, 70, 58, 52, 50,
-        45, 44, 29, 18, 17, 16,
-        14, 12, 12, 12, 9, 8
-    ]
-    b = [
-        324.96, 337.23, 342.08, 27.85, 73.14, 171.52,
-        222.54, 296.72, 243.58, 119.81, 297.17, 21.02,
-        247.54, 325.15, 60.93, 155.12, 288.79, 198.04,
-        199.76, 95.39, 287.11, 320.81, 227.73, 15.45
-    ]
-    c = [
-        1934.136, 32964.467, 20.186, 445267.112, 45036.886, 22518.443,
-        65928.934, 3034.906, 9037.513, 33718.147, 150.678, 2281.226,
-        29929.562, 31555.956, 4443.417, 67555.328, 4562.452, 62894.029,
-        31436.921, 14577.848, 31931.756, 34777.259, 1222.114, 16859.074
-    ]
-
-    s = 0.0;
-    for i in range(24):
-        s += a[i] * cosFromDeg(b[i] + c[i] * T);
-    return s;
+    return PERIODIC24_SERIES.evaluate(T)
     
 def fromTdTtoUtc(tdt):
     """
@@ -81,48 +103,62 @@ def fromTdTtoUtc(tdt):
     tdt: >Date as a Terrestrial Dynamic Time
     """
     
-    # Correction lookup table has entry for every even year between TBLfirst and TBLlast
-    firstCorrectionYear = 1620
-    lastCorrectionYear = 2002
-    correctionInSeconds = [
-         121, 112, 103, 95, 88, 82, 77, 72, 68, 63, 60, 56, 53, 51, 48, 46, 44, 42, 40, 38, # from 1620
-        35, 33, 31, 29, 26, 24, 22, 20, 18, 16, 14, 12, 11, 10, 9, 8, 7, 7, 7, 7, # from 1660  
-           7, 7, 8, 8, 9, 9, 9, 9, 9, 10, 10, 10, 10, 10, 10, 10, 10, 11, 11, 11, # from 1700
-        11, 11, 12, 12, 12, 12, 13, 13, 13, 14, 14, 14, 14, 15, 15, 15, 15, 15, 16, 16, # from 1740
-        16, 16, 16, 16, 16, 16, 15, 15, 14, 13, # from 1780
-        13.1, 12.5, 12.2, 12.0, 12.0, 12.0, 12.0, 12.0, 12.0, 11.9, 11.6, 11.0, 10.2, 9.2, 8.2, # from 1800
-        7.1, 6.2, 5.6, 5.4, 5.3, 5.4, 5.6, 5.9, 6.2, 6.5, 6.8, 7.1, 7.3, 7.5, 7.6, # from 1830
-        7.7, 7.3, 6.2, 5.2, 2.7, 1.4, -1.2, -2.8, -3.8, -4.8, -5.5, -5.3, -5.6, -5.7, -5.9, # from 1860
-        -6.0, -6.3, -6.5, -6.2, -4.7, -2.8, -0.1, 2.6, 5.3, 7.7, 10.4, 13.3, 16.0, 18.2, 20.2, # from 1890
-        21.1, 22.4, 23.5, 23.8, 24.3, 24.0, 23.9, 23.9, 23.7, 24.0, 24.3, 25.3, 26.2, 27.3, 28.2, # from 1920
-        29.1, 30.0, 30.7, 31.4, 32.2, 33.1, 34.0, 35.0, 36.5, 38.3, 40.2, 42.2, 44.5, 46.5, 48.5, # from 1950
-        50.5, 52.5, 53.8, 54.9, 55.8, 56.9, 58.3, 60.0, 61.6, 63.0, 63.8, 64.3 # from 1980 to 2002
-    ]
-
-    # Values for Delta T for 2000 thru 2002 from NASA
-    deltaT = 0 # deltaT = TDT - UTC (in Seconds)
-    year = tdt.year
+    return tdt - timedelta(seconds = float(delta_t(tdt.year)))
+
+def delta_t(year):
+    """
+    Return Delta T (TDT - UTC) in seconds for a year or an array of years.
+
+    Meeus Astronmical Algroithms Chapter 10
+    """
+    year = np.asarray(year, dtype=np.int64)
     t = (year - 2000) / 100.0 # Centuries from the epoch 2000.0
+    # Find the correction in the table, interpolating odd years.
+    index = np.clip((year - DELTA_T_FIRST_YEAR) // 2, 0, len(_DELTA_T) - 1)
+    tabulated = np.where(year % 2 == 0, _DELTA_T[index], (_DELTA_T[index] + _DELTA_T[np.minimum(index + 1, len(_DELTA_T) - 1)]) / 2)
+    # Special correction to avoid discontinurity in 2000
+    recent = 102 + 102 * t + 25.3 * (t * t) + np.where((2000 <= year) & (year <= 2100), 0.37 * (year - 2100), 0)
+    return np.select([(DELTA_T_FIRST_YEAR <= year) & (year <= DELTA_T_LAST_YEAR), year < 948],
+                     [tabulated, 2177 + 497 * t + 44.1 * (t * t)],
+                     recent)
 
-    if year >= firstCorrectionYear and year <= lastCorrectionYear:
-        # Find correction in table
-        if year % 2 != 0:
-            # Odd year - interpolate
-            deltaT = (correctionInSeconds[(year - firstCorrectionYear - 1) / 2] + correctionInSeconds[(year - firstCorrectionYear + 1) / 2]) / 2
-        else:
-            # Even year - direct table lookup
-            deltaT = correctionInSeconds[(year - firstCorrectionYear) / 2]
-    elif year < 948:
-        deltaT = 2177 + 497 * t + 44.1 * (t * t)
-    elif year >= 948:
-        deltaT = 102 + 102 * t + 25.3 * (t * t)
-        if year >= 2000 and year <= 2100:
-            # Special correction to avoid discontinurity in 2000
-            deltaT += 0.37 * (year - 2100);
-    else:
-        raise ValueError("Error: TDT to UTC correction not computed")
-    
-    return tdt - timedelta(seconds = deltaT)
+def equinoxes(years):
+    """
+    Return the moments (UT, as ordinal dates with fraction) of the four
+    equinoxes and solstices for an array of years, as an array of shape
+    (len(years), 4) in the order of Season.  Add JULIAN_DAY_OFFSET for
+    Julian days.
+
+    Meeus Astronmical Algorithms Chapter 27
+    """
+    years = np.atleast_1d(np.asarray(years, dtype=np.int64))
+    y = ((years - 2000) / 1000.0)[:, np.newaxis]
+    estimate = poly(y, np.array(EQUINOX_ESTIMATES).T)
+    t = (estimate - 2451545.0) / 36525
+    w = 35999.373 * t - 2.47
+    dL = 1 + 0.0334 * np.cos(np.radians(w)) + 0.0007 * np.cos(np.radians(2 * w))
+    julianEmphemerisDays = estimate + ((0.00001 * periodic24(t)) / dL)
+    return julianEmphemerisDays - delta_t(years)[:, np.newaxis] / 86400 - JULIAN_DAY_OFFSET
+
+def year_equinoxes(year):
+    """
+    Return the moments (UT) of the four equinoxes and solstices of a
+    year as a tuple in the order of Season.  A miss computes the years
+    around it together; the most recently used EQUINOX_CACHE_SIZE years
+    are kept.
+    """
+    try:
+        record = _EQUINOX_CACHE[year]
+    except KeyError:
+        years = range(year - 5, year + 6)
+        for y, moments in zip(years, equinoxes(years)):
+            if y not in _EQUINOX_CACHE:
+                _EQUINOX_CACHE[y] = tuple(float(m) for m in moments)
+        record = _EQUINOX_CACHE[year]
+        while len(_EQUINOX_CACHE) > EQUINOX_CACHE_SIZE:
+            _EQUINOX_CACHE.popitem(last=False)
+    _EQUINOX_CACHE.move_to_end(year)
+    return record
 
 def fromJDtoUtc(julianDate):
     """
@@ -138,14 +174,14 @@ def fromJDtoUtc(julianDate):
         a = z
     else:
         alpha = int(math.floor((z - 1867216.25) / 36524.25))
-        a = z + 1 + alpha - alpha / 4;
+        a = z + 1 + alpha - alpha // 4
     b = a + 1524
     c = int(math.floor((b - 122.1) / 365.25))
     d = int(math.floor(365.25 * c))
     e = int(math.floor((b - d) / 30.6001))
     dayOfMonth = b - d - int(math.floor(30.6001 * e)) + f # Day of Month with decimals for time
     month = e - (1 if e < 13.5 else 13)
-    year = c - 4716 if month > 2.5 else 4715
+    year = c - 4716 if month > 2.5 else c - 4715
     day = int(math.floor(dayOfMonth))
     h = 24 * (dayOfMonth - day); # Hours and fractional hours 
     hour = int(math.floor(h))
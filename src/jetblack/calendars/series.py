@@ -0,0 +1,141 @@
+import math
+import numpy as np
+from jetblack.calendars.jit import jit, HAS_NUMBA
+from jetblack.calendars.trigonometry import sin_degrees, cos_degrees, trig_backend, MPMATH_BACKEND
+
+# The periodic series of the solar and lunar theories.  Each table is built
+# once, held as tuples for exact evaluation with mpmath and packed into
+# float arrays for evaluation over numpy arrays.  Calling a series evaluates
+# it with the global trigonometry backend: with the float backend a scalar
+# kernel is used, compiled by numba when it is available.
+
+@jit
+def argument_series_kernel(coefficients, multipliers, powers, arguments, cap_E, cosine):
+    """Return the sum of an ArgumentSeries at float arguments, given the
+    multipliers of each term as a row."""
+    total = 0.0
+    for i in range(len(coefficients)):
+        theta = 0.0
+        for j in range(len(arguments)):
+            theta += multipliers[i][j] * arguments[j]
+        factor = 1.0
+        for _ in range(powers[i]):
+            factor *= cap_E
+        theta = math.radians(theta)
+        total += coefficients[i] * factor * (math.cos(theta) if cosine else math.sin(theta))
+    return total
+
+@jit
+def phase_series_kernel(coefficients, addends, multipliers, t, cosine):
+    """Return the sum of a PhaseSeries at float t."""
+    total = 0.0
+    for i in range(len(coefficients)):
+        theta = math.radians(addends[i] + multipliers[i] * t)
+        total += coefficients[i] * (math.cos(theta) if cosine else math.sin(theta))
+    return total
+
+def _kernel_table(values, dtype=float):
+    # Arrays for the compiled kernels, or tuples, which are faster to index
+    # from plain Python.
+    if HAS_NUMBA:
+        return np.ascontiguousarray(values, dtype=dtype)
+    return tuple(tuple(map(dtype, row)) if isinstance(row, tuple) else dtype(row) for row in values)
+
+class ArgumentSeries(object):
+    """The series of terms c * E^p * trig(m[0] * x[0] + m[1] * x[1] + ...),
+    for coefficients c, powers p of the eccentricity factor E, and a row
+    of multipliers m of the arguments x, for each term."""
+
+    def __init__(self, coefficients, multipliers, powers, cosine=False):
+        self.coefficients = tuple(coefficients)
+        self.multipliers = tuple(zip(*multipliers))
+        self.powers = tuple(powers)
+        self.cosine = cosine
+        self.packed = (np.array(self.coefficients, dtype=float),
+                       np.array(multipliers, dtype=float),
+                       np.array(self.powers, dtype=int))
+        self._kernel_tables = (_kernel_table(self.coefficients),
+                               _kernel_table(self.multipliers),
+                               _kernel_table(self.powers, int))
+
+    def __call__(self, arguments, cap_E=1):
+        """Return the sum of the series at arguments: over arrays if any
+        argument is one, otherwise with the global trigonometry backend
+        (in floats unless it is mpmath)."""
+        if any(isinstance(x, np.ndarray) for x in arguments):
+            return self.evaluate(arguments, cap_E)
+        if trig_backend() is not MPMATH_BACKEND:
+            return self.scalar(arguments, cap_E)
+        trig = cos_degrees if self.cosine else sin_degrees
+        factors = (1, cap_E, cap_E * cap_E)
+        total = 0
+        for c, m, p in zip(self.coefficients, self.multipliers, self.powers):
+            theta = 0
+            for k, x in zip(m, arguments):
+                theta += k * x
+            total += c * factors[p] * trig(theta)
+        return total
+
+    def evaluate(self, arguments, cap_E=1):
+        """Return the sum of the series at arrays of arguments (float)."""
+        coefficients, multipliers, powers = self.packed
+        trig = np.cos if self.cosine else np.sin
+        factors = (1, cap_E, cap_E * cap_E)
+        total = 0
+        for c, m, p in zip(coefficients, multipliers.T, powers):
+            theta = 0
+            for k, x in zip(m, arguments):
+                if k:
+                    theta = theta + k * x
+            total = total + c * factors[p] * trig(np.radians(theta))
+        return total
+
+    def scalar(self, arguments, cap_E=1):
+        """Return the sum of the series at scalar arguments (float)."""
+        coefficients, multipliers, powers = self._kernel_tables
+        arguments = _kernel_table(tuple(float(x) for x in arguments))
+        return argument_series_kernel(coefficients, multipliers, powers, arguments, float(cap_E), self.cosine)
+
+class PhaseSeries(object):
+    """The series of terms c * trig(a + r * t), for coefficients c, phases a
+    and rates r."""
+
+    def __init__(self, coefficients, addends, multipliers, cosine=False):
+        self.coefficients = tuple(coefficients)
+        self.addends = tuple(addends)
+        self.multipliers = tuple(multipliers)
+        self.cosine = cosine
+        self.packed = (np.array(self.coefficients, dtype=float),
+                       np.array(self.addends, dtype=float),
+                       np.array(self.multipliers, dtype=float))
+        self._kernel_tables = (_kernel_table(self.coefficients),
+                               _kernel_table(self.addends),
+                               _kernel_table(self.multipliers))
+
+    def __call__(self, t):
+        """Return the sum of the series at t: over arrays if t is one,
+        otherwise with the global trigonometry backend (in floats unless it
+        is mpmath)."""
+        if isinstance(t, np.ndarray):
+            return self.evaluate(t)
+        if trig_backend() is not MPMATH_BACKEND:
+            return self.scalar(t)
+        trig = cos_degrees if self.cosine else sin_degrees
+        total = 0
+        for c, a, r in zip(self.coefficients, self.addends, self.multipliers):
+            total += c * trig(a + (r * t))
+        return total
+
+    def evaluate(self, t):
+        """Return the sum of the series at an array, t (float)."""
+        coefficients, addends, multipliers = self.packed
+        trig = np.cos if self.cosine else np.sin
+        total = 0
+        for c, a, r in zip(coefficients, addends, multipliers):
+            total = total + c * trig(np.radians(a + r * t))
+        return total
+
+    def scalar(self, t):
+        """Return the sum of the series at a scalar, t (float)."""
+        coefficients, addends, multipliers = self._kernel_tables
+        return phase_series_kernel(coefficients, addends, multipliers, float(t), self.cosine)
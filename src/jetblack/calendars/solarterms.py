@@ -0,0 +1,142 @@
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+import math
+import numpy as np
+from jetblack.calendars.arrays import gregorian_new_year, gregorian_year
+from jetblack.calendars.positions import julian_centuries, nutation, solar_longitude
+from jetblack.calendars.solar import MEAN_TROPICAL_YEAR
+
+# The 24 solar terms: the moments at which the solar longitude is a multiple
+# of 15 degrees.  Major terms (zhongqi) fall on multiples of 30 degrees and
+# minor terms (jieqi) on odd multiples of 15.
+
+SOLAR_TERM_LONGITUDES = tuple(range(0, 360, 15))
+
+def _solar_longitude(tee):
+    c = julian_centuries(tee)
+    return solar_longitude(c, nutation(c))
+
+def solar_term_moments(start, end, tolerance=10 ** -8, max_iterations=10):
+    """Return the moments (UT) in [start, end] at which the solar longitude
+    is a multiple of 15 degrees, and the longitudes, as sorted arrays.
+
+    Every term is estimated from the longitude at start and the mean
+    motion of the sun, then all are refined together by dividing the
+    error in longitude by that mean motion.  The true motion is within
+    3.4% of it, so each step reduces the error by a factor of about 30,
+    and the first estimates, within 2.5 days, reach a tolerance of 10 ** -8
+    days in seven steps."""
+    rate = 360 / float(MEAN_TROPICAL_YEAR)
+    s = float(_solar_longitude(np.array([float(start)]))[0])
+    count = int((end - start) * rate / 15) + 2
+    targets = 15 * math.ceil(s / 15) + 15 * np.arange(count)
+    tee = start + (targets - s) / rate
+    for _ in range(max_iterations):
+        delta = (((targets - _solar_longitude(tee) + 180) % 360) - 180) / rate
+        tee += delta
+        if np.max(np.abs(delta)) < tolerance:
+            break
+    keep = (start <= tee) & (tee <= end)
+    return tee[keep], (targets[keep] % 360).astype(int)
+
+class SolarTerms(object):
+    """The solar terms from the start of Gregorian year start_year to the
+    end of Gregorian year end_year, with bisect queries.  The moments and
+    longitudes are computed unless given."""
+
+    def __init__(self, start_year, end_year, moments=None, longitudes=None):
+        self.start_year = start_year
+        self.end_year = end_year
+        if moments is None:
+            moments, longitudes = solar_term_moments(
+                float(gregorian_new_year(start_year)), float(gregorian_new_year(end_year + 1)))
+        self.moments, self.longitudes = moments, longitudes
+        self._moments = self.moments.tolist()
+        self._longitudes = self.longitudes.tolist()
+
+    def __len__(self):
+        return len(self._moments)
+
+    def _check(self, i):
+        if i < 0 or i >= len(self._moments):
+            raise ValueError("Moment outside the solar term table")
+        return i
+
+    def term_after(self, tee):
+        """Return the moment and longitude of the first solar term after
+        moment tee."""
+        i = self._check(bisect_right(self._moments, tee))
+        return self._moments[i], self._longitudes[i]
+
+    def term_at_or_before(self, tee):
+        """Return the moment and longitude of the last solar term at or
+        before moment tee."""
+        i = self._check(bisect_right(self._moments, tee) - 1)
+        return self._moments[i], self._longitudes[i]
+
+    def longitude_after(self, lam, tee):
+        """Return the first moment after moment tee when the solar longitude
+        is lam degrees, a multiple of 15."""
+        i = bisect_right(self._moments, tee)
+        i += (lam - self._longitudes[self._check(i)]) % 360 // 15
+        return self._moments[self._check(i)]
+
+    def longitude_before(self, lam, tee):
+        """Return the last moment before moment tee when the solar longitude
+        is lam degrees, a multiple of 15."""
+        i = bisect_left(self._moments, tee) - 1
+        i -= (self._longitudes[self._check(i)] - lam) % 360 // 15
+        return self._moments[self._check(i)]
+
+    def longitude_at(self, tee):
+        """Return the longitude of the last solar term at or before moment
+        tee, that is the solar longitude at tee rounded down to a multiple
+        of 15 degrees."""
+        return self.term_at_or_before(tee)[1]
+
+    def between(self, start, end):
+        """Return the moments and longitudes of the solar terms in
+        [start, end)."""
+        i, j = bisect_left(self._moments, start), bisect_left(self._moments, end)
+        return self.moments[i:j], self.longitudes[i:j]
+
+    @classmethod
+    def join(cls, tables):
+        """Return the table of consecutive tables, tables."""
+        moments, longitudes = [tables[0].moments], [tables[0].longitudes]
+        for table in tables[1:]:
+            # A term on the new year shared by two tables is kept once.
+            keep = table.moments > moments[-1][-1]
+            moments.append(table.moments[keep])
+            longitudes.append(table.longitudes[keep])
+        return cls(tables[0].start_year, tables[-1].end_year, np.concatenate(moments), np.concatenate(longitudes))
+
+DECADE_CACHE_SIZE = 64
+_DECADE_CACHE = OrderedDict()
+_SOLAR_TERMS = None
+
+def _decade(start_year):
+    # The SolarTerms of the ten years from start_year, from the cache.
+    try:
+        table = _DECADE_CACHE[start_year]
+    except KeyError:
+        table = _DECADE_CACHE[start_year] = SolarTerms(start_year, start_year + 9)
+        if len(_DECADE_CACHE) > DECADE_CACHE_SIZE:
+            _DECADE_CACHE.popitem(last=False)
+        return table
+    _DECADE_CACHE.move_to_end(start_year)
+    return table
+
+def solar_terms(tee):
+    """Return a table of solar terms covering at least ten years either
+    side of moment tee: those of its decade and the decades either side.
+    The shared table is joined again from the decades when tee leaves its
+    middle decade; the most recently used DECADE_CACHE_SIZE decades are
+    kept, so only the decade at the edge being extended is computed."""
+    global _SOLAR_TERMS
+    year = int(gregorian_year(math.floor(tee)))
+    table = _SOLAR_TERMS
+    if table is None or not (table.start_year + 10 <= year <= table.end_year - 10):
+        decade = 10 * (year // 10)
+        table = _SOLAR_TERMS = SolarTerms.join([_decade(decade + offset) for offset in (-10, 0, 10)])
+    return table
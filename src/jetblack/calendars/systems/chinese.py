@@ -3,16 +3,19 @@ import math
 from jetblack.calendars.systems.gregorian import GregorianDate
 from jetblack.calendars.months import MonthOfYear
 from jetblack.calendars.seasons import Season
-from jetblack.calendars.solar import MEAN_TROPICAL_YEAR, solar_longitude, solar_longitude_after, estimate_prior_solar_longitude
+from jetblack.calendars.solar import MEAN_TROPICAL_YEAR, solar_longitude_after
+from jetblack.calendars.solarterms import solar_terms
 from jetblack.calendars.lunar import MEAN_SYNODIC_MONTH, new_moon_before, new_moon_at_or_after
 from jetblack.calendars.location import Location
 from jetblack.calendars.timemath import Clock
-from jetblack.calendars.utils import next_int, amod
+from jetblack.calendars.utils import amod
 from jetblack.calendars.trigonometry import angle
 
 class ChineseDate(object):
 
     EPOCH = GregorianDate(-2636, MonthOfYear.FEBRUARY, 15).toordinal()
+    BEIJING_LOCAL_MEAN = Location(angle(39, 55, 0), angle(116, 25, 0), 43.5, Clock.days_from_hours(1397/180))
+    BEIJING = Location(angle(39, 55, 0), angle(116, 25, 0), 43.5, Clock.days_from_hours(8))
     
     def __init__(self, cycle, year, month, leap, day):
         self.cycle = cycle
@@ -53,24 +56,29 @@ class ChineseDate(object):
         """Return location of Beijing; time zone varies with time, tee."""
         year = GregorianDate.to_year(int(math.floor(tee)))
         if (year < 1929):
-            return Location(angle(39, 55, 0), angle(116, 25, 0), 43.5, Clock.days_from_hours(1397/180))
+            return cls.BEIJING_LOCAL_MEAN
         else:
-            return Location(angle(39, 55, 0), angle(116, 25, 0), 43.5, Clock.days_from_hours(8))
+            return cls.BEIJING
 
     @classmethod
     def solar_longitude_on_or_after(cls, lam, ordinal):
         """Return moment (Beijing time) of the first date on or after
         ordinal date, 'ordinal_date', (Beijing time) when the solar longitude
         will be 'lam' degrees."""
-        tee = solar_longitude_after(lam, cls.location(ordinal).universal_from_standard(ordinal))
+        midnight = cls.midnight(ordinal)
+        if lam % 15 == 0:
+            tee = solar_terms(midnight).longitude_after(lam, midnight)
+        else:
+            tee = solar_longitude_after(lam, midnight)
         return cls.location(tee).standard_from_universal(tee)
 
     @classmethod
     def major_solar_term(cls, ordinal):
         """Return last Chinese major solar term (zhongqi) before
         ordinal date, 'ordinal'."""
-        s = solar_longitude(cls.location(ordinal).universal_from_standard(ordinal))
-        return amod(2 + int(math.floor(int(s) / 30)), 12)
+        midnight = cls.midnight(ordinal)
+        s = solar_terms(midnight).longitude_at(midnight)
+        return amod(2 + s // 30, 12)
 
     @classmethod
     def major_solar_term_on_or_after(cls, ordinal):
@@ -78,23 +86,26 @@ class ChineseDate(object):
         solar term (zhongqi) on or after ordinal date, 'ordinal'.  The
         major terms begin when the sun's longitude is a
         multiple of 30 degrees."""
-        s = solar_longitude(cls.midnight(ordinal))
-        l = (30 * int(math.ceil(s / 30))) % 360
+        midnight = cls.midnight(ordinal)
+        s = solar_terms(midnight).longitude_at(midnight)
+        l = (30 * (s // 30 + 1)) % 360
         return cls.solar_longitude_on_or_after(l, ordinal)
 
     @classmethod    
     def current_minor_solar_term(cls, ordinal):
         """Return last Chinese minor solar term (jieqi) before date, 'ordinal'."""
-        s = solar_longitude(cls.location(ordinal).universal_from_standard(ordinal))
-        return amod(3 + int(math.floor((s - 15) / 30)), 12)
+        midnight = cls.midnight(ordinal)
+        s = solar_terms(midnight).longitude_at(midnight)
+        return amod(3 + (s - 15) // 30, 12)
 
     @classmethod    
     def minor_solar_term_on_or_after(cls, ordinal):
         """Return moment (in Beijing) of the first Chinese minor solar
         term (jieqi) on or after ordinal date, 'ordinal'.  The minor terms
         begin when the sun's longitude is an odd multiple of 15 degrees."""
-        s = solar_longitude(cls.midnight(ordinal))
-        l = (30 * int(math.ceil((s - 15) / 30)) + 15) % 360
+        midnight = cls.midnight(ordinal)
+        s = solar_terms(midnight).longitude_at(midnight)
+        l = (30 * ((s + 15) // 30) + 15) % 360
         return cls.solar_longitude_on_or_after(l, ordinal)
 
     @classmethod    
@@ -127,8 +138,8 @@ class ChineseDate(object):
         """Return ordinal date, in the Chinese zone, of winter solstice
         on or before ordinal date, 'ordinal'."""
         midnight_tomorrow = cls.midnight(ordinal + 1)
-        approx = estimate_prior_solar_longitude(Season.WINTER, midnight_tomorrow)
-        return next_int(int(math.floor(approx)) - 1, lambda day: Season.WINTER < solar_longitude(cls.midnight(1 + day)))
+        tee = solar_terms(midnight_tomorrow).longitude_before(Season.WINTER, midnight_tomorrow)
+        return int(math.floor(cls.location(tee).standard_from_universal(tee)))
     
     @classmethod    
     def new_year_in_sui(cls, ordinal):
@@ -264,16 +275,21 @@ class ChineseName(object):
         has Chinese name, name."""
         return date - ((date + cls.name_difference(name, cls.sexagesimal_name(cls.DAY_NAME_EPOCH))) % 60)
 
+# Tokyo (139 deg 46 min east) local time
+TOKYO_LOCAL_MEAN = Location(mpf(35.7), angle(139, 46, 0), 24, Clock.days_from_hours(9 + 143/450))
+# Longitude 135 time zone
+JAPAN_STANDARD = Location(35, 135, 0, Clock.days_from_hours(9))
+
 def japanese_location(tee):
     """Return the location for Japanese calendar; varies with moment, tee."""
     year = GregorianDate.to_year(int(math.floor(tee)))
     if (year < 1888):
-        # Tokyo (139 deg 46 min east) local time
-        loc = Location(mpf(35.7), angle(139, 46, 0), 24, Clock.days_from_hours(9 + 143/450))
+        return TOKYO_LOCAL_MEAN
     else:
-        # Longitude 135 time zone
-        loc = Location(35, 135, 0, Clock.days_from_hours(9))
-    return loc
+        return JAPAN_STANDARD
+
+# Seoul city hall at each of the time zones it has used.
+SEOUL = {z: Location(angle(37, 34, 0), angle(126, 58, 0), 0, Clock.days_from_hours(z)) for z in (3809/450, 8.5, 9)}
 
 def korean_location(tee):
     """Return the location for Korean calendar; varies with moment, tee."""
@@ -289,12 +305,14 @@ def korean_location(tee):
         z = 8.5
     else:
         z = 9
-    return Location(angle(37, 34, 0), angle(126, 58, 0), 0, Clock.days_from_hours(z))
+    return SEOUL[z]
 
 def korean_year(cycle, year):
     """Return equivalent Korean year to Chinese cycle, cycle, and year, year."""
     return (60 * cycle) + year - 364
 
+HANOI = {z: Location(angle(21, 2, 0), angle(105, 51, 0), 12, Clock.days_from_hours(z)) for z in (7, 8)}
+
 def vietnamese_location(tee):
     """Return the location for Vietnamese calendar is Hanoi;
     varies with moment, tee. Time zone has changed over the years."""
@@ -302,4 +320,4 @@ def vietnamese_location(tee):
         z = 8
     else:
         z =7
-    return Location(angle(21, 2, 0), angle(105, 51, 0), 12, Clock.days_from_hours(z))
\ No newline at end of file
+    return HANOI[z]
\ No newline at end of file
@@ -7,7 +7,7 @@ from jetblack.calendars.systems.gregorian import GregorianDate
 from jetblack.calendars.timemath import Clock
 from jetblack.calendars.ymd import YearMonthDay
 from jetblack.calendars.utils import next_int
-from jetblack.calendars.solar import MEAN_TROPICAL_YEAR, estimate_prior_solar_longitude, solar_longitude
+from jetblack.calendars.solar import MEAN_TROPICAL_YEAR, estimate_prior_solar_longitude
 
 class FrenchDate(YearMonthDay):
 
@@ -43,8 +43,8 @@ class FrenchDate(YearMonthDay):
     def new_year_on_or_before(cls, ordinal):
         """Return ordinal date of French Revolutionary New Year on or
            before ordinal, ordinal."""
-        approx = estimate_prior_solar_longitude(Season.AUTUMN, cls.midnight_in_paris(ordinal))
-        return next_int(ifloor(approx) - 1, lambda day: Season.AUTUMN <= solar_longitude(cls.midnight_in_paris(day)))
+        equinox = estimate_prior_solar_longitude(Season.AUTUMN, cls.midnight_in_paris(ordinal))
+        return next_int(ifloor(equinox) - 1, lambda day: equinox <= cls.midnight_in_paris(day))
     
     @classmethod
     def is_arithmetic_leap_year(cls, f_year):
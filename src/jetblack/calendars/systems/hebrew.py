@@ -1,8 +1,8 @@
-from fractions import Fraction
+from bisect import bisect_right
+from collections import namedtuple, OrderedDict
 from enum import IntEnum
 import math
 from mpmath import mpf
-from jetblack.calendars.utils import summa
 from jetblack.calendars.trigonometry import angle
 from jetblack.calendars.months import MonthOfYear
 from jetblack.calendars.weekdays import DayOfWeek, weekday_fromordinal, before_weekday
@@ -13,7 +13,7 @@ from jetblack.calendars.location import Location
 from jetblack.calendars.systems.gregorian import GregorianDate
 from jetblack.calendars.timemath import Clock
 from jetblack.calendars.ymd import YearMonthDay
-from jetblack.calendars.utils import next_int, final_int, list_range
+from jetblack.calendars.utils import next_int, list_range
 from jetblack.calendars.solar import solar_longitude_after
 from jetblack.calendars.lunar import lunar_phase, MEAN_SYNODIC_MONTH
 
@@ -32,33 +32,81 @@ class HebrewMonth(IntEnum):
     ADAR = 12
     ADARII = 13
     
+# The new year, length and leap flag of a Hebrew year, and the days from
+# its new year to the first of each month, by month number.
+HebrewYear = namedtuple('HebrewYear', ['year', 'new_year', 'length', 'leap', 'month_offsets'])
+
 class HebrewDate(YearMonthDay):
 
     EPOCH = JulianDate(JulianDate.bce(3761),  MonthOfYear.OCTOBER, 7).toordinal()
+    # The parts (halakim) in a day and in the mean month (29 days, 12
+    # hours and 793 parts), and the molad of Tishri, AM 1, in parts from
+    # the midnight beginning the epoch.
+    PARTS_PER_DAY = 25920
+    MONTH_PARTS = 765433
+    EPOCH_MOLAD_PARTS = -876
+    YEAR_CACHE_SIZE = 1024
+    # The months in the order of the year, from Tishri.
+    MONTHS_OF_YEAR = tuple(range(HebrewMonth.TISHRI, HebrewMonth.ADARII)) + tuple(range(HebrewMonth.NISAN, HebrewMonth.TISHRI))
+    MONTHS_OF_LEAP_YEAR = tuple(range(HebrewMonth.TISHRI, HebrewMonth.ADARII + 1)) + tuple(range(HebrewMonth.NISAN, HebrewMonth.TISHRI))
+    _YEAR_CACHE = OrderedDict()
     
     def __init__(self, year, month, day):
         super().__init__(year, month, day)
     
     def toordinal(self):
         """Return ordinal date of Hebrew date h_date."""
-        if self.month < HebrewMonth.TISHRI:
-            tmp = (summa(lambda m: self.last_day_of_month(m, self.year), HebrewMonth.TISHRI, lambda m: m <= self.last_month_of_year(self.year)) +
-                   summa(lambda m: self.last_day_of_month(m, self.year), HebrewMonth.NISAN, lambda m: m < self.month))
-        else:
-            tmp = summa(lambda m: self.last_day_of_month(m, self.year), HebrewMonth.TISHRI, lambda m: m < self.month)
-    
-        return self.new_year(self.year) + self.day - 1 + tmp
+        record = self.year_record(self.year)
+        return record.new_year + record.month_offsets[self.month - 1] + self.day - 1
+
+    @classmethod
+    def _year(cls, year):
+        # The HebrewYear of year, year, from the four elapsed days it needs.
+        ny0, ny1, ny2, ny3 = map(cls.elapsed_days, range(year - 1, year + 3))
+        new_year = cls.EPOCH + ny1 + cls._length_correction(ny0, ny1, ny2)
+        length = ny2 + cls._length_correction(ny1, ny2, ny3) + cls.EPOCH - new_year
+        leap = cls.is_leap_year(year)
+        month_lengths = [30, 29, 30, 29, 30, 29, 30, 30 if length in (355, 385) else 29,
+                         29 if length in (353, 383) else 30, 29, 30, 30 if leap else 29, 29]
+        offsets = [0] * 13
+        offset = 0
+        for month in cls.MONTHS_OF_LEAP_YEAR if leap else cls.MONTHS_OF_YEAR:
+            offsets[month - 1] = offset
+            offset += month_lengths[month - 1]
+        if not leap:
+            offsets[HebrewMonth.ADARII - 1] = offsets[HebrewMonth.NISAN - 1]
+        return HebrewYear(year, new_year, length, leap, tuple(offsets))
+
+    @classmethod
+    def year_record(cls, year):
+        """Return the HebrewYear of year, year: its new year, length, leap
+        flag and the offsets of its months.  The most recently used
+        YEAR_CACHE_SIZE years are kept."""
+        try:
+            record = cls._YEAR_CACHE[year]
+        except KeyError:
+            record = cls._YEAR_CACHE[year] = cls._year(year)
+            if len(cls._YEAR_CACHE) > cls.YEAR_CACHE_SIZE:
+                cls._YEAR_CACHE.popitem(last=False)
+            return record
+        cls._YEAR_CACHE.move_to_end(year)
+        return record
 
     @classmethod    
     def fromordinal(cls, ordinal):
         """Return  Hebrew (year month day) corresponding to ordinal date 'ordinal'.
-        # The fraction can be approximated by 365.25."""
-        approx = int(math.floor((ordinal - cls.EPOCH) / Fraction(35975351, 98496))) + 1
-        year = final_int(approx - 1, lambda y: cls.new_year(y) <= ordinal)
-        start = HebrewMonth.TISHRI if ordinal < HebrewDate(year, HebrewMonth.NISAN, 1).toordinal() else  HebrewMonth.NISAN
-        month = next_int(start, lambda m: ordinal <= HebrewDate(year, m, cls.last_day_of_month(m, year)).toordinal())
-        day = ordinal - HebrewDate(year, month, 1).toordinal() + 1
-        return HebrewDate(year, month, day)
+        The year is the mean year or one either side of it, and the month
+        is found by bisecting the months of its year record."""
+        approx = (ordinal - cls.EPOCH) * 98496 // 35975351 + 1
+        record = cls.year_record(approx)
+        if ordinal < record.new_year:
+            record = cls.year_record(approx - 1)
+        elif ordinal >= record.new_year + record.length:
+            record = cls.year_record(approx + 1)
+        months = cls.MONTHS_OF_LEAP_YEAR if record.leap else cls.MONTHS_OF_YEAR
+        starts = [record.month_offsets[month - 1] for month in months]
+        i = bisect_right(starts, ordinal - record.new_year) - 1
+        return HebrewDate(record.year, months[i], ordinal - record.new_year - starts[i] + 1)
 
     @classmethod
     def is_leap_year(cls, year):
@@ -86,12 +134,23 @@ class HebrewDate(YearMonthDay):
         else:
             return 30
 
+    @classmethod
+    def months_elapsed(cls, month, year):
+        """Return the months elapsed from the epoch to month in Hebrew
+        year, year, which may be arrays of integers."""
+        return month - HebrewMonth.TISHRI + (235 * (year + (month < HebrewMonth.TISHRI)) - 234) // 19
+
+    @classmethod
+    def molad_parts(cls, month, year):
+        """Return the parts (halakim) from the epoch to the mean
+        conjunction of month in Hebrew year, year, which may be arrays of
+        integers."""
+        return cls.EPOCH_MOLAD_PARTS + cls.MONTH_PARTS * cls.months_elapsed(month, year)
+
     @classmethod    
     def molad(cls, month, year):
         """Return moment of mean conjunction of month in Hebrew year."""
-        y = year + 1 if month < HebrewMonth.TISHRI else year
-        months_elapsed = month - HebrewMonth.TISHRI + int(math.floor((235 * y - 234) / 19))
-        return cls.EPOCH - Fraction(876, 25920) + months_elapsed * (29 + Clock.days_from_hours(12) + Fraction(793,25920))
+        return cls.EPOCH + cls.molad_parts(month, year) / cls.PARTS_PER_DAY
 
     @classmethod    
     def elapsed_days(cls, year):
@@ -99,24 +158,27 @@ class HebrewDate(YearMonthDay):
         to the epoch of the Hebrew calendar to the mean
         conjunction (molad) of Tishri of Hebrew year h_year,
         or one day later."""
-        months_elapsed = int(math.floor((235 * year - 234) / 19))
+        months_elapsed = (235 * year - 234) // 19
         parts_elapsed  = 12084 + 13753 * months_elapsed
-        days = 29 * months_elapsed + int(math.floor(parts_elapsed / 25920))
+        days = 29 * months_elapsed + parts_elapsed // 25920
         return days + 1 if (3 * (days + 1)) % 7 < 3 else days
 
     @classmethod    
     def new_year(cls, year):
         """Return ordinal date of Hebrew new year 'year'."""
-        return cls.EPOCH + cls.elapsed_days(year) + cls.year_length_correction(year)
+        return cls.year_record(year).new_year
     
     @classmethod
     def year_length_correction(cls, year):
         """Return delays to start of Hebrew year 'year' to keep ordinary
         year in range 353-356 and leap year in range 383-386."""
         # I had a bug... h_year = 1 instead of h_year - 1!!!
-        ny0 = cls.elapsed_days(year - 1)
-        ny1 = cls.elapsed_days(year)
-        ny2 = cls.elapsed_days(year + 1)
+        return cls._length_correction(cls.elapsed_days(year - 1), cls.elapsed_days(year), cls.elapsed_days(year + 1))
+
+    @classmethod
+    def _length_correction(cls, ny0, ny1, ny2):
+        # The year length correction given the elapsed days of the year
+        # before, the year and the year after.
         if ny2 - ny1 == 356:
             return 2
         elif ny1 - ny0 == 382:
@@ -127,7 +189,7 @@ class HebrewDate(YearMonthDay):
     @classmethod    
     def days_in_year(cls, year):
         """Return number of days in Hebrew year 'year'."""
-        return cls.new_year(year + 1) - cls.new_year(year)
+        return cls.year_record(year).length
 
     @classmethod    
     def is_long_marheshvan(cls, year):
@@ -157,7 +219,7 @@ class HebrewDate(YearMonthDay):
         Throws ValueError if that date does not fall during the omer."""
         c = ordinal - cls.passover(GregorianDate.to_year(ordinal))
         if 1 <= c <= 49:
-            return [int(math.floor(c, 7)), c % 7]
+            return [c // 7, c % 7]
         else:
             raise ValueError("Date does not fall within omer")
 
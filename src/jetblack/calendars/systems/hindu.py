@@ -1,5 +1,10 @@
 import math
+from fractions import Fraction
+from bisect import bisect_left, bisect_right
+from collections import namedtuple, OrderedDict
+from functools import lru_cache
 from mpmath import mpf
+import numpy as np
 from jetblack.calendars.utils import amod, signum, binary_search, invert_angular
 from jetblack.calendars.trigonometry import angle, sin_degrees
 from jetblack.calendars.months import MonthOfYear
@@ -7,20 +12,22 @@ from jetblack.calendars.weekdays import DayOfWeek, on_or_after_weekday
 from jetblack.calendars.location import Location
 from jetblack.calendars.timemath import Clock
 from jetblack.calendars.utils import reduce_cond, next_int, is_in_range, list_range
+from jetblack.calendars.events import CrossingFinder
 from jetblack.calendars.solar import solar_longitude
 from jetblack.calendars.astrological import precession
 from jetblack.calendars.lunar import lunar_longitude
+from jetblack.calendars import positions
 from jetblack.calendars.systems.julian import JulianDate
 from jetblack.calendars.systems.gregorian import GregorianDate
 
 
 class OldHindu(object):
     
-    ARYA_SOLAR_YEAR = 1577917500/4320000
+    ARYA_SOLAR_YEAR = Fraction(1577917500, 4320000)
     ARYA_SOLAR_MONTH = ARYA_SOLAR_YEAR / 12
 
     EPOCH = JulianDate(JulianDate.bce(3102), MonthOfYear.FEBRUARY, 18).toordinal()
-    ARYA_JOVIAN_PERIOD =  1577917500/364224
+    ARYA_JOVIAN_PERIOD = Fraction(1577917500, 364224)
 
     @classmethod    
     def hindu_day_count(cls, date):
@@ -34,7 +41,7 @@ class OldHindu(object):
 
 class OldHinduLunarDate(OldHindu):
     
-    ARYA_LUNAR_MONTH = 1577917500/53433336
+    ARYA_LUNAR_MONTH = Fraction(1577917500, 53433336)
     ARYA_LUNAR_DAY =  ARYA_LUNAR_MONTH / 30
 
     def __init__(self, year, month, leap, day):
@@ -53,14 +60,14 @@ class OldHinduLunarDate(OldHindu):
         else:
             temp = self.month - 1
             
-        temp = self.EPOCH + lunar_new_year + (self.ARYA_LUNAR_MONTH * temp) + ((self.day - 1) * self.ARYA_LUNAR_DAY) + Clock.days_from_hours(-6)
+        temp = self.EPOCH + lunar_new_year + (self.ARYA_LUNAR_MONTH * temp) + ((self.day - 1) * self.ARYA_LUNAR_DAY) + Fraction(-6, 24)
         
         return int(math.ceil(temp))
 
     @classmethod
     def fromordinal(cls, ordinal):
         """Return Old Hindu lunar date equivalent to ordinal date 'ordinal'."""
-        sun = cls.hindu_day_count(ordinal) + Clock.days_from_hours(6)
+        sun = cls.hindu_day_count(ordinal) + Fraction(6, 24)
         new_moon = sun - (sun % cls.ARYA_LUNAR_MONTH)
         leap = cls.ARYA_SOLAR_MONTH - cls.ARYA_LUNAR_MONTH >= new_moon % cls.ARYA_SOLAR_MONTH and new_moon % cls.ARYA_SOLAR_MONTH > 0
         month = 1 + int(math.ceil(new_moon / cls.ARYA_SOLAR_MONTH) % 12)
@@ -72,28 +79,28 @@ class OldHinduLunarDate(OldHindu):
     def is_leap_year(cls, year):
         """Return True if year is a leap year on the
         old Hindu calendar."""
-        return (year * cls.ARYA_SOLAR_YEAR - cls.ARYA_SOLAR_MONTH) % cls.ARYA_LUNAR_MONTH >= 23902504679/1282400064
+        return (year * cls.ARYA_SOLAR_YEAR - cls.ARYA_SOLAR_MONTH) % cls.ARYA_LUNAR_MONTH >= Fraction(23902504679, 1282400064)
 
     def to_tuple(self):
         return (self.year, self.month, self.leap, self.day)
     
     def __eq__(self, other):
-        return isinstance(other, OldHinduLunarDate) and all(map(lambda (x,y): x == y, zip(self.to_tuple(), other.to_tuple())))
+        return isinstance(other, OldHinduLunarDate) and all(map(lambda x_y: x_y[0] == x_y[1], zip(self.to_tuple(), other.to_tuple())))
     
     def __ne__(self, other):
         return not self.__eq__(other)
     
     def __lt__(self, other):
-        return isinstance(other, OldHinduLunarDate) and reduce_cond(lambda _, (x, y): x < y, lambda r, (x, y): not r and x == y, zip(self.to_tuple(), other.to_tuple()), False)
+        return isinstance(other, OldHinduLunarDate) and reduce_cond(lambda _, x_y: x_y[0] < x_y[1], lambda r, x_y: not r and x_y[0] == x_y[1], zip(self.to_tuple(), other.to_tuple()), False)
     
     def __le__(self, other):
-        return isinstance(other, OldHinduLunarDate) and reduce_cond(lambda _, (x, y): x <= y, lambda r, (x, y): not r and x == y, zip(self.to_tuple(), other.to_tuple()), False)
+        return isinstance(other, OldHinduLunarDate) and reduce_cond(lambda _, x_y: x_y[0] <= x_y[1], lambda r, x_y: not r and x_y[0] == x_y[1], zip(self.to_tuple(), other.to_tuple()), False)
     
     def __gt__(self, other):
-        return isinstance(other, OldHinduLunarDate) and reduce_cond(lambda _, (x, y): x > y, lambda r, (x, y): not r and x == y, zip(self.to_tuple(), other.to_tuple()), False)
+        return isinstance(other, OldHinduLunarDate) and reduce_cond(lambda _, x_y: x_y[0] > x_y[1], lambda r, x_y: not r and x_y[0] == x_y[1], zip(self.to_tuple(), other.to_tuple()), False)
     
     def __ge__(self, other):
-        return isinstance(other, OldHinduLunarDate) and reduce_cond(lambda _, (x, y): x >= y, lambda r, (x, y): not r and x == y, zip(self.to_tuple(), other.to_tuple()), False)
+        return isinstance(other, OldHinduLunarDate) and reduce_cond(lambda _, x_y: x_y[0] >= x_y[1], lambda r, x_y: not r and x_y[0] == x_y[1], zip(self.to_tuple(), other.to_tuple()), False)
 
 class OldHinduSolarDate(OldHindu):
     
@@ -105,7 +112,7 @@ class OldHinduSolarDate(OldHindu):
     @classmethod
     def fromordinal(cls, ordinal):
         """Return Old Hindu solar date equivalent to ordinal date ordinal."""
-        sun   = cls.hindu_day_count(ordinal) + Clock.days_from_hours(6)
+        sun   = cls.hindu_day_count(ordinal) + Fraction(6, 24)
         year  = int(math.floor(sun / cls.ARYA_SOLAR_YEAR))
         month = (int(math.floor(sun / cls.ARYA_SOLAR_MONTH)) % 12) + 1
         day   = int(math.floor(sun % cls.ARYA_SOLAR_MONTH)) + 1
@@ -113,29 +120,35 @@ class OldHinduSolarDate(OldHindu):
         
     def toordinal(self):
         """Return ordinal date corresponding to Old Hindu solar date s_date."""
-        return int(math.ceil(self.EPOCH + self.year * self.ARYA_SOLAR_YEAR + (self.month - 1) * self.ARYA_SOLAR_MONTH + self.day + Clock.days_from_hours(-30)))
+        return int(math.ceil(self.EPOCH + self.year * self.ARYA_SOLAR_YEAR + (self.month - 1) * self.ARYA_SOLAR_MONTH + self.day + Fraction(-30, 24)))
 
     def to_tuple(self):
         return (self.year, self.month, self.day)
 
     def __eq__(self, other):
-        return isinstance(other, OldHinduSolarDate) and all(map(lambda (x,y): x == y, zip(self.to_tuple(), other.to_tuple())))
+        return isinstance(other, OldHinduSolarDate) and all(map(lambda x_y: x_y[0] == x_y[1], zip(self.to_tuple(), other.to_tuple())))
     
     def __ne__(self, other):
         return not self.__eq__(other)
     
     def __lt__(self, other):
-        return isinstance(other, OldHinduSolarDate) and reduce_cond(lambda _, (x, y): x < y, lambda r, (x, y): not r and x == y, zip(self.to_tuple(), other.to_tuple()), False)
+        return isinstance(other, OldHinduSolarDate) and reduce_cond(lambda _, x_y: x_y[0] < x_y[1], lambda r, x_y: not r and x_y[0] == x_y[1], zip(self.to_tuple(), other.to_tuple()), False)
     
     def __le__(self, other):
-        return isinstance(other, OldHinduSolarDate) and reduce_cond(lambda _, (x, y): x <= y, lambda r, (x, y): not r and x == y, zip(self.to_tuple(), other.to_tuple()), False)
+        return isinstance(other, OldHinduSolarDate) and reduce_cond(lambda _, x_y: x_y[0] <= x_y[1], lambda r, x_y: not r and x_y[0] == x_y[1], zip(self.to_tuple(), other.to_tuple()), False)
     
     def __gt__(self, other):
-        return isinstance(other, OldHinduSolarDate) and reduce_cond(lambda _, (x, y): x > y, lambda r, (x, y): not r and x == y, zip(self.to_tuple(), other.to_tuple()), False)
+        return isinstance(other, OldHinduSolarDate) and reduce_cond(lambda _, x_y: x_y[0] > x_y[1], lambda r, x_y: not r and x_y[0] == x_y[1], zip(self.to_tuple(), other.to_tuple()), False)
     
     def __ge__(self, other):
-        return isinstance(other, OldHinduSolarDate) and reduce_cond(lambda _, (x, y): x >= y, lambda r, (x, y): not r and x == y, zip(self.to_tuple(), other.to_tuple()), False)
+        return isinstance(other, OldHinduSolarDate) and reduce_cond(lambda _, x_y: x_y[0] >= x_y[1], lambda r, x_y: not r and x_y[0] == x_y[1], zip(self.to_tuple(), other.to_tuple()), False)
     
+def _sine_table_entry(entry):
+    # The Hindu sine table, for an angle of entry * 225'.
+    exact = 3438 * sin_degrees(entry * angle(0, 225, 0))
+    error = 0.215 * signum(exact) * signum(abs(exact) - 1716)
+    return int(round(exact + error)) / 3438
+
 class HinduDate(object):
 
     SIDEREAL_YEAR = 365 + 279457/1080000
@@ -143,6 +156,9 @@ class HinduDate(object):
     CREATION = OldHindu.EPOCH - 1955880000 * SIDEREAL_YEAR
     UJJAIN = Location(angle(23, 9, 0), angle(75, 46, 6), 0, Clock.days_from_hours(5 + 461/9000))
     LOCATION = UJJAIN
+    # The sine table for the first quadrant, in steps of 225'.
+    SINE_TABLE = tuple(_sine_table_entry(entry) for entry in range(25))
+    _SINE_TABLE = np.array(SINE_TABLE)
 
     def __init__(self, year, month, leap_month, day, leap_day):
         self.year = year
@@ -155,57 +171,75 @@ class HinduDate(object):
         return (self.year, self.month, self.leap_month, self.day, self.leap_day)
 
     def __eq__(self, other):
-        return isinstance(other, HinduDate) and all(map(lambda (x,y): x == y, zip(self.to_tuple(), other.to_tuple())))
+        return isinstance(other, HinduDate) and all(map(lambda x_y: x_y[0] == x_y[1], zip(self.to_tuple(), other.to_tuple())))
     
     def __ne__(self, other):
         return not self.__eq__(other)
     
     def __lt__(self, other):
-        return isinstance(other, HinduDate) and reduce_cond(lambda _, (x, y): x < y, lambda r, (x, y): not r and x == y, zip(self.to_tuple(), other.to_tuple()), False)
+        return isinstance(other, HinduDate) and reduce_cond(lambda _, x_y: x_y[0] < x_y[1], lambda r, x_y: not r and x_y[0] == x_y[1], zip(self.to_tuple(), other.to_tuple()), False)
     
     def __le__(self, other):
-        return isinstance(other, HinduDate) and reduce_cond(lambda _, (x, y): x <= y, lambda r, (x, y): not r and x == y, zip(self.to_tuple(), other.to_tuple()), False)
+        return isinstance(other, HinduDate) and reduce_cond(lambda _, x_y: x_y[0] <= x_y[1], lambda r, x_y: not r and x_y[0] == x_y[1], zip(self.to_tuple(), other.to_tuple()), False)
     
     def __gt__(self, other):
-        return isinstance(other, HinduDate) and reduce_cond(lambda _, (x, y): x > y, lambda r, (x, y): not r and x == y, zip(self.to_tuple(), other.to_tuple()), False)
+        return isinstance(other, HinduDate) and reduce_cond(lambda _, x_y: x_y[0] > x_y[1], lambda r, x_y: not r and x_y[0] == x_y[1], zip(self.to_tuple(), other.to_tuple()), False)
     
     def __ge__(self, other):
-        return isinstance(other, HinduDate) and reduce_cond(lambda _, (x, y): x >= y, lambda r, (x, y): not r and x == y, zip(self.to_tuple(), other.to_tuple()), False)
+        return isinstance(other, HinduDate) and reduce_cond(lambda _, x_y: x_y[0] >= x_y[1], lambda r, x_y: not r and x_y[0] == x_y[1], zip(self.to_tuple(), other.to_tuple()), False)
     
     @classmethod
     def sine_table(cls, entry):
         """Return the value for entry in the Hindu sine table.
-        Entry, entry, is an angle given as a multiplier of 225'."""
-        exact = 3438 * sin_degrees(entry * angle(0, 225, 0))
-        error = 0.215 * signum(exact) * signum(abs(exact) - 1716)
-        return int(round(exact + error)) / 3438
+        Entry, entry, is an angle given as a multiplier of 225', or an
+        array of them.  The first quadrant is tabulated in SINE_TABLE
+        and the others follow by symmetry."""
+        k = entry % 96
+        i = 24 - abs(24 - k % 48)
+        if isinstance(k, np.ndarray):
+            return np.where(k < 48, 1, -1) * cls._SINE_TABLE[i]
+        return cls.SINE_TABLE[i] if k < 48 else -cls.SINE_TABLE[i]
 
     @classmethod
     def sine(cls, theta):
-        """Return the linear interpolation for angle, theta, in Hindu table."""
+        """Return the linear interpolation for angle, theta, in Hindu table.
+        Theta may be an array."""
+        if isinstance(theta, np.ndarray):
+            entry = theta / angle(0, 225, 0)
+            lower = np.floor(entry)
+            fraction = entry - lower
+            return fraction * cls.sine_table(np.ceil(entry).astype(int)) + (1 - fraction) * cls.sine_table(lower.astype(int))
         entry    = theta / angle(0, 225, 0)
         fraction = entry % 1
         return ((fraction * cls.sine_table(int(math.ceil(entry)))) + ((1 - fraction) * cls.sine_table(int(math.floor(entry)))))
 
     @classmethod
     def arcsin(cls, amp):
-        """Return the inverse of Hindu sine function of amp."""
+        """Return the inverse of Hindu sine function of amp, which may be
+        an array."""
+        if isinstance(amp, np.ndarray):
+            pos = np.searchsorted(cls._SINE_TABLE, abs(amp))
+            below = cls.sine_table(pos - 1)
+            return np.sign(amp) * angle(0, 225, 0) * (pos - 1 + ((abs(amp) - below) / (cls._SINE_TABLE[pos] - below)))
         if (amp < 0):
             return -cls.arcsin(-amp)
         else:
-            pos = next_int(0, lambda k: amp <= cls.sine_table(k))
+            pos = bisect_left(cls.SINE_TABLE, amp)
             below = cls.sine_table(pos - 1)
-            return (angle(0, 225, 0) * (pos - 1 + ((amp - below) / (cls.sine_table(pos) - below))))
+            return (angle(0, 225, 0) * (pos - 1 + ((amp - below) / (cls.SINE_TABLE[pos] - below))))
 
     @classmethod
     def mean_position(cls, tee, period):
         """Return the position in degrees at moment, tee, in uniform circular
-        orbit of period days."""
+        orbit of period days.  Tee may be an array."""
+        if isinstance(tee, np.ndarray):
+            period = float(period)
         return 360 * (((tee - cls.CREATION) / period) % 1)
 
     @classmethod
     def true_position(cls, tee, period, size, anomalistic, change):
-        """Return the longitudinal position at moment, tee.
+        """Return the longitudinal position at moment, tee, or at each of
+        an array of moments.
         period is the period of mean motion in days.
         size is ratio of radii of epicycle and deferent.
         anomalistic is the period of retrograde revolution about epicycle.
@@ -225,7 +259,12 @@ class HinduDate(object):
     def zodiac(cls, tee):
         """Return the zodiacal sign of the sun, as integer in range 1..12,
         at moment tee."""
-        return int(math.floor(float(cls.solar_longitude(tee)), 30)) + 1
+        return int(math.floor(float(cls.solar_longitude(tee)) / 30)) + 1
+
+    @classmethod
+    def calendar_year(cls, tee):
+        """Return the solar year at given moment, tee."""
+        return int(round(((tee - OldHindu.EPOCH) / cls.SIDEREAL_YEAR) - (cls.solar_longitude(tee) / 360)))
 
     @classmethod
     def equation_of_time(cls, date):
@@ -251,11 +290,26 @@ class HinduDate(object):
         mean_motion = 360 / cls.SIDEREAL_YEAR
         anomaly = cls.mean_position(date, cls.ANOMALISTIC_YEAR)
         epicycle = 14/360 - abs(cls.sine(anomaly)) / 1080
-        entry = int(math.floor(float(anomaly), angle(0, 225, 0)))
+        entry = int(math.floor(float(anomaly) / angle(0, 225, 0)))
         sine_table_step = cls.sine_table(entry + 1) - cls.sine_table(entry)
         factor = -3438/225 * sine_table_step * epicycle
         return mean_motion * (factor + 1)
 
+    @classmethod
+    def tropical_longitude(cls, ordinal):
+        """Return the Hindu tropical longitude on ordinal date, 'ordinal'.
+        Assumes precession with maximum of 27 degrees
+        and period of 7200 sidereal years (= 1577917828/600 days)."""
+        days = int(math.floor(ordinal - OldHindu.EPOCH))
+        precession = 27 - abs(54 - ((27 + (108 * 600/1577917828 * days)) % 108))
+        return (cls.solar_longitude(ordinal) - precession) % 360
+
+    @classmethod
+    def rising_sign(cls, ordinal):
+        """Return the tabulated speed of rising of current zodiacal sign on date, date."""
+        i = int(math.floor(float(cls.tropical_longitude(ordinal)) / 30))
+        return [1670/1800, 1795/1800, 1935/1800, 1935/1800, 1795/1800, 1670/1800][i % 6]
+
     @classmethod
     def solar_sidereal_difference(cls, date):
         """Return the difference between solar and sidereal day on date, date."""
@@ -288,40 +342,96 @@ class HinduDate(object):
         rise = cls.UJJAIN.dawn(date, angle(0, 47, 0))
         return 1/24 * 1/60 * int(round(rise * 24 * 60))
 
+HinduLunarDay = namedtuple('HinduLunarDay', ['sunrise', 'sunset', 'lunar_day', 'last_new_moon', 'next_new_moon'])
+
 class HinduLunarDate(HinduDate):
 
     MONTH = 27 + 4644439/14438334
+    SIDEREAL_MONTH = MONTH
     SYNODIC_MONTH = 29 + 7087771/13358334
     ANOMALISTIC_MONTH = mpf(1577917828)/(57753336 - 488199)
     LUNAR_ERA = 3044
+    DAY_CACHE_SIZE = 4096
+    _DAY_CACHE = OrderedDict()
 
     def __init__(self, year, month, leap_month, day, leap_day):
         HinduDate.__init__(self, year, month, leap_month, day, leap_day)
-        
+
+    @classmethod
+    def _day(cls, ordinal, new_moons=None):
+        # The day record of ordinal date ordinal, with the containing new
+        # moons computed unless given.
+        sunrise = cls.sunrise(ordinal)
+        if new_moons is None:
+            last_new_moon = cls.new_moon_before(sunrise)
+            new_moons = last_new_moon, cls.new_moon_before(int(math.floor(last_new_moon)) + 35)
+        record = HinduLunarDay(sunrise, cls.sunset(ordinal), cls.lunar_day_from_moment(sunrise), *new_moons)
+        cls._DAY_CACHE[ordinal] = record
+        if len(cls._DAY_CACHE) > cls.DAY_CACHE_SIZE:
+            cls._DAY_CACHE.popitem(last=False)
+        return record
+
+    @classmethod
+    def day_record(cls, ordinal):
+        """Return the HinduLunarDay of ordinal date, ordinal: its sunrise,
+        sunset, lunar day at sunrise, and the new moons before and after.
+        The most recently used DAY_CACHE_SIZE records are kept."""
+        try:
+            record = cls._DAY_CACHE[ordinal]
+        except KeyError:
+            return cls._day(ordinal)
+        cls._DAY_CACHE.move_to_end(ordinal)
+        return record
+
+    @classmethod
+    def _month(cls, record):
+        # The month and leap month of the new moons of a day record.
+        solar_month = cls.zodiac(record.last_new_moon)
+        return amod(solar_month + 1, 12), solar_month == cls.zodiac(record.next_new_moon)
+
+    @classmethod
+    def _from_day(cls, ordinal, record, leap_day, month=None):
+        month, leap_month = cls._month(record) if month is None else month
+        year = cls.calendar_year(ordinal + 180 if month <= 2 else ordinal) - cls.LUNAR_ERA
+        return HinduLunarDate(year, month, leap_month, record.lunar_day, leap_day)
+
     @classmethod
     def fromordinal(cls, ordinal):
         """Return the Hindu lunar date, new_moon scheme, 
         equivalent to ordinal date, ordinal."""
-        critical = cls.sunrise(ordinal)
-        day = cls.lunar_day_from_moment(critical)
-        leap_day = (day == cls.lunar_day_from_moment(cls.sunrise(ordinal - 1)))
-        last_new_moon = cls.new_moon_before(critical)
-        next_new_moon = cls.new_moon_before(int(math.floor(last_new_moon)) + 35)
-        solar_month = cls.zodiac(last_new_moon)
-        leap_month = (solar_month == cls.zodiac(next_new_moon))
-        month = amod(solar_month + 1, 12)
-        year = cls.calendar_year(ordinal + 180 if month <= 2 else ordinal) - cls.LUNAR_ERA
-        return HinduLunarDate(year, month, leap_month, day, leap_day)
+        record = cls.day_record(ordinal)
+        leap_day = (record.lunar_day == cls.day_record(ordinal - 1).lunar_day)
+        return cls._from_day(ordinal, record, leap_day)
+
+    @classmethod
+    def date_range(cls, start, end):
+        """Return the Hindu lunar dates of the ordinal dates from start up
+        to, but not including, end.  The new moons are found once for
+        each month, when the lunar day at sunrise falls back."""
+        dates = []
+        previous = cls.day_record(start - 1)
+        new_moons, month = None, None
+        for ordinal in range(start, end):
+            record = cls._DAY_CACHE.get(ordinal)
+            if record is None:
+                record = cls._day(ordinal, new_moons)
+                if new_moons is not None and record.lunar_day < previous.lunar_day:
+                    record = cls._day(ordinal)
+            if (record.last_new_moon, record.next_new_moon) != new_moons:
+                new_moons, month = (record.last_new_moon, record.next_new_moon), cls._month(record)
+            dates.append(cls._from_day(ordinal, record, record.lunar_day == previous.lunar_day, month))
+            previous = record
+        return dates
 
     def toordinal(self):
         """Return the ordinal date of this Hindu lunar date."""
         approx = OldHindu.EPOCH + (self.SIDEREAL_YEAR * (self.year + self.LUNAR_ERA + ((self.month - 1) / 12)))
-        s = int(math.floor(approx - ((1/360) * self.SIDEREAL_YEAR * ((self.hindu_solar_longitude(approx) - ((self.month - 1) * 30) + 180) % 360) - 180)))
+        s = int(math.floor(approx - ((1/360) * self.SIDEREAL_YEAR * ((self.solar_longitude(approx) - ((self.month - 1) * 30) + 180) % 360) - 180)))
         k = self.lunar_day_from_moment(s + Clock.days_from_hours(6))
         if (3 < k < 27):
             temp = k
         else:
-            mid = self.lunar_fromordinal(s - 15)
+            mid = self.fromordinal(s - 15)
             if ((mid.month != self.month) or
                 (mid.leap_month and not self.leap_month)):
                 temp = ((k + 15) % 30) - 15
@@ -341,7 +451,7 @@ class HinduLunarDate(HinduDate):
     def lunar_phase(cls, tee):
         """Return the longitudinal distance between the sun and moon
         at moment, tee."""
-        return (cls.lunar_longitude(tee) - cls.hindu_solar_longitude(tee)) % 360
+        return (cls.lunar_longitude(tee) - cls.solar_longitude(tee)) % 360
 
     @classmethod
     def lunar_day_from_moment(cls, tee):
@@ -369,11 +479,6 @@ class HinduLunarDate(HinduDate):
         b = tau + 2
         return invert_angular(cls.lunar_phase, phase, a, b)
 
-    @classmethod
-    def calendar_year(cls, tee):
-        """Return the solar year at given moment, tee."""
-        return int(round(((tee - OldHindu.EPOCH) / cls.SIDEREAL_YEAR) - (cls.solar_longitude(tee) / 360)))
-
 class HinduLunarFullMoonDate(HinduDate):
     
     def __init__(self, year, month, leap_month, day, leap_day):
@@ -401,47 +506,107 @@ class HinduLunarFullMoonDate(HinduDate):
     @classmethod
     def is_expunged(cls, month, year):
         """Return True if Hindu lunar month 'month' in year, 'year' is expunged."""
-        return month != cls.lunar_fromordinal(HinduLunarFullMoonDate(year, month, False, 15, False).toordinal()).month
+        return month != cls.fromordinal(HinduLunarFullMoonDate(year, month, False, 15, False).toordinal()).month
     
     
-class HinduSolarDate(HinduDate):
-    
+# The moments of the twelve sankrantis (the entries of the sun into the
+# signs) of a Hindu solar year, and the ordinal dates on which its months
+# begin; the last entries are those of the first month of the next year.
+HinduSolarYear = namedtuple('HinduSolarYear', ['year', 'sankrantis', 'starts'])
+
+class HinduSolarYearMixin(object):
+    """The years of a Hindu solar calendar, whose months begin as the sun
+    enters each sign.  The class supplies MEAN_YEAR, _YEAR_CACHE and the
+    classmethods sankranti_longitude, critical and sign."""
+
     SOLAR_ERA = 3179
-    
-    def __init__(self, year, month, leap_month, day, leap_day):
-        HinduDate.__init__(self, year, month, leap_month, day, leap_day)
+    YEAR_CACHE_SIZE = 256
+
+    def to_tuple(self):
+        return (self.year, self.month, self.day)
+
+    @classmethod
+    def _solar_year(cls, year):
+        # The HinduSolarYear of year, year.  The sankrantis are found
+        # together, each from a little before the beginning of its mean
+        # month; each month begins on the first day whose critical moment
+        # is on or after its sankranti, the sign of the sun being tested
+        # only when they are close.
+        months = np.arange(13)
+        approx = OldHindu.EPOCH + float(cls.MEAN_YEAR) * (year + cls.SOLAR_ERA + months / 12)
+        finder = CrossingFinder(cls.sankranti_longitude, 360 / float(cls.MEAN_YEAR), angular=True, window=3, vectorized=True)
+        sankrantis = finder.first_array(30.0 * (months % 12), approx - 15)
+        starts = []
+        for month, sankranti in zip(amod(months + 1, 12), sankrantis):
+            date = int(math.floor(sankranti)) - 2
+            while True:
+                critical = cls.critical(date)
+                if abs(critical - sankranti) < 10 ** -3:
+                    if cls.sign(critical) == month:
+                        break
+                elif critical > sankranti:
+                    break
+                date += 1
+            starts.append(date)
+        return HinduSolarYear(year, tuple(sankrantis.tolist()), tuple(starts))
+
+    @classmethod
+    def solar_year(cls, year):
+        """Return the HinduSolarYear of year, year: its sankrantis and the
+        ordinal dates on which its months begin.  The most recently used
+        YEAR_CACHE_SIZE years are kept."""
+        try:
+            record = cls._YEAR_CACHE[year]
+        except KeyError:
+            record = cls._YEAR_CACHE[year] = cls._solar_year(year)
+            if len(cls._YEAR_CACHE) > cls.YEAR_CACHE_SIZE:
+                cls._YEAR_CACHE.popitem(last=False)
+            return record
+        cls._YEAR_CACHE.move_to_end(year)
+        return record
 
     @classmethod
     def fromordinal(cls, ordinal):
-        """Return the Hindu (Orissa) solar date equivalent to ordinal date, 'ordinal'."""
-        critical = cls.sunrise(ordinal + 1)
-        month    = cls.zodiac(critical)
-        year     = cls.calendar_year(critical) - cls.SOLAR_ERA
-        approx   = ordinal - 3 - (( int(math.floor(cls.solar_longitude(critical))) ) % 30)
-        begin    = next_int(approx, lambda i: (cls.zodiac(cls.sunrise(i + 1)) ==  month))
-        day      = ordinal - begin + 1
-        return HinduSolarDate(year, month, day)
+        """Return the solar date equivalent to ordinal date, 'ordinal'."""
+        year = int(math.floor((ordinal - OldHindu.EPOCH) / float(cls.MEAN_YEAR))) - cls.SOLAR_ERA
+        starts = cls.solar_year(year).starts
+        if ordinal < starts[0]:
+            year -= 1
+            starts = cls.solar_year(year).starts
+        elif ordinal >= starts[-1]:
+            year += 1
+            starts = cls.solar_year(year).starts
+        month = bisect_right(starts, ordinal)
+        return cls(year, month, ordinal - starts[month - 1] + 1)
 
     def toordinal(self):
-        """Return the ordinal date corresponding to Hindu solar date, s_date,
-        (Saka era; Orissa rule.)"""
-        begin = int(math.floor((self.year + self.SOLAR_ERA + ((self.month - 1)/12)) * self.SIDEREAL_YEAR + OldHindu.EPOCH))
-        return self.day - 1 + next_int(begin - 3, lambda d: self.zodiac(self.sunrise(d + 1)) == self.month)
+        """Return the ordinal date corresponding to the solar date."""
+        return self.solar_year(self.year).starts[self.month - 1] + self.day - 1
+
+class HinduSolarDate(HinduSolarYearMixin, HinduDate):
+    
+    MEAN_YEAR = HinduDate.SIDEREAL_YEAR
+    _YEAR_CACHE = OrderedDict()
+    
+    def __init__(self, year, month, day):
+        HinduDate.__init__(self, year, month, False, day, False)
 
     @classmethod
-    def tropical_longitude(cls, ordinal):
-        """Return the Hindu tropical longitude on ordinal date, 'ordinal'.
-        Assumes precession with maximum of 27 degrees
-        and period of 7200 sidereal years (= 1577917828/600 days)."""
-        days = int(math.floor(ordinal - OldHindu.EPOCH))
-        precession = 27 - abs(54 - ((27 + (108 * 600/1577917828 * days)) % 108))
-        return (cls.solar_longitude(ordinal) - precession) % 360
+    def sankranti_longitude(cls, tee):
+        """Return the longitude of the sun determining the months at
+        each of an array of moments, tee."""
+        return cls.solar_longitude(tee)
 
     @classmethod
-    def rising_sign(cls, ordinal):
-        """Return the tabulated speed of rising of current zodiacal sign on date, date."""
-        i = int(math.floor(float(cls.tropical_longitude(ordinal)) / 30))
-        return [1670/1800, 1795/1800, 1935/1800, 1935/1800, 1795/1800, 1670/1800][i % 6]
+    def critical(cls, date):
+        """Return the moment, the next sunrise, whose sign determines the
+        month of date, date."""
+        return cls.sunrise(date + 1)
+
+    @classmethod
+    def sign(cls, tee):
+        """Return the sign of the sun at moment, tee."""
+        return cls.zodiac(tee)
 
     @classmethod
     def sundial_time(cls, tee):
@@ -464,8 +629,11 @@ class HinduSolarDate(HinduDate):
         return a + (2 * (b - a) * (time - t))
 
 def ayanamsha(tee):
-    """Return the difference between tropical and sidereal solar longitude."""
-    return solar_longitude(tee) - sidereal_solar_longitude(tee)
+    """Return the difference between tropical and sidereal solar longitude
+    at moment, tee, or at each of an array of moments."""
+    if isinstance(tee, np.ndarray):
+        return (positions.precession(positions.julian_centuries(tee)) - float(SIDEREAL_START)) % 360
+    return (_precession(tee) - SIDEREAL_START) % 360
 
 class HinduAstro(HinduDate):
     
@@ -489,29 +657,30 @@ def sidereal_zodiac(tee):
     1..12, at moment, tee."""
     return int(math.floor(int(sidereal_solar_longitude(tee)) / 30)) + 1
 
-class HinduAstroSolar(HinduAstro):
+class HinduAstroSolar(HinduSolarYearMixin, HinduAstro):
     
-    def __init__(self, year, month, leap_month, day, leap_day):
-        HinduAstro.__init__(self, year, month, leap_month, day, leap_day)
+    MEAN_YEAR = HinduAstro.MEAN_SIDEREAL_YEAR
+    _YEAR_CACHE = OrderedDict()
 
-    def toordinal(self):
-        """Return the ordinal date corresponding to Astronomical 
-        Hindu solar date (Tamil rule; Saka era)."""
-        approx = OldHindu.EPOCH - 3 + int(math.floor(((self.year + HinduSolarDate.SOLAR_ERA) + ((self.month - 1) / 12)) * self.MEAN_SIDEREAL_YEAR))
-        begin = next_int(approx, lambda i: sidereal_zodiac(self.sunset(i)) == self.month)
-        return begin + self.day - 1
+    def __init__(self, year, month, day):
+        HinduAstro.__init__(self, year, month, False, day, False)
 
     @classmethod
-    def fromordinal(cls, ordinal):
-        """Return the Astronomical Hindu (Tamil) solar date equivalent to
-        ordinal date, 'ordinal'."""
-        critical = cls.sunset(ordinal)
-        month    = sidereal_zodiac(critical)
-        year     = cls.calendar_year(critical) - HinduSolarDate.SOLAR_ERA
-        approx   = ordinal - 3 - ((int(math.floor(sidereal_solar_longitude( critical)))) % 30)
-        begin    = next_int(approx, lambda i: (sidereal_zodiac(cls.sunset(i)) == month))
-        day      = ordinal - begin + 1
-        return HinduAstroSolar(year, month, day)
+    def sankranti_longitude(cls, tee):
+        """Return the longitude of the sun determining the months at
+        each of an array of moments, tee."""
+        return sidereal_solar_longitude(tee)
+
+    @classmethod
+    def critical(cls, date):
+        """Return the moment, sunset, whose sign determines the month of
+        date, date."""
+        return cls.sunset(date)
+
+    @classmethod
+    def sign(cls, tee):
+        """Return the sign of the sun at moment, tee."""
+        return sidereal_zodiac(tee)
 
 class HinduAstroLunar(HinduAstro):
     
@@ -564,15 +733,13 @@ class HinduAstroLunar(HinduAstro):
 def hindu_lunar_station(date):
     """Return the Hindu lunar station (nakshatra) at sunrise on date, date."""
     critical = HinduDate.sunrise(date)
-    return int(math.floor(HinduLunarDate.longitude(critical) / angle(0, 800, 0))) + 1
+    return int(math.floor(HinduLunarDate.lunar_longitude(critical) / angle(0, 800, 0))) + 1
 
 def hindu_solar_longitude_at_or_after(lam, tee):
     """Return the moment of the first time at or after moment, tee
     when Hindu solar longitude will be lam degrees."""
-    tau = tee + (HinduSolarDate.SIDEREAL_YEAR * (1 / 360) * ((lam - HinduDate.solar_longitude(tee)) % 360))
-    a = max(tee, tau - 5)
-    b = tau +5
-    return invert_angular(HinduDate.solar_longitude, lam, a, b)
+    finder = CrossingFinder(HinduDate.solar_longitude, 360 / HinduSolarDate.SIDEREAL_YEAR, angular=True, window=5)
+    return finder.first(lam, tee)
 
 def mesha_samkranti(g_year):
     """Return the ordinal moment of Mesha samkranti (Vernal equinox)
@@ -587,12 +754,12 @@ def hindu_lunar_new_year(g_year):
     Gregorian year, g_year."""
     jan1     = GregorianDate.new_year(g_year)
     mina     = hindu_solar_longitude_at_or_after(330, jan1)
-    new_moon = HinduLunarDate.day_at_or_after(1, mina)
+    new_moon = HinduLunarDate.lunar_day_at_or_after(1, mina)
     h_day    = int(math.floor(new_moon))
     critical = HinduDate.sunrise(h_day)
     return (h_day +
             (0 if ((new_moon < critical) or
-                   (HinduLunarDate.day_from_moment(HinduDate.sunrise(h_day + 1)) == 2))
+                   (HinduLunarDate.lunar_day_from_moment(HinduDate.sunrise(h_day + 1)) == 2))
              else 1))
 
 
@@ -650,7 +817,7 @@ def hindu_tithi_occur(l_month, tithi, tee, l_year):
     to sundial time, tee, in Hindu lunar month, l_month, and
     year, l_year."""
     approx = hindu_date_occur(l_month, int(math.floor(tithi)), l_year)
-    lunar  = HinduLunarDate.day_at_or_after(tithi, approx - 2)
+    lunar  = HinduLunarDate.lunar_day_at_or_after(tithi, approx - 2)
     ttry    = Clock.ordinal_from_moment(lunar)
     tee_h  = HinduLunarDate.UJJAIN.standard_from_sundial(ttry + tee)
     if lunar <= tee_h or HinduLunarDate.lunar_phase(HinduLunarDate.UJJAIN.standard_from_sundial(ttry + 1 + tee)) > 12 * tithi:
@@ -687,7 +854,7 @@ def karana(n):
 
 def yoga(date):
     """Return the Hindu yoga on date, date."""
-    return int(math.floor((((HinduSolarDate.longitude(date) + HinduLunarDate.longitude(date)) / angle(0, 800, 0)) % 27))) + 1
+    return int(math.floor((((HinduSolarDate.solar_longitude(date) + HinduLunarDate.lunar_longitude(date)) / angle(0, 800, 0)) % 27))) + 1
 
 def sacred_wednesdays(g_year):
     """Return the list of Wednesdays in Gregorian year, g_year,
@@ -708,12 +875,39 @@ def sacred_wednesdays_in_range(from_to):
     else:
         return []
 
-SIDEREAL_START = precession(HinduDate.UJJAIN.universal_from_local(mesha_samkranti(JulianDate.ce(285))))
+# The precession at Mesha samkranti in 285 CE, when the sidereal zodiac
+# began, given as a literal rather than found at import.  It is
+# precession(HinduDate.UJJAIN.universal_from_local(mesha_samkranti(JulianDate.ce(285)))).
+SIDEREAL_START = mpf('336.13605090985857')
+
+PRECESSION_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=PRECESSION_CACHE_SIZE)
+def _precession(tee):
+    # The precession at moment, tee, cached, as the sidereal longitudes of
+    # the sun and moon, and the ayanamsha, are asked for at the same moments.
+    return precession(tee)
 
 def sidereal_solar_longitude(tee):
-    """Return sidereal solar longitude at moment, tee."""
-    return (solar_longitude(tee) - precession(tee) + SIDEREAL_START) % 360
+    """Return sidereal solar longitude at moment, tee, or at each of an
+    array of moments."""
+    if isinstance(tee, np.ndarray):
+        return sidereal_longitudes(tee)[0]
+    return (solar_longitude(tee) - _precession(tee) + SIDEREAL_START) % 360
 
 def sidereal_lunar_longitude(tee):
-    """Return sidereal lunar longitude at moment, tee."""
-    return (lunar_longitude(tee) - precession(tee) + SIDEREAL_START) % 360
+    """Return sidereal lunar longitude at moment, tee, or at each of an
+    array of moments."""
+    if isinstance(tee, np.ndarray):
+        return sidereal_longitudes(tee)[1]
+    return (lunar_longitude(tee) - _precession(tee) + SIDEREAL_START) % 360
+
+def sidereal_longitudes(tee):
+    """Return the sidereal solar and lunar longitudes at each of an array of
+    moments, tee, sharing the time scale, nutation and precession."""
+    tee = np.asarray(tee, dtype=float)
+    c = positions.julian_centuries(tee)
+    nut = positions.nutation(c)
+    offset = float(SIDEREAL_START) - positions.precession(c)
+    return ((positions.solar_longitude(c, nut) + offset) % 360,
+            (positions.lunar_longitude(c, nut) + offset) % 360)
@@ -6,8 +6,7 @@ from jetblack.calendars.timemath import Clock
 from jetblack.calendars.location import Location
 from jetblack.calendars.ymd import YearMonthDay
 from jetblack.calendars.utils import next_int
-from jetblack.calendars.solar import estimate_prior_solar_longitude,\
-    solar_longitude, MEAN_TROPICAL_YEAR
+from jetblack.calendars.solar import estimate_prior_solar_longitude, MEAN_TROPICAL_YEAR
 from jetblack.calendars.systems.julian import JulianDate
 from jetblack.calendars.systems.gregorian import GregorianDate
 
@@ -28,8 +27,8 @@ class PersianDate(YearMonthDay):
     def new_year_on_or_before(cls, date):
         """Return the ordinal date of Astronomical Persian New Year on or
         before ordinal date, ordinal."""
-        approx = estimate_prior_solar_longitude(Season.SPRING, cls.midday_in_tehran(date))
-        return next_int(int(math.floor(approx)) - 1, lambda day: (solar_longitude(cls.midday_in_tehran(day)) <= (Season.SPRING + 2)))
+        equinox = estimate_prior_solar_longitude(Season.SPRING, cls.midday_in_tehran(date))
+        return next_int(int(math.floor(equinox)) - 1, lambda day: equinox <= cls.midday_in_tehran(day))
 
     def toordinal(self):
         """Return ordinal date of Astronomical Persian date, p_date."""
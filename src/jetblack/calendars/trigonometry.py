@@ -1,5 +1,8 @@
+from collections import namedtuple
 import math
-from mpmath import mpf, degrees, radians, sin, cos, tan, asin, acos, atan
+import mpmath
+from mpmath import mpf
+import numpy as np
 
 def secs(x):
     """Return the seconds in angle x."""
@@ -15,41 +18,89 @@ def normalized_degrees(theta):
     """Return a normalise angle theta to range [0,360) degrees."""
     return theta % 360
 
-def normalized_degrees_from_radians(theta):
-    """Return normalized degrees from radians, theta.
-    Function 'degrees' comes from mpmath."""
-    return normalized_degrees(degrees(theta))
+# The trigonometric functions in degrees evaluate through a backend: mpmath
+# (the reference, and the default), float (the math module) or numpy
+# (ufuncs over arrays, taking scalars as floats).  The backend is chosen globally by
+# set_trig_backend, or per call by the backend argument.
 
-def sin_degrees(theta):
+TrigBackend = namedtuple('TrigBackend', ['name', 'sin', 'cos', 'tan', 'asin', 'acos', 'atan2', 'degrees', 'radians'])
+
+MPMATH_BACKEND = TrigBackend('mpmath', mpmath.sin, mpmath.cos, mpmath.tan, mpmath.asin, mpmath.acos, mpmath.atan2,
+                             mpmath.degrees, mpmath.radians)
+FLOAT_BACKEND = TrigBackend('float', math.sin, math.cos, math.tan, math.asin, math.acos, math.atan2,
+                            math.degrees, math.radians)
+def _ufunc(f):
+    # The ufunc, f, taking any argument which is not an array (an mpf, say)
+    # as a float.
+    return lambda *args: f(*(arg if isinstance(arg, np.ndarray) else float(arg) for arg in args))
+
+NUMPY_BACKEND = TrigBackend('numpy', *map(_ufunc, (np.sin, np.cos, np.tan, np.arcsin, np.arccos, np.arctan2,
+                                                   np.degrees, np.radians)))
+
+TRIG_BACKENDS = {backend.name: backend for backend in (MPMATH_BACKEND, FLOAT_BACKEND, NUMPY_BACKEND)}
+
+_TRIG_BACKEND = MPMATH_BACKEND
+
+def trig_backend(backend=None):
+    """Return the TrigBackend named, or given, by backend, or the global
+    backend if it is None."""
+    if backend is None:
+        return _TRIG_BACKEND
+    if isinstance(backend, TrigBackend):
+        return backend
+    try:
+        return TRIG_BACKENDS[backend]
+    except KeyError:
+        raise ValueError("Unknown trigonometry backend: {}".format(backend))
+
+def set_trig_backend(backend):
+    """Set the global trigonometry backend, returning the previous one."""
+    global _TRIG_BACKEND
+    previous, _TRIG_BACKEND = _TRIG_BACKEND, trig_backend(backend)
+    return previous
+
+def normalized_degrees_from_radians(theta, backend=None):
+    """Return normalized degrees from radians, theta."""
+    return normalized_degrees(trig_backend(backend).degrees(theta))
+
+def sin_degrees(theta, backend=None):
     """Return sine of theta (given in degrees)."""
-    return sin(radians(theta))
+    backend = trig_backend(backend)
+    return backend.sin(backend.radians(theta))
 
-def cos_degrees(theta):
+def cos_degrees(theta, backend=None):
     """Return cosine of theta (given in degrees)."""
-    return cos(radians(theta))
+    backend = trig_backend(backend)
+    return backend.cos(backend.radians(theta))
 
-def tan_degrees(theta):
+def tan_degrees(theta, backend=None):
     """Return tangent of theta (given in degrees)."""
-    return tan(radians(theta))
+    backend = trig_backend(backend)
+    return backend.tan(backend.radians(theta))
 
-def arctan_degrees(y, x):
+def arctan_degrees(y, x, backend=None):
     """ Arctangent of y/x in degrees."""
+    backend = trig_backend(backend)
+    if backend is not MPMATH_BACKEND:
+        return normalized_degrees_from_radians(backend.atan2(y, x), backend)
     if x == 0 and y != 0:
         return (math.copysign(1, y) * mpf(90)) % 360
     else:
-        alpha = normalized_degrees_from_radians(atan(y / x))
+        alpha = normalized_degrees_from_radians(mpmath.atan(y / x), backend)
         if x >= 0:
             return alpha
         else:
             return (alpha + mpf(180)) % 360
 
-def arcsin_degrees(x):
+def arcsin_degrees(x, backend=None):
     """Return arcsine of x in degrees."""
-    return normalized_degrees_from_radians(asin(x))
+    backend = trig_backend(backend)
+    return normalized_degrees_from_radians(backend.asin(x), backend)
 
-def arccos_degrees(x):
+def arccos_degrees(x, backend=None):
     """Return arccosine of x in degrees."""
-    return normalized_degrees_from_radians(acos(x))
+    backend = trig_backend(backend)
+    return normalized_degrees_from_radians(backend.acos(x), backend)
 
 class DegreeMinutesSeconds(object):
     
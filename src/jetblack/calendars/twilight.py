@@ -0,0 +1,99 @@
+from enum import IntEnum
+import numpy as np
+from jetblack.calendars.timemath import Clock
+from jetblack.calendars.positions import Positions, julian_centuries, solar_declination, equation_of_time
+
+class Twilight(IntEnum):
+    DAY = 0
+    CIVIL = 1
+    NAUTICAL = 2
+    ASTRONOMICAL = 3
+    NIGHT = 4
+
+class DepressionStatus(IntEnum):
+    CONVERGED = 0
+    ALWAYS_UP = 1
+    ALWAYS_DOWN = 2
+    NOT_CONVERGED = 3
+
+# Depression angles of the sun that end civil, nautical and astronomical
+# twilight.
+CIVIL_DEPRESSION = 6
+NAUTICAL_DEPRESSION = 12
+ASTRONOMICAL_DEPRESSION = 18
+
+def twilight_depressions(location):
+    """Return the depression angles of the sun at location separating
+    each Twilight from the next; the first is that of sunrise and sunset."""
+    return np.array([float(location.refraction(0)), CIVIL_DEPRESSION, NAUTICAL_DEPRESSION, ASTRONOMICAL_DEPRESSION])
+
+def _sine_offset(phi, local_time, alpha, zone):
+    # As Location.sine_offset, for arrays.
+    delta = np.radians(solar_declination(julian_centuries(local_time - zone)))
+    phi = np.radians(phi)
+    return np.tan(phi) * np.tan(delta) + np.sin(np.radians(alpha)) / (np.cos(delta) * np.cos(phi))
+
+def depression_moments(location, dates, alphas, tolerance=Clock.days_from_seconds(30), max_iterations=10,
+                       status=False):
+    """Return the standard times in the morning and in the evening of each
+    of the ordinal dates, dates, at location when the depression angle of
+    the sun is each of alphas, as two arrays of shape (len(dates), len(alphas)).
+    NaN marks an angle that is not reached, or not converged upon; if status
+    is true the DepressionStatus of each is also returned, as two further
+    arrays.
+
+    Every date, angle, morning and evening is iterated together as in
+    Location.moment_of_depression, so each iteration evaluates the sun's
+    position once for all of them.  Nothing is raised near the poles:
+    elements are dropped from the iteration as soon as the angle is found
+    not to be reached."""
+    dates = np.asarray(dates, dtype=float)[np.newaxis, :, np.newaxis]
+    alphas = np.asarray(alphas, dtype=float)[np.newaxis, np.newaxis, :]
+    early = np.array([True, False])[:, np.newaxis, np.newaxis]
+    shape = np.broadcast(early, dates, alphas).shape
+    dates, alphas, early = np.broadcast_to(dates, shape), np.broadcast_to(alphas, shape), np.broadcast_to(early, shape)
+    phi = float(location.latitude)
+    zone = float(location.longitude) / 360
+    sign = np.where(early, -1, 1)
+    alt = np.where(alphas >= 0, np.where(early, dates, dates + 1), dates + Clock.days_from_hours(12))
+    tee = dates + np.where(early, Clock.days_from_hours(6), Clock.days_from_hours(18))
+    active = np.ones(shape, dtype=bool)
+    result = np.full(shape, DepressionStatus.NOT_CONVERGED, dtype=int)
+    for _ in range(max_iterations):
+        value = _sine_offset(phi, tee[active], alphas[active], zone)
+        outside = np.abs(value) > 1
+        value[outside] = _sine_offset(phi, alt[active][outside], alphas[active][outside], zone)
+        result[active] = np.select([value > 1, value < -1],
+                                   [DepressionStatus.ALWAYS_UP, DepressionStatus.ALWAYS_DOWN],
+                                   DepressionStatus.CONVERGED)
+        reached = np.abs(value) <= 1
+        temp = (dates[active][reached] + Clock.days_from_hours(12) +
+                sign[active][reached] * ((Clock.days_from_hours(12) + np.degrees(np.arcsin(value[reached])) / 360) % 1 -
+                                         Clock.days_from_hours(6)))
+        estimate = np.full(value.shape, np.nan)
+        estimate[reached] = temp - equation_of_time(julian_centuries(temp - zone))
+        converged = ~(np.abs(estimate - tee[active]) >= tolerance)
+        tee[active] = estimate
+        active[active] = ~converged
+        if not active.any():
+            break
+    result[active] = DepressionStatus.NOT_CONVERGED
+    standard = np.where(result == DepressionStatus.CONVERGED, tee - zone + float(location.zone), np.nan)
+    if status:
+        return standard[0], standard[1], result[0], result[1]
+    return standard[0], standard[1]
+
+def twilight(location, dates, status=False):
+    """Return the standard times on each of the ordinal dates, dates, at
+    location of the morning and of the evening boundaries between each
+    Twilight and the next, as two arrays of shape (len(dates), 4).  The
+    columns are sunrise (or sunset), then civil, nautical and astronomical
+    dawn (or dusk).  Status is as for depression_moments."""
+    return depression_moments(location, dates, twilight_depressions(location), status=status)
+
+def classify_twilight(location, tee):
+    """Return the Twilight at location at each of an array of standard
+    times, tee, as an array of integers."""
+    universal = np.asarray(tee, dtype=float) - float(location.zone)
+    altitude = Positions(universal, location).sun.altitude
+    return np.sum(-altitude[..., np.newaxis] > twilight_depressions(location), axis=-1)
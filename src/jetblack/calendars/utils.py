@@ -106,6 +106,23 @@ def invert_angular(f, y, a, b, prec=10 ** -5):
     return binary_search(a, b,
                          (lambda l, h: ((h - l) <= prec)),
                          (lambda x: mod((f(x) - y), 360) < 180))
+
+def secant_angular(f, y, x0, rate, prec=10 ** -5, max_iterations=20):
+    """Find inverse of angular function 'f' at 'y' near 'x0' by the secant
+    method. The first step assumes 'f' changes at 'rate' degrees per unit
+    of x. Return None if the iterates do not converge to within 'prec',
+    or stall away from the inverse."""
+    f0 = mod(f(x0) - y + 180, 360) - 180
+    x1 = x0 - f0 / rate
+    for _ in range(max_iterations):
+        f1 = mod(f(x1) - y + 180, 360) - 180
+        if f1 == f0:
+            return x1 if f1 == 0 else None
+        x0, x1, f0 = x1, x1 - f1 * (x1 - x0) / (f1 - f0), f1
+        if abs(x1 - x0) <= prec:
+            return x1
+    return None
+
 #def invert_angular(f, y, a, b):
 #      from scipy.optimize import brentq
 #    return(brentq((lambda x: mod(f(x) - y), 360)), a, b, xtol=error)
@@ -197,4 +214,4 @@ def is_in_range(tee, pair):
 
 def list_range(ell, pair):
     """Return those moments in list ell that occur in range 'pair'."""
-    return filter(lambda x: is_in_range(x, pair), ell)
+    return [x for x in ell if is_in_range(x, pair)]
@@ -0,0 +1,78 @@
+import numpy as np
+from jetblack.calendars.trigonometry import angle
+
+class Zmanim(object):
+    """Jewish ritual times (zmanim) at a location for the ordinal dates
+    start to end inclusive.
+
+    Sunrise and sunset are solved once for each day (and the days either side
+    of the range); the temporal hours and every time derived from them are
+    then array arithmetic on those events."""
+
+    VILNA_GAON_DUSK = angle(4, 40, 0)
+    BERTHOLD_COHN_DUSK = angle(7, 5, 0)
+
+    def __init__(self, location, start, end):
+        self.location = location
+        self.start = start
+        self.end = end
+        self.dates = np.arange(start, end + 1)
+        days = range(start - 1, end + 2)
+        self._sunrise = np.array([float(location.sunrise(day)) for day in days])
+        self._sunset = np.array([float(location.sunset(day)) for day in days])
+        self._dusk = {}
+
+    @property
+    def sunrise(self):
+        """Return standard time of sunrise on each date."""
+        return self._sunrise[1:-1]
+
+    @property
+    def sunset(self):
+        """Return standard time of sunset on each date."""
+        return self._sunset[1:-1]
+
+    @property
+    def daytime_temporal_hour(self):
+        """Return the length of the daytime temporal hour on each date."""
+        return (self._sunset[1:-1] - self._sunrise[1:-1]) / 12
+
+    @property
+    def nighttime_temporal_hour(self):
+        """Return the length of the nighttime temporal hour following
+        each date."""
+        return (self._sunrise[2:] - self._sunset[1:-1]) / 12
+
+    def standard_from_sundial(self, hour):
+        """Return standard time of temporal hour, hour, (0 to 24) on each date."""
+        if 6 <= hour <= 18:
+            return self.sunrise + ((hour - 6) * self.daytime_temporal_hour)
+        elif hour < 6:
+            prior_night = (self._sunrise[1:-1] - self._sunset[:-2]) / 12
+            return self._sunset[:-2] + ((hour + 6) * prior_night)
+        else:
+            return self.sunset + ((hour - 18) * self.nighttime_temporal_hour)
+
+    def dusk(self, alpha):
+        """Return standard time in the evening of each date when the
+        depression angle of the sun is alpha.  The solver is started
+        from sunset, rather than from 6pm."""
+        if alpha not in self._dusk:
+            self._dusk[alpha] = np.array([
+                float(self.location.dusk(int(date), alpha, guess=sunset))
+                for date, sunset in zip(self.dates, self.sunset)])
+        return self._dusk[alpha]
+
+    def jewish_dusk(self):
+        """Return standard time of Jewish dusk on each date (as per Vilna Gaon)."""
+        return self.dusk(self.VILNA_GAON_DUSK)
+
+    def jewish_sabbath_ends(self):
+        """Return standard time of end of Jewish sabbath on each date
+        (as per Berthold Cohn)."""
+        return self.dusk(self.BERTHOLD_COHN_DUSK)
+
+    def jewish_morning_end(self):
+        """Return standard time of end of morning according to Jewish
+        ritual on each date."""
+        return self.standard_from_sundial(10)
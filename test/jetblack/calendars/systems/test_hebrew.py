@@ -0,0 +1,60 @@
+import unittest
+import numpy as np
+from jetblack.calendars.arrays import hebrew_new_year, hebrew_year_length, hebrew_month_offsets, hebrew_toordinal, hebrew_fromordinal
+from jetblack.calendars.arrays import hebrew_birthday, hebrew_yahrzeit, hebrew_birthday_in_gregorian, hebrew_yahrzeit_in_gregorian
+from jetblack.calendars.systems.hebrew import HebrewDate, HebrewMonth
+
+
+class TestHebrew(unittest.TestCase):
+
+    def testRoundTrip(self):
+        self.assertEqual(HebrewDate.fromordinal(-214193).to_tuple(), (3174, 5, 10))
+        self.assertEqual(HebrewDate(3174, 5, 10).toordinal(), -214193)
+        for ordinal in range(737000, 737800, 3):
+            self.assertEqual(HebrewDate.fromordinal(ordinal).toordinal(), ordinal)
+
+    def testYearRecord(self):
+        for year in (5779, 5780, 5781, 5782, 5784):
+            record = HebrewDate.year_record(year)
+            self.assertEqual(record.new_year, HebrewDate.EPOCH + HebrewDate.elapsed_days(year) + HebrewDate.year_length_correction(year))
+            self.assertEqual(record.length, HebrewDate.new_year(year + 1) - record.new_year)
+            self.assertEqual(record.leap, HebrewDate.is_leap_year(year))
+            self.assertEqual(record.month_offsets[HebrewMonth.TISHRI - 1], 0)
+            self.assertEqual(record.month_offsets[HebrewMonth.ELUL - 1] + 29, record.length)
+            self.assertLessEqual(len(HebrewDate._YEAR_CACHE), HebrewDate.YEAR_CACHE_SIZE)
+
+    def testArrays(self):
+        years = np.arange(5700, 5800)
+        self.assertEqual(hebrew_new_year(years).tolist(), [HebrewDate.new_year(year) for year in years.tolist()])
+        self.assertEqual(hebrew_year_length(years).tolist(), [HebrewDate.days_in_year(year) for year in years.tolist()])
+        self.assertEqual([tuple(row) for row in hebrew_month_offsets(years).tolist()],
+                         [HebrewDate.year_record(year).month_offsets for year in years.tolist()])
+        months = np.arange(100) % 13 + 1
+        self.assertEqual(hebrew_toordinal(years, months, 15).tolist(),
+                         [HebrewDate(year, month, 15).toordinal() for year, month in zip(years.tolist(), months.tolist())])
+
+    def testFromOrdinalArray(self):
+        ordinals = np.concatenate([np.arange(HebrewDate.EPOCH + 300, HebrewDate.EPOCH + 1200), np.arange(735000, 739000)])
+        years, months, days = hebrew_fromordinal(ordinals)
+        self.assertEqual(list(zip(years.tolist(), months.tolist(), days.tolist())),
+                         [HebrewDate.fromordinal(ordinal).to_tuple() for ordinal in ordinals.tolist()])
+        self.assertEqual(hebrew_toordinal(years, months, days).tolist(), ordinals.tolist())
+
+    def testAnniversaries(self):
+        dates = [(year, month, day) for year in (5759, 5760, 5763, 5764, 5765)
+                 for month in range(1, 14 if HebrewDate.is_leap_year(year) else 13) for day in (1, 29, 30)]
+        years, months, days = (np.array(a) for a in zip(*dates))
+        targets = np.arange(len(dates)) % 12 + 5784
+        self.assertEqual(hebrew_yahrzeit(years, months, days, targets).tolist(),
+                         [HebrewDate(*date).yahrzeit(target) for date, target in zip(dates, targets.tolist())])
+        self.assertEqual(hebrew_birthday(years, months, days, targets).tolist(),
+                         [HebrewDate(*date).birthday(target) for date, target in zip(dates, targets.tolist())])
+        for anniversaries, method in ((hebrew_yahrzeit_in_gregorian, HebrewDate.yahrzeit_in_gregorian),
+                                      (hebrew_birthday_in_gregorian, HebrewDate.birthday_in_gregorian)):
+            ordinals, inside = anniversaries(years, months, days, 2025)
+            self.assertEqual([row[mask].tolist() for row, mask in zip(ordinals, inside)],
+                             [method(HebrewDate(*date), 2025) for date in dates])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import numpy as np
+from mpmath import mpf
+from jetblack.calendars.astrological import precession
+from jetblack.calendars.systems.julian import JulianDate
+from jetblack.calendars.arrays import (
+    old_hindu_solar_fromordinal, old_hindu_solar_toordinal, old_hindu_lunar_fromordinal, old_hindu_lunar_toordinal, old_hindu_jovian_year)
+from jetblack.calendars.systems.hindu import OldHindu, OldHinduSolarDate, OldHinduLunarDate
+from jetblack.calendars.systems.hindu import HinduDate, HinduLunarDate, HinduSolarDate, HinduAstroSolar, mesha_samkranti
+from jetblack.calendars.systems.hindu import SIDEREAL_START, sidereal_solar_longitude, sidereal_lunar_longitude, ayanamsha
+
+class Test(unittest.TestCase):
+
+    def testSineTable(self):
+        self.assertEqual(len(HinduDate.SINE_TABLE), 25)
+        self.assertEqual(HinduDate.sine_table(0), 0)
+        self.assertEqual(HinduDate.sine_table(24), 1)
+        self.assertEqual(HinduDate.sine_table(8), 1719 / 3438)
+        self.assertEqual(HinduDate.sine_table(40), HinduDate.sine_table(8))
+        self.assertEqual(HinduDate.sine_table(56), -HinduDate.sine_table(8))
+        self.assertEqual(HinduDate.sine_table(-1), -HinduDate.sine_table(1))
+
+    def testArcsin(self):
+        for theta in [0, 1.5, 30, 45.25, 89.9]:
+            self.assertAlmostEqual(HinduDate.arcsin(HinduDate.sine(theta)), theta, 10)
+            self.assertAlmostEqual(HinduDate.arcsin(-HinduDate.sine(theta)), -theta, 10)
+        thetas = np.linspace(-90, 90, 37)
+        self.assertTrue(np.allclose(HinduDate.arcsin(HinduDate.sine(thetas)), thetas))
+
+    def testTruePosition(self):
+        tee = np.linspace(730000, 731000, 11)
+        args = (HinduDate.SIDEREAL_YEAR, 14/360, HinduDate.ANOMALISTIC_YEAR, 1/42)
+        expected = [HinduDate.true_position(x, *args) for x in tee]
+        self.assertTrue(np.allclose(HinduDate.true_position(tee, *args), expected, rtol=0, atol=10 ** -9))
+
+    def testLunarDate(self):
+        self.assertEqual(HinduLunarDate.fromordinal(-214193).to_tuple(), (-529, 6, False, 11, False))
+        self.assertEqual(HinduLunarDate(-529, 6, False, 11, False).toordinal(), -214193)
+
+    def testDateRange(self):
+        HinduLunarDate._DAY_CACHE.clear()
+        dates = HinduLunarDate.date_range(736000, 736100)
+        self.assertEqual(len(dates), 100)
+        HinduLunarDate._DAY_CACHE.clear()
+        self.assertEqual([d.to_tuple() for d in dates],
+                         [HinduLunarDate.fromordinal(d).to_tuple() for d in range(736000, 736100)])
+        self.assertLessEqual(len(HinduLunarDate._DAY_CACHE), HinduLunarDate.DAY_CACHE_SIZE)
+        record = HinduLunarDate.day_record(736050)
+        self.assertTrue(record.sunrise < record.sunset and record.last_new_moon < record.sunrise < record.next_new_moon)
+
+    def testSidereal(self):
+        self.assertEqual(precession(HinduDate.UJJAIN.universal_from_local(mesha_samkranti(JulianDate.ce(285)))), SIDEREAL_START)
+        tee = np.linspace(700000, 740000, 9) + 0.25
+        for f in (sidereal_solar_longitude, sidereal_lunar_longitude, ayanamsha):
+            expected = np.array([float(f(mpf(x))) for x in tee])
+            self.assertTrue(np.allclose((f(tee) - expected + 180) % 360 - 180, 0, rtol=0, atol=10 ** -6))
+
+    def testSolarDate(self):
+        self.assertEqual(HinduSolarDate.fromordinal(-214193).to_tuple(), (-664, 5, 19))
+        self.assertEqual(HinduSolarDate(-664, 5, 19).toordinal(), -214193)
+        self.assertEqual(HinduAstroSolar.fromordinal(-214193).to_tuple(), (-664, 5, 13))
+        self.assertEqual(HinduAstroSolar(-664, 5, 13).toordinal(), -214193)
+        for ordinal in range(736000, 736400, 7):
+            self.assertEqual(HinduSolarDate.fromordinal(ordinal).toordinal(), ordinal)
+
+    def testSolarYear(self):
+        for cls in (HinduSolarDate, HinduAstroSolar):
+            solar_year = cls.solar_year(1938)
+            self.assertEqual(len(solar_year.starts), 13)
+            self.assertEqual(solar_year.starts[12], cls.solar_year(1939).starts[0])
+            longitudes = cls.sankranti_longitude(np.array(solar_year.sankrantis))
+            self.assertTrue(np.allclose((longitudes - 30 * (np.arange(13) % 12) + 180) % 360 - 180, 0, atol=10 ** -3))
+            for month, start in enumerate(solar_year.starts[:12], 1):
+                self.assertEqual(cls.fromordinal(start).to_tuple(), (1938, month, 1))
+                self.assertEqual(cls.fromordinal(start - 1).month, (month + 10) % 12 + 1)
+
+    def testOldHindu(self):
+        self.assertEqual(OldHinduSolarDate.fromordinal(-214193).to_tuple(), (2515, 5, 19))
+        self.assertEqual(OldHinduLunarDate.fromordinal(-214193).to_tuple(), (2515, 6, False, 11))
+        ordinals = np.concatenate([np.arange(-1133000, -1132000), np.arange(-214193, -204193, 7), np.arange(735000, 737000, 3)])
+        solar = old_hindu_solar_fromordinal(ordinals)
+        lunar = old_hindu_lunar_fromordinal(ordinals)
+        self.assertEqual(list(zip(*(a.tolist() for a in solar))),
+                         [OldHinduSolarDate.fromordinal(ordinal).to_tuple() for ordinal in ordinals.tolist()])
+        self.assertEqual(list(zip(*(a.tolist() for a in lunar))),
+                         [OldHinduLunarDate.fromordinal(ordinal).to_tuple() for ordinal in ordinals.tolist()])
+        self.assertEqual(old_hindu_jovian_year(ordinals).tolist(), [OldHindu.jovian_year(ordinal) for ordinal in ordinals.tolist()])
+        self.assertEqual(old_hindu_solar_toordinal(*solar).tolist(), ordinals.tolist())
+        self.assertEqual(old_hindu_lunar_toordinal(*lunar).tolist(), ordinals.tolist())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import math
+import numpy as np
+from jetblack.calendars.events import CrossingFinder, illinois_array
+from jetblack.calendars.timemath import Clock
+from jetblack.calendars.location import JERUSALEM
+from jetblack.calendars.seasons import Season
+from jetblack.calendars.solar import solar_longitude, SOLAR_LONGITUDE_CROSSINGS
+from jetblack.calendars.systems.gregorian import GregorianDate
+
+
+class TestCrossingFinder(unittest.TestCase):
+
+    def testScan(self):
+        expected = [k + 1 / 12 for k in range(3)]
+        finder = CrossingFinder(lambda t: math.sin(2 * math.pi * t), 2 * math.pi, step=0.01, prec=10 ** -9)
+        for x, y in zip(finder.crossings(0.5, 0, 3), expected):
+            self.assertAlmostEqual(x, y, 8)
+        self.assertAlmostEqual(finder.last(0.5, 2, 0), expected[1], 8)
+        finder = CrossingFinder(lambda t: np.sin(2 * np.pi * t), 2 * math.pi, step=0.01, prec=10 ** -9, vectorized=True)
+        self.assertTrue(np.allclose(finder.crossings(0.5, 0, 3), expected, atol=10 ** -8))
+        finder.direction = 0
+        self.assertEqual(len(finder.crossings(0.5, 0, 3)), 6)
+        self.assertGreater(finder.evaluations, 0)
+
+    def testAngular(self):
+        start = GregorianDate.new_year(2016)
+        equinoxes = SOLAR_LONGITUDE_CROSSINGS.crossings(Season.SPRING, start, start + 3 * 365)
+        self.assertEqual([GregorianDate.fromordinal(int(math.floor(x))).to_tuple() for x in equinoxes],
+                         [(2016, 3, 20), (2017, 3, 20), (2018, 3, 20)])
+        for x in equinoxes:
+            self.assertLess(abs((solar_longitude(x) + 180) % 360 - 180), 10 ** -4)
+        self.assertEqual(SOLAR_LONGITUDE_CROSSINGS.last(Season.SPRING, equinoxes[1] + 100), equinoxes[1])
+
+    def testNarrowWindow(self):
+        # The mean rate mispredicts the crossings by up to 20 days, far outside the window.
+        f = lambda t: (t + 20 * np.sin(t / 30)) % 360
+        finder = CrossingFinder(f, 1, angular=True, window=0.5, prec=10 ** -9, vectorized=True)
+        a = np.linspace(0, 700, 50)
+        y = np.linspace(0, 350, 50)
+        x = finder.first_array(y, a)
+        self.assertTrue(np.all(x >= a))
+        self.assertTrue(np.allclose(finder.residual(x, y), 0, atol=10 ** -6))
+        self.assertTrue(np.isnan(illinois_array(lambda t: t, [1.0], [2.0], [1.0], [2.0])[0]))
+
+    def testMoonrise(self):
+        date = GregorianDate(2018, 12, 1).toordinal()
+        rise = JERUSALEM.moonrise(date)
+        self.assertLess(abs(JERUSALEM.observed_lunar_altitude(JERUSALEM.universal_from_standard(rise))), 0.1)
+        # The moon rose just before midnight on 29 November, and next just after midnight on 1 December.
+        self.assertRaises(ValueError, JERUSALEM.moonrise, date - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from jetblack.calendars.systems.gregorian import GregorianDate
+from jetblack.calendars.systems.hebrew import HebrewDate, HebrewMonth
+from jetblack.calendars.hebrewholidays import HebrewHolidayYear, Holiday, holidays, holiday_table
+
+
+class TestHebrewHolidays(unittest.TestCase):
+
+    def testAgreesWithHebrewDate(self):
+        table = holiday_table(1990, 2030)
+        for g_year in range(1990, 2031):
+            for name, f in (('yom_kippur', HebrewDate.yom_kippur), ('passover', HebrewDate.passover),
+                            ('purim', HebrewDate.purim), ('ta_anit_esther', HebrewDate.ta_anit_esther),
+                            ('tishah_be_av', HebrewDate.tishah_be_av), ('yom_ha_zikkaron', HebrewDate.yom_ha_zikkaron)):
+                self.assertIn(f(g_year), table[name])
+            for name, f in (('tzom_tevet', HebrewDate.tzom_tevet), ('sh_ela', HebrewDate.sh_ela),
+                            ('birkath_ha_hama', HebrewDate.birkath_ha_hama)):
+                self.assertEqual([date for date in table.get(name, []) if GregorianDate.to_year(date) == g_year], f(g_year))
+
+    def testDiaspora(self):
+        israel = HebrewHolidayYear(5785).holidays()
+        diaspora = HebrewHolidayYear(5785, True).holidays()
+        self.assertEqual(len(diaspora), len(israel) + 4)
+        self.assertIn(Holiday(HebrewDate(5785, HebrewMonth.TISHRI, 22).toordinal(), 'simchat_torah'), israel)
+        self.assertIn(Holiday(HebrewDate(5785, HebrewMonth.TISHRI, 23).toordinal(), 'simchat_torah'), diaspora)
+
+    def testPostponement(self):
+        # Tishri 3, 5785 was a Sabbath.
+        year = HebrewHolidayYear(5785)
+        self.assertIn(Holiday(GregorianDate(2024, 10, 6).toordinal(), 'tzom_gedaliah'), year.holidays())
+        self.assertEqual(year.omer(year.date(HebrewMonth.IYYAR, 18)), (4, 5))
+        self.assertEqual(HebrewDate.omer(year.date(HebrewMonth.IYYAR, 18)), [4, 5])
+
+    def testStream(self):
+        dates = [holiday.date for holiday in holidays(2020, 2029)]
+        self.assertEqual(dates, sorted(dates))
+        self.assertEqual(GregorianDate.to_year(dates[0]), 2020)
+        self.assertEqual(GregorianDate.to_year(dates[-1]), 2029)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+from jetblack.calendars.hindufestivals import festivals, HinduLunarYear, LunarDateRule, TithiRule, DIWALI, SHIVA, RAMA
+from jetblack.calendars.systems.hindu import diwali, hindu_date_occur, hindu_tithi_occur
+from jetblack.calendars.systems.gregorian import GregorianDate
+
+
+class TestHinduFestivals(unittest.TestCase):
+
+    def testFestivals(self):
+        result = festivals([DIWALI, SHIVA, RAMA], 2016, 2017)
+        self.assertEqual(result[2016], {'diwali': [GregorianDate(2016, 10, 31).toordinal()],
+                                        'shiva': [GregorianDate(2016, 3, 7).toordinal()],
+                                        'rama': [GregorianDate(2016, 4, 15).toordinal()]})
+        self.assertEqual(result[2017]['diwali'], list(diwali(2017)))
+        self.assertEqual(festivals([DIWALI, SHIVA, RAMA], 2016, 2017, processes=2, chunk_years=1), result)
+
+    def testExpungedMonth(self):
+        year = HinduLunarYear(2039)
+        self.assertEqual(year.expunged_months, [11])
+        self.assertEqual(year.leap_months, [7, 12])
+        self.assertEqual(year.date_occur(11, 15), hindu_date_occur(11, 15, 2039))
+
+    def testYearEdge(self):
+        # The first day of 2083 was skipped, so falls before the year.
+        year = HinduLunarYear(2083)
+        self.assertRaises(ValueError, year.date_occur, 1, 1)
+        self.assertEqual(year.resolve(LunarDateRule('new year', 1, 1)), hindu_date_occur(1, 1, 2083))
+        self.assertEqual(year.resolve(TithiRule('new year', 1, 1, 0.5)), hindu_tithi_occur(1, 1, 0.5, 2083))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,7 @@ import unittest
 
 from mpmath import mpf
 
-from jetblack.calendars import MonthOfYear
+from jetblack.calendars.months import MonthOfYear
 from jetblack.calendars.timemath import Clock
 from jetblack.calendars.systems.gregorian import GregorianDate
 from jetblack.calendars.systems.hebrew import JAFFA
@@ -11,6 +11,7 @@ from jetblack.calendars.astrological import universal_from_dynamical,\
 from jetblack.calendars.lunar import mean_lunar_longitude, lunar_elongation,\
     lunar_anomaly, moon_node, lunar_longitude, lunar_latitude
 from jetblack.calendars.solar import solar_anomaly
+from jetblack.calendars.location import Location, URBANA
 
 class TestLocation(unittest.TestCase):
 
@@ -63,6 +64,52 @@ class TestLocation(unittest.TestCase):
     def testMoonNode(self):
         self.assertAlmostEqual(moon_node(-0.077221081451), 219.889721, 6)
 
+class TestLocationValue(unittest.TestCase):
+
+    def testImmutable(self):
+        with self.assertRaises(AttributeError):
+            URBANA.latitude = 0
+
+    def testHashable(self):
+        copy = Location(URBANA.latitude, URBANA.longitude, URBANA.elevation, URBANA.zone)
+        self.assertEqual(copy, URBANA)
+        self.assertEqual(hash(copy), hash(URBANA))
+        self.assertEqual({URBANA: 1}[copy], 1)
+
+    def testCache(self):
+        cached = URBANA.with_cache()
+        self.assertEqual(cached, URBANA)
+        date = GregorianDate(2017, MonthOfYear.DECEMBER, 19).toordinal()
+        self.assertEqual(cached.sunrise(date), URBANA.sunrise(date))
+        self.assertEqual(len(cached.cache), 1)
+        self.assertEqual(cached.sunrise(date), URBANA.sunrise(date))
+        self.assertEqual(len(cached.cache), 1)
+
+    def testMomentOfDepression(self):
+        date = GregorianDate(2017, MonthOfYear.DECEMBER, 19).toordinal()
+        alpha = URBANA.refraction(date)
+        iterations = []
+        approx = URBANA.moment_of_depression(date + Clock.days_from_hours(6), alpha, Location.MORNING, hook=iterations.append)
+        precise = URBANA.moment_of_depression(date + Clock.days_from_hours(6), alpha, Location.MORNING,
+                                              tolerance=Clock.days_from_seconds(1), hook=iterations.append)
+        self.assertLessEqual(iterations[0], iterations[1])
+        self.assertLess(abs(approx - precise), Clock.days_from_seconds(30))
+        warm = URBANA.dawn(date, alpha, Clock.days_from_seconds(1), guess=URBANA.standard_from_local(precise))
+        self.assertLess(abs(URBANA.standard_from_local(precise) - warm), Clock.days_from_seconds(1))
+        with self.assertRaises(ValueError):
+            URBANA.moment_of_depression(date + Clock.days_from_hours(6), alpha, Location.MORNING,
+                                        tolerance=Clock.days_from_seconds(1), max_iterations=1)
+
+    def testSunriseIterations(self):
+        date = GregorianDate(2017, MonthOfYear.DECEMBER, 19).toordinal()
+        iterations = []
+        URBANA.sunrise(date, hook=iterations.append)
+        URBANA.sunset(date, hook=iterations.append)
+        self.assertEqual(len(iterations), 2)
+        self.assertTrue(all(iteration > 1 for iteration in iterations))
+        self.assertRaises(ValueError, URBANA.sunrise, date, Clock.days_from_seconds(1), max_iterations=1)
+        self.assertRaises(ValueError, URBANA.dusk, date, URBANA.refraction(date), max_iterations=1)
+
 class TimeAndAstronomySmokeTestCase(unittest.TestCase):
 
     def setUp(self):
@@ -0,0 +1,30 @@
+import unittest
+from jetblack.calendars.timemath import Clock
+from jetblack.calendars.utils import secant_angular
+from jetblack.calendars.lunar import MoonPhase, lunar_phases_between, lunar_phase_at_or_after
+from jetblack.calendars.systems.gregorian import GregorianDate
+
+
+class TestLunarPhases(unittest.TestCase):
+
+    def testPhasesBetween(self):
+        start = GregorianDate(2017, 1, 1).toordinal()
+        end = GregorianDate(2017, 3, 31).toordinal()
+        events = list(lunar_phases_between(start, end))
+        self.assertEqual([phase for _, phase in events[:4]],
+                         [MoonPhase.FIRST_QUARTER, MoonPhase.FULL, MoonPhase.LAST_QUARTER, MoonPhase.NEW])
+        self.assertEqual(len(events), 12)
+        for tee, phase in events:
+            self.assertTrue(start <= tee <= end)
+            expected = lunar_phase_at_or_after(phase, tee - 3)
+            self.assertLess(abs(tee - expected), Clock.days_from_seconds(2))
+
+    def testSecantStalls(self):
+        # A function flat away from the inverse stalls the secant method.
+        f = lambda x: min(x, 10)
+        self.assertIsNone(secant_angular(f, 20, 0, 1))
+        self.assertAlmostEqual(secant_angular(f, 5, 0, 2), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+import numpy as np
+from jetblack.calendars.weekdays import DayOfWeek, weekday_fromordinal
+from jetblack.calendars.systems.hebrew import HebrewDate, HebrewMonth
+from jetblack.calendars.molad import Molad, MoladAnnouncement, molad, molads, announcement, rosh_chodesh_table
+
+
+class TestMolad(unittest.TestCase):
+
+    def testMolad(self):
+        m = molad(HebrewMonth.TISHRI, 5784)
+        self.assertEqual(Molad(*map(int, m)), Molad(738778, 5, 882))
+        self.assertEqual(MoladAnnouncement(*map(int, announcement(m))), MoladAnnouncement(DayOfWeek.FRIDAY, 5, 49, 0))
+        self.assertEqual(Molad(*map(int, molad(HebrewMonth.TISHRI, 1))), Molad(HebrewDate.EPOCH - 1, 23, 204))
+
+    def testMolads(self):
+        years, months, m = molads(5780, 5800)
+        self.assertEqual(len(years), sum(13 if HebrewDate.is_leap_year(year) else 12 for year in range(5780, 5801)))
+        moments = m.day + (m.hour * 1080 + m.parts) / 25920
+        self.assertTrue(np.allclose(moments, [HebrewDate.molad(month, year) for year, month in zip(years.tolist(), months.tolist())],
+                                    rtol=0, atol=10 ** -6))
+        self.assertTrue(np.all(np.diff(m.day * 25920 + m.hour * 1080 + m.parts) == HebrewDate.MONTH_PARTS))
+
+    def testRoshChodesh(self):
+        table = rosh_chodesh_table(5784, 5785)
+        self.assertEqual(len(table), 13 + 12 - 2)
+        for row in table:
+            self.assertEqual(row.days[-1], HebrewDate(row.year, row.month, 1).toordinal())
+            self.assertEqual(len(row.days) == 2, HebrewDate.fromordinal(row.days[0]).day == 30)
+            self.assertEqual(weekday_fromordinal(row.sabbath), DayOfWeek.SATURDAY)
+            self.assertTrue(row.days[0] - 7 <= row.sabbath < row.days[0])
+            self.assertLess(row.blessing_start, row.blessing_end)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+import numpy as np
+from jetblack.calendars.panchang import Panchang
+from jetblack.calendars.location import JERUSALEM
+from jetblack.calendars.systems.hindu import HinduDate, HinduLunarDate, hindu_lunar_station, karana, yoga
+
+
+class TestPanchang(unittest.TestCase):
+
+    def testLimbs(self):
+        panchang = Panchang(736000, 736059)
+        dates = [int(date) for date in panchang.dates]
+        self.assertEqual(panchang.tithi.tolist(),
+                         [HinduLunarDate.lunar_day_from_moment(HinduDate.sunrise(date)) for date in dates])
+        self.assertEqual(panchang.nakshatra.tolist(), [hindu_lunar_station(date) for date in dates])
+        self.assertEqual(panchang.karana.tolist(), [karana(int(n)) for n in panchang.karana_number])
+        self.assertEqual(panchang.yoga.tolist(), [yoga(HinduDate.sunrise(date)) for date in dates])
+        self.assertEqual(panchang.vara.tolist(), [(date - 1) % 7 for date in dates])
+
+    def testEnds(self):
+        panchang = Panchang(736000, 736059)
+        for end in (panchang.tithi_end, panchang.nakshatra_end, panchang.yoga_end, panchang.karana_end):
+            self.assertTrue(np.all(panchang.sunrise < end) and np.all(end < panchang.sunrise + 1.5))
+        phase = HinduLunarDate.lunar_phase(panchang.tithi_end + 10 ** -3)
+        self.assertEqual((np.floor(phase / 12).astype(int) + 1).tolist(), (panchang.tithi % 30 + 1).tolist())
+        self.assertTrue(np.all(panchang.karana_end <= panchang.tithi_end + 10 ** -3))
+
+    def testLocation(self):
+        panchang = Panchang(736000, 736009, JERUSALEM)
+        self.assertTrue(np.all(panchang.sunrise > Panchang(736000, 736009).sunrise))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+import numpy as np
+from jetblack.calendars.solar import solar_longitude
+from jetblack.calendars.lunar import lunar_longitude, lunar_latitude
+from jetblack.calendars.astrological import declination
+from jetblack.calendars.systems.hebrew import JAFFA
+from jetblack.calendars.location import URBANA
+from jetblack.calendars.positions import Positions
+
+
+class TestPositions(unittest.TestCase):
+
+    def setUp(self):
+        self.tee = np.array([-214193, 25469, 400085, 626596, 709580, 727274, 764652]) + 0.3
+        self.positions = Positions(self.tee, JAFFA)
+
+    def testSun(self):
+        for i, tee in enumerate(self.tee):
+            lam = solar_longitude(tee)
+            self.assertAlmostEqual(self.positions.sun.longitude[i], lam, 6)
+            self.assertAlmostEqual(self.positions.sun.declination[i], (declination(tee, 0, lam) + 180) % 360 - 180, 6)
+
+    def testMoon(self):
+        for i, tee in enumerate(self.tee):
+            self.assertAlmostEqual(self.positions.moon.longitude[i], lunar_longitude(tee), 6)
+            self.assertAlmostEqual(self.positions.moon.latitude[i], lunar_latitude(tee), 6)
+            self.assertAlmostEqual(self.positions.moon.altitude[i], JAFFA.lunar_altitude(tee), 5)
+
+    def testSolarNoon(self):
+        # Urbana, 1 June 2024 (UT): the sun is highest, and due south, shortly before 18:00.
+        positions = Positions(739038 + np.arange(0, 24, 0.25) / 24, URBANA)
+        noon = np.argmax(positions.sun.altitude)
+        self.assertAlmostEqual(positions.sun.altitude[noon], 72, 0)
+        self.assertLess(abs(positions.sun.azimuth[noon] - 180), 5)
+        self.assertIsNone(Positions(self.tee).sun.altitude)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+from datetime import datetime
+from jetblack.calendars.timemath import Clock
+from jetblack.calendars.seasons import Season, equinox, equinoxes, year_equinoxes, EQUINOX_CACHE_SIZE, _EQUINOX_CACHE
+from jetblack.calendars.solar import solar_longitude_after
+from jetblack.calendars.systems.gregorian import GregorianDate
+
+
+class TestSeasons(unittest.TestCase):
+
+    def testEquinox(self):
+        self.assertEqual(equinox(2017, Season.SPRING).replace(second=0, microsecond=0), datetime(2017, 3, 20, 10, 28))
+
+    def testEquinoxes(self):
+        years = [1850, 1977, 2017, 2100]
+        table = equinoxes(years)
+        self.assertEqual(table.shape, (4, 4))
+        for year, row in zip(years, table):
+            self.assertEqual(year_equinoxes(year), tuple(row))
+            for season, moment in zip(Season, row):
+                expected = solar_longitude_after(season, GregorianDate.new_year(year))
+                self.assertLess(abs(moment - expected), Clock.days_from_hours(1 / 30))
+
+    def testYearEquinoxesCache(self):
+        for year in range(1000, 3000, 3):
+            self.assertEqual(year_equinoxes(year), tuple(equinoxes([year])[0]))
+            self.assertLessEqual(len(_EQUINOX_CACHE), EQUINOX_CACHE_SIZE)
+
+
+if __name__ == "__main__":
+    unittest.main()
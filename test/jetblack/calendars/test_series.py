@@ -0,0 +1,67 @@
+import unittest
+from mpmath import mpf
+import numpy as np
+from jetblack.calendars.jit import HAS_NUMBA
+from jetblack.calendars.series import ArgumentSeries, PhaseSeries, argument_series_kernel
+from jetblack.calendars.trigonometry import set_trig_backend
+from jetblack.calendars.astrological import nutation
+from jetblack.calendars.lunar import nth_new_moon
+from jetblack.calendars.lunar import LUNAR_LONGITUDE_SERIES, LUNAR_DISTANCE_SERIES
+from jetblack.calendars.solar import SOLAR_LONGITUDE_SERIES
+
+
+class TestSeries(unittest.TestCase):
+
+    def testArgumentSeries(self):
+        series = ArgumentSeries((2, 3), ((1, 0), (0, 2)), (0, 1))
+        self.assertAlmostEqual(series((mpf(90), mpf(15)), 2), 2 + 3 * 2 * 0.5, 12)
+        self.assertTrue(np.allclose(series.evaluate((np.array([90.0, 0.0]), np.array([15.0, 45.0])), 2), [5, 6]))
+
+    def testPhaseSeries(self):
+        series = PhaseSeries((1, 2), (0, 90), (1, 2), cosine=True)
+        self.assertAlmostEqual(series(mpf(45)), 0.5 ** 0.5 - 2, 12)
+        self.assertTrue(np.allclose(series.evaluate(np.array([45.0, 90.0])), [0.5 ** 0.5 - 2, 0]))
+
+    def testFloatAgreesWithMpmath(self):
+        arguments = (mpf(123.4), mpf(56.7), mpf(289.1), mpf(10.2))
+        cap_E = mpf(0.9998)
+        for series in (LUNAR_LONGITUDE_SERIES, LUNAR_DISTANCE_SERIES):
+            value = series(arguments, cap_E)
+            self.assertAlmostEqual(float(series.evaluate(tuple(map(float, arguments)), float(cap_E))),
+                                   float(value), delta=abs(value) * 10 ** -12)
+        c = mpf(0.123)
+        self.assertAlmostEqual(float(SOLAR_LONGITUDE_SERIES.evaluate(float(c))), float(SOLAR_LONGITUDE_SERIES(c)), 6)
+
+    def testScalar(self):
+        arguments = (mpf(123.4), mpf(56.7), mpf(289.1), mpf(10.2))
+        self.assertAlmostEqual(LUNAR_LONGITUDE_SERIES.scalar(arguments, 0.9998),
+                               float(LUNAR_LONGITUDE_SERIES(arguments, mpf(0.9998))), 6)
+        previous = set_trig_backend('float')
+        try:
+            values = nth_new_moon(24724), nutation(mpf(730000))
+        finally:
+            set_trig_backend(previous)
+        self.assertIsInstance(values[1], float)
+        self.assertAlmostEqual(values[0], float(nth_new_moon(24724)), 8)
+        self.assertAlmostEqual(values[1], float(nutation(mpf(730000))), 12)
+
+    def testDispatchOnInput(self):
+        arguments = (mpf(123.4), mpf(56.7), mpf(289.1), mpf(10.2))
+        expected = float(LUNAR_LONGITUDE_SERIES(arguments, mpf(0.9998)))
+        previous = set_trig_backend('numpy')
+        try:
+            self.assertAlmostEqual(LUNAR_LONGITUDE_SERIES(arguments, mpf(0.9998)), expected, 6)
+            self.assertAlmostEqual(float(SOLAR_LONGITUDE_SERIES(mpf(0.123))), float(SOLAR_LONGITUDE_SERIES.evaluate(0.123)), 9)
+            values = LUNAR_LONGITUDE_SERIES(tuple(np.array([float(x)] * 2) for x in arguments), 0.9998)
+        finally:
+            set_trig_backend(previous)
+        self.assertTrue(np.allclose(values, expected))
+
+    @unittest.skipUnless(HAS_NUMBA, "numba is not installed")
+    def testCompiled(self):
+        LUNAR_LONGITUDE_SERIES.scalar((1, 2, 3, 4), 1)
+        self.assertTrue(argument_series_kernel.signatures)
+
+
+if __name__ == '__main__':
+    unittest.main()
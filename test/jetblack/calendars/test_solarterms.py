@@ -0,0 +1,43 @@
+import unittest
+from jetblack.calendars.timemath import Clock
+from jetblack.calendars.solar import solar_longitude_after
+from jetblack.calendars.solarterms import SolarTerms, solar_terms, DECADE_CACHE_SIZE, _DECADE_CACHE
+from jetblack.calendars.systems.gregorian import GregorianDate
+
+
+class TestSolarTerms(unittest.TestCase):
+
+    def setUp(self):
+        self.terms = SolarTerms(2015, 2018)
+
+    def testTable(self):
+        self.assertEqual(len(self.terms), 4 * 24)
+        self.assertTrue((self.terms.moments[1:] > self.terms.moments[:-1]).all())
+        one_second = Clock.days_from_seconds(1)
+        for moment, lam in zip(self.terms.moments[::5], self.terms.longitudes[::5]):
+            self.assertLess(abs(moment - solar_longitude_after(lam, moment - 5)), one_second)
+
+    def testQueries(self):
+        tee = GregorianDate(2017, 3, 1).toordinal()
+        moment, lam = self.terms.term_after(tee)
+        self.assertEqual(lam, 345)
+        self.assertEqual(self.terms.longitude_at(tee), 330)
+        self.assertEqual(self.terms.longitude_after(0, tee), self.terms.term_after(moment)[0])
+        self.assertEqual(self.terms.longitude_before(345, moment + 1), moment)
+        self.assertLess(self.terms.longitude_before(345, moment), tee)
+        self.assertRaises(ValueError, self.terms.term_after, GregorianDate(2019, 6, 1).toordinal())
+        self.assertIs(solar_terms(tee), solar_terms(tee + 100))
+
+    def testDecades(self):
+        joined = SolarTerms.join([SolarTerms(2015, 2016), SolarTerms(2017, 2018)])
+        self.assertEqual(joined.moments.tolist(), self.terms.moments.tolist())
+        self.assertEqual(joined.longitudes.tolist(), self.terms.longitudes.tolist())
+        for year in range(1500, 2500, 7):
+            table = solar_terms(GregorianDate.new_year(year))
+            self.assertTrue(table.start_year + 10 <= year <= table.end_year - 10)
+            self.assertEqual(table.end_year - table.start_year, 29)
+            self.assertLessEqual(len(_DECADE_CACHE), DECADE_CACHE_SIZE)
+
+
+if __name__ == "__main__":
+    unittest.main()
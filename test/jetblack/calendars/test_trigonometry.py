@@ -0,0 +1,51 @@
+import unittest
+from mpmath import mpf
+import numpy as np
+from jetblack.calendars.trigonometry import (
+    sin_degrees, cos_degrees, arctan_degrees, arcsin_degrees, set_trig_backend, trig_backend, FLOAT_BACKEND)
+from jetblack.calendars.lunar import lunar_longitude
+from jetblack.calendars.solar import solar_longitude
+from jetblack.calendars.location import JERUSALEM
+
+
+class TestTrigonometry(unittest.TestCase):
+
+    def testBackends(self):
+        self.assertIsInstance(sin_degrees(mpf(30)), mpf)
+        self.assertIsInstance(sin_degrees(30, backend='float'), float)
+        self.assertAlmostEqual(sin_degrees(30, backend='float'), 0.5, 15)
+        self.assertTrue(np.allclose(cos_degrees(np.array([0, 60, 180]), backend='numpy'), [1, 0.5, -1]))
+        self.assertAlmostEqual(arcsin_degrees(-0.5, backend='float'), 330, 12)
+        self.assertRaises(ValueError, trig_backend, 'unknown')
+
+    def testArctan(self):
+        for y, x in [(1, 1), (1, -1), (-1, -1), (-1, 1), (1, 0), (-1, 0)]:
+            expected = float(arctan_degrees(mpf(y), mpf(x)))
+            self.assertAlmostEqual(arctan_degrees(y, x, backend='float'), expected, 12)
+            self.assertAlmostEqual(float(arctan_degrees(np.array([y]), np.array([x]), backend='numpy')[0]), expected, 12)
+
+    def testGlobalBackend(self):
+        tee = mpf(730000.25)
+        expected = lunar_longitude(tee)
+        previous = set_trig_backend('float')
+        try:
+            self.assertIs(trig_backend(), FLOAT_BACKEND)
+            self.assertAlmostEqual(float(lunar_longitude(tee)), float(expected), 9)
+        finally:
+            set_trig_backend(previous)
+        self.assertEqual(lunar_longitude(tee), expected)
+
+    def testGlobalNumpyBackendWithScalars(self):
+        tee = mpf(738000)
+        expected = solar_longitude(tee), JERUSALEM.sunrise(738000)
+        previous = set_trig_backend('numpy')
+        try:
+            self.assertAlmostEqual(float(sin_degrees(mpf(30))), 0.5, 15)
+            self.assertAlmostEqual(float(solar_longitude(tee)), float(expected[0]), 9)
+            self.assertAlmostEqual(float(JERUSALEM.sunrise(738000)), float(expected[1]), 7)
+        finally:
+            set_trig_backend(previous)
+
+
+if __name__ == '__main__':
+    unittest.main()
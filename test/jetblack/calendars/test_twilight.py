@@ -0,0 +1,46 @@
+import unittest
+import numpy as np
+from mpmath import mpf
+from jetblack.calendars.timemath import Clock
+from jetblack.calendars.location import Location, JERUSALEM, URBANA
+from jetblack.calendars.systems.gregorian import GregorianDate
+from jetblack.calendars.twilight import Twilight, DepressionStatus, twilight, twilight_depressions, classify_twilight
+
+
+class TestTwilight(unittest.TestCase):
+
+    def setUp(self):
+        start = GregorianDate(2018, 1, 1).toordinal()
+        self.dates = np.arange(start, start + 365, 61)
+
+    def testTwilight(self):
+        one_second = Clock.days_from_seconds(1)
+        for location in (JERUSALEM, URBANA):
+            morning, evening = twilight(location, self.dates)
+            for i, date in enumerate(self.dates):
+                for j, alpha in enumerate(twilight_depressions(location)):
+                    self.assertLess(abs(morning[i, j] - location.dawn(int(date), alpha)), one_second)
+                    self.assertLess(abs(evening[i, j] - location.dusk(int(date), alpha)), one_second)
+
+    def testClassify(self):
+        morning, evening = twilight(URBANA, self.dates[:1])
+        a_minute = Clock.days_from_seconds(60)
+        tee = np.concatenate([morning[0] - a_minute, evening[0] + a_minute, [self.dates[0] + 0.5]])
+        self.assertEqual(classify_twilight(URBANA, tee).tolist(),
+                         [Twilight.CIVIL, Twilight.NAUTICAL, Twilight.ASTRONOMICAL, Twilight.NIGHT] * 2 + [Twilight.DAY])
+
+    def testPolar(self):
+        tromso = Location(mpf(69.6492), mpf(18.9553), 10, Clock.days_from_hours(1))
+        dates = [GregorianDate(2018, 12, 21).toordinal(), GregorianDate(2018, 6, 21).toordinal()]
+        morning, evening, morning_status, evening_status = twilight(tromso, dates, status=True)
+        self.assertEqual(morning_status.tolist(), evening_status.tolist())
+        self.assertEqual(morning_status.tolist(),
+                         [[DepressionStatus.ALWAYS_DOWN] + [DepressionStatus.CONVERGED] * 3,
+                          [DepressionStatus.ALWAYS_UP] * 4])
+        self.assertTrue(np.isnan(morning[0, 0]) and np.isnan(evening[1]).all())
+        self.assertLess(abs(morning[0, 1] - tromso.dawn(dates[0], 6)), Clock.days_from_seconds(1))
+        self.assertRaises(ValueError, tromso.sunrise, dates[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
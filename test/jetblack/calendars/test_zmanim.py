@@ -0,0 +1,36 @@
+import unittest
+from jetblack.calendars.timemath import Clock
+from jetblack.calendars.location import JERUSALEM
+from jetblack.calendars.observations import jewish_dusk, jewish_sabbath_ends, jewish_morning_end
+from jetblack.calendars.systems.gregorian import GregorianDate
+from jetblack.calendars.zmanim import Zmanim
+
+
+class TestZmanim(unittest.TestCase):
+
+    def setUp(self):
+        self.start = GregorianDate(2017, 12, 18).toordinal()
+        self.end = self.start + 6
+        self.zmanim = Zmanim(JERUSALEM, self.start, self.end)
+
+    def testSunEvents(self):
+        for i, date in enumerate(range(self.start, self.end + 1)):
+            self.assertAlmostEqual(self.zmanim.sunrise[i], JERUSALEM.sunrise(date), 8)
+            self.assertAlmostEqual(self.zmanim.sunset[i], JERUSALEM.sunset(date), 8)
+
+    def testSundial(self):
+        for i, date in enumerate(range(self.start, self.end + 1)):
+            for hour in (3, 10, 21):
+                expected = JERUSALEM.standard_from_sundial(date + Clock.days_from_hours(hour))
+                self.assertAlmostEqual(self.zmanim.standard_from_sundial(hour)[i], expected, 8)
+            self.assertAlmostEqual(self.zmanim.jewish_morning_end()[i], jewish_morning_end(date, JERUSALEM), 8)
+
+    def testDusk(self):
+        one_minute = Clock.days_from_seconds(60)
+        for i, date in enumerate(range(self.start, self.end + 1)):
+            self.assertLess(abs(self.zmanim.jewish_dusk()[i] - jewish_dusk(date, JERUSALEM)), one_minute)
+            self.assertLess(abs(self.zmanim.jewish_sabbath_ends()[i] - jewish_sabbath_ends(date, JERUSALEM)), one_minute)
+
+
+if __name__ == "__main__":
+    unittest.main()